@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the selection of the best rated sentences by positions with the
+former full sort of the sentences wrapped into SentenceInfo with ratings
+looked up in a dictionary. Run it from the root of the repository:
+
+    python -m benchmarks.best_sentences
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+from operator import attrgetter
+
+import numpy
+
+from sumy.summarizers._summarizer import AbstractSummarizer, SentenceInfo
+from benchmarks.utils import build_random_document, measure, print_table
+
+SUMMARY_SENTENCES_COUNT = 10
+
+
+def get_best_sentences_by_sort(sentences, count, ratings):
+    infos = (SentenceInfo(s, o, ratings[s]) for o, s in enumerate(sentences))
+    infos = sorted(infos, key=attrgetter("rating"), reverse=True)[:count]
+    infos = sorted(infos, key=attrgetter("order"))
+
+    return tuple(i.sentence for i in infos)
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        sentences = build_random_document(sentences_count).sentences
+        ratings = numpy.random.RandomState(0).random_sample(sentences_count)
+        ratings_by_sentences = dict(zip(sentences, ratings))
+
+        sort = measure(lambda: get_best_sentences_by_sort(sentences, SUMMARY_SENTENCES_COUNT, ratings_by_sentences))
+        positions = measure(lambda: AbstractSummarizer._get_best_sentences(sentences, SUMMARY_SENTENCES_COUNT, ratings))
+
+        rows.append((sentences_count, "%.2f ms" % (1000 * sort), "%.2f ms" % (1000 * positions), "%.0f×" % (sort / positions)))
+
+    print_table(("sentences", "dict & sort", "positions", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1000, 10000, 100000])
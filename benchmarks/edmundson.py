@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Compares Edmundson rating by the matrix of sentence features with the former
+rating by every method separately merged in a dictionary. Then compares
+a sweep over many configurations of weights by separate summarizers and
+by the features of the document computed only once.
+Run it from the root of the repository:
+
+    python -m benchmarks.edmundson
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import itertools
+import sys
+
+from collections import defaultdict
+
+from sumy.nlp.stemmers import Stemmer
+from sumy.summarizers.edmundson import EdmundsonSummarizer, EdmundsonWeights
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+
+def rate_sentences_by_methods(summarizer, document):
+    ratings = defaultdict(int)
+    methods = (
+        summarizer._build_cue_method_instance(),
+        summarizer._build_key_method_instance(),
+        summarizer._build_title_method_instance(),
+        summarizer._build_location_method_instance(),
+    )
+    for method in methods:
+        for sentence, rating in method.rate_sentences(document).items():
+            ratings[sentence] += rating
+
+    return ratings
+
+
+def rate_sentences_by_features(summarizer, document):
+    features = summarizer._compute_features(document)
+    return summarizer._rate_sentences(document, features.dot(summarizer._get_features_weights()))
+
+
+SWEEP_SENTENCES_COUNT = 1000
+SWEEP_SUMMARY_LENGTH = 10
+
+
+def set_words(summarizer):
+    summarizer.bonus_words = ["word%d" % i for i in range(100, 400, 3)]
+    summarizer.stigma_words = ["word%d" % i for i in range(101, 400, 3)]
+    summarizer.null_words = STOP_WORDS
+    return summarizer
+
+
+def build_weights_grid():
+    values = (0.0, 0.5, 1.0)
+    grid = itertools.product(values, values, values, values, (1, 2), (0, 1), (0, 1))
+    return [EdmundsonWeights(cue, key, title, location, w_h, w_p1, w_p2) for cue, key, title, location, w_h, w_p1, w_p2 in grid]
+
+
+def sweep_by_summarizers(document, grid):
+    for weights in grid:
+        summarizer = set_words(EdmundsonSummarizer(Stemmer("english"), weights.cue_weight,
+            weights.key_weight, weights.title_weight, weights.location_weight))
+        summarizer(document, SWEEP_SUMMARY_LENGTH)
+
+
+def sweep_by_features(document, grid):
+    summarizer = set_words(EdmundsonSummarizer(Stemmer("english")))
+    summarizer.summarize_with_weights(document, SWEEP_SUMMARY_LENGTH, grid)
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+        summarizer = set_words(EdmundsonSummarizer(Stemmer("english"), key_weight=1.0))
+
+        methods = measure(lambda: rate_sentences_by_methods(summarizer, document), repeat=1)
+        features = measure(lambda: rate_sentences_by_features(summarizer, document), repeat=1)
+
+        rows.append((sentences_count, "%.3f s" % methods, "%.3f s" % features, "%.1f×" % (methods / features)))
+
+    print_table(("sentences", "methods", "features", "speedup"), rows)
+    print()
+
+    document = build_random_document(SWEEP_SENTENCES_COUNT)
+    grid = build_weights_grid()
+    summarizers = measure(lambda: sweep_by_summarizers(document, grid), repeat=1)
+    features = measure(lambda: sweep_by_features(document, grid), repeat=1)
+    print_table(("sentences", "configurations", "summarizers", "features once", "speedup"),
+        [(SWEEP_SENTENCES_COUNT, len(grid), "%.3f s" % summarizers, "%.3f s" % features, "%.0f×" % (summarizers / features))])
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 10000])
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the incremental greedy selection of KL-Sum with the former one
+recomputing the joint frequencies of all the candidates in every iteration.
+Both pick the same number of sentences. Run it from the root of the repository:
+
+    python -m benchmarks.kl
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+from sumy.summarizers.kl import KLSummarizer
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+SUMMARY_SENTENCES_COUNT = 10
+
+
+def compute_ratings_by_recomputation(summarizer, sentences, limit):
+    word_freq = summarizer.compute_tf(sentences)
+    sentences_list = list(sentences)
+    sentences_as_words = [summarizer._get_content_words_in_sentence(s) for s in sentences]
+    summary = []
+
+    while len(summary) < limit:
+        summary_as_word_list = summarizer._get_all_words_in_doc(summary)
+        kls = [summarizer._kl_divergence(summarizer._joint_freq(words, summary_as_word_list), word_freq)
+            for words in sentences_as_words]
+
+        index = summarizer._find_index_of_best_sentence(kls)
+        summary.append(sentences_list.pop(index))
+        del sentences_as_words[index]
+
+    return summary
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+        summarizer = KLSummarizer()
+        summarizer.stop_words = STOP_WORDS
+        sentences = document.sentences
+
+        incremental = measure(lambda: summarizer._compute_ratings(sentences, SUMMARY_SENTENCES_COUNT))
+        recomputed = measure(lambda: compute_ratings_by_recomputation(summarizer, sentences, SUMMARY_SENTENCES_COUNT), repeat=1)
+
+        rows.append((sentences_count, "%.3f s" % recomputed, "%.3f s" % incremental, "%.0f×" % (recomputed / incremental)))
+
+    print_table(("sentences", "recomputed top %d" % SUMMARY_SENTENCES_COUNT, "incremental top %d" % SUMMARY_SENTENCES_COUNT, "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 300, 10000])
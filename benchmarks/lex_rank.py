@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the vectorized similarity matrix of LexRank with the former
+pairwise computation. Run it from the root of the repository:
+
+    python -m benchmarks.lex_rank
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+import numpy
+
+from sumy.summarizers.lex_rank import LexRankSummarizer
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+# the pairwise computation is measured only on a sample of rows for big documents
+PAIRWISE_SAMPLE_ROWS = 50
+
+
+def create_matrix_pairwise(summarizer, sentences, threshold, tf_metrics, idf_metrics, rows_count=None):
+    sentences_count = len(sentences)
+    rows_count = sentences_count if rows_count is None else rows_count
+    matrix = numpy.zeros((rows_count, sentences_count))
+    degrees = numpy.zeros((rows_count,))
+
+    for row in range(rows_count):
+        sentence1, tf1 = sentences[row], tf_metrics[row]
+        for col, (sentence2, tf2) in enumerate(zip(sentences, tf_metrics)):
+            matrix[row, col] = summarizer.cosine_similarity(sentence1, sentence2, tf1, tf2, idf_metrics)
+
+            if matrix[row, col] > threshold:
+                matrix[row, col] = 1.0
+                degrees[row] += 1
+            else:
+                matrix[row, col] = 0
+
+    for row in range(rows_count):
+        for col in range(sentences_count):
+            if degrees[row] == 0:
+                degrees[row] = 1
+
+            matrix[row][col] = matrix[row][col] / degrees[row]
+
+    return matrix
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+        summarizer = LexRankSummarizer()
+        summarizer.stop_words = STOP_WORDS
+
+        sentences = summarizer._preprocess(document, summarizer.stop_words).sentences_terms
+        tf_metrics = summarizer._compute_tf(sentences)
+        idf_metrics = summarizer._compute_idf(sentences)
+        args = (sentences, summarizer.threshold, tf_metrics, idf_metrics)
+
+        vectorized = measure(lambda: summarizer._create_matrix(*args), repeat=1 if sentences_count > 1000 else 3)
+
+        sample_rows = min(sentences_count, PAIRWISE_SAMPLE_ROWS)
+        pairwise = measure(lambda: create_matrix_pairwise(summarizer, *args, rows_count=sample_rows), repeat=1)
+        pairwise *= sentences_count / sample_rows
+        estimated = "" if sample_rows == sentences_count else " (estimated)"
+
+        rows.append((
+            sentences_count,
+            "%.3f s%s" % (pairwise, estimated),
+            "%.3f s" % vectorized,
+            "%.0f×" % (pairwise / vectorized),
+        ))
+
+    print_table(("sentences", "pairwise", "vectorized", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 10000])
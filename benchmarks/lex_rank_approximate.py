@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the approximate LexRank graph built by MinHash with the exact
+sparse graph. Documents keep their frequent words (no stop-words) because
+they make the exact graph expensive. Run it from the root of the repository:
+
+    python -m benchmarks.lex_rank_approximate [sentences ...]
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+from sumy.summarizers.lex_rank import LexRankSummarizer
+from benchmarks.utils import build_random_document, measure, print_table
+
+# pairs of bands and rows of the MinHash signatures
+SETTINGS = ((8, 1), (32, 1), (32, 2))
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+        summarizer = LexRankSummarizer()
+        summarizer.sparse = True
+
+        sentences = summarizer._preprocess(document, summarizer.stop_words).sentences_terms
+        tf_metrics = summarizer._compute_tf(sentences)
+        idf_metrics = summarizer._compute_idf(sentences)
+        args = (sentences, summarizer.threshold, tf_metrics, idf_metrics)
+
+        exact_edges = summarizer._create_matrix(*args).nnz
+        exact = measure(lambda: summarizer._create_matrix(*args), repeat=1)
+        rows.append((sentences_count, "exact", "%.3f s" % exact, "100.0 %", ""))
+
+        summarizer.approximate = True
+        for bands, rows_count in SETTINGS:
+            summarizer.lsh_bands, summarizer.lsh_rows = bands, rows_count
+            approximate = measure(lambda: summarizer._create_matrix(*args), repeat=1)
+            recall = summarizer._create_matrix(*args).nnz / exact_edges
+            rows.append((
+                sentences_count,
+                "%d×%d" % (bands, rows_count),
+                "%.3f s" % approximate,
+                "%.1f %%" % (100 * recall),
+                "%.1f×" % (exact / approximate),
+            ))
+
+    print_table(("sentences", "graph", "time", "recall", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1000, 4000, 8000])
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the full SVD used by LSA with the randomized truncated one
+used when ``LsaSummarizer.REDUCTION_RATIO`` is below 1. Run it from
+the root of the repository:
+
+    python -m benchmarks.lsa [sentences] [ratio ...]
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+import numpy
+
+from sumy.summarizers.lsa import LsaSummarizer
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+
+def main(sentences_count, ratios):
+    document = build_random_document(sentences_count, vocabulary_size=8 * sentences_count)
+    summarizer = LsaSummarizer()
+    summarizer.stop_words = STOP_WORDS
+
+    dictionary = summarizer._create_dictionary(document)
+    matrix = summarizer._create_matrix(document, dictionary)
+    matrix = summarizer._compute_term_frequency(matrix)
+    print("Matrix %d×%d" % matrix.shape)
+
+    full = measure(lambda: numpy.linalg.svd(matrix, full_matrices=False), repeat=1)
+    sigma = numpy.linalg.svd(matrix, compute_uv=False)
+
+    rows = [("full", len(sigma), "%.2f s" % full, "", "")]
+    for ratio in ratios:
+        dimensions = max(LsaSummarizer.MIN_DIMENSIONS, int(len(sigma) * ratio))
+        randomized = measure(lambda: summarizer._randomized_svd(matrix, dimensions), repeat=1)
+        _, truncated_sigma, _ = summarizer._randomized_svd(matrix, dimensions)
+        error = numpy.max(numpy.abs(truncated_sigma - sigma[:dimensions]) / sigma[:dimensions])
+
+        rows.append((ratio, dimensions, "%.2f s" % randomized, "%.0f×" % (full / randomized), "%.2g" % error))
+
+    print_table(("ratio", "dimensions", "time", "speedup", "max. error of σ"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000, [float(a) for a in sys.argv[2:]] or [0.01, 0.05, 0.1])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Compares rating of all the sentences at once by Luhn with the former
+chunking of every sentence checking significant stems in a tuple.
+Run it from the root of the repository:
+
+    python -m benchmarks.luhn
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+from sumy.summarizers.luhn import LuhnSummarizer
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+
+def rate_sentence_by_chunks(summarizer, sentence, significant_stems):
+    chunks = []
+    nonsignificant_chunk = [0] * summarizer.max_gap_size
+
+    in_chunk = False
+    for word in sentence.words:
+        stem = summarizer.stem_word(word)
+        if stem in significant_stems and not in_chunk:
+            in_chunk = True
+            chunks.append([1])
+        elif in_chunk:
+            chunks[-1].append(int(stem in significant_stems))
+
+        if chunks and chunks[-1][-summarizer.max_gap_size:] == nonsignificant_chunk:
+            in_chunk = False
+
+    ratings = []
+    for chunk in chunks:
+        while chunk[-1] == 0:
+            chunk.pop()
+        significant_words = sum(chunk)
+        ratings.append(0 if significant_words == 1 else significant_words**2 / len(chunk))
+
+    return max(ratings) if ratings else 0
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+        summarizer = LuhnSummarizer()
+        summarizer.stop_words = STOP_WORDS
+        sentences = document.sentences
+        significant_stems = summarizer._get_significant_words(document.words)
+        significant_stems_tuple = tuple(significant_stems)
+
+        chunked = measure(lambda: [rate_sentence_by_chunks(summarizer, s, significant_stems_tuple) for s in sentences], repeat=1)
+        scanned = measure(lambda: summarizer._rate_sentences(sentences, significant_stems))
+
+        rows.append((
+            sentences_count,
+            len(significant_stems),
+            "%.3f s" % chunked,
+            "%.3f s" % scanned,
+            "%.0f×" % (chunked / scanned),
+        ))
+
+    print_table(("sentences", "significant words", "chunks", "vectorized", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 10000])
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Compares summarization of one document by several summarizers, each of them
+preprocessing the document itself, with the summarization of the document
+preprocessed only once. Run it from the root of the repository:
+
+    python -m benchmarks.preprocessed
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+from sumy.models import PreprocessedDocument
+from sumy.nlp.stemmers import Stemmer
+from sumy.summarizers.lex_rank import LexRankSummarizer
+from sumy.summarizers.luhn import LuhnSummarizer
+from sumy.summarizers.reduction import ReductionSummarizer
+from sumy.summarizers.sum_basic import SumBasicSummarizer
+from sumy.summarizers.text_rank import TextRankSummarizer
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+SUMMARIZERS = (LexRankSummarizer, LuhnSummarizer, ReductionSummarizer, SumBasicSummarizer, TextRankSummarizer)
+
+
+def build_summarizers(stemmer):
+    summarizers = []
+    for summarizer_class in SUMMARIZERS:
+        summarizer = summarizer_class(stemmer)
+        summarizer.stop_words = STOP_WORDS
+        summarizers.append(summarizer)
+
+    return summarizers
+
+
+def summarize(summarizers, document):
+    for summarizer in summarizers:
+        summarizer(document, 10)
+
+
+def main(sizes):
+    stemmer = Stemmer("english")
+    summarizers = build_summarizers(stemmer)
+
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+
+        separately = measure(lambda: summarize(summarizers, document), repeat=1)
+        once = measure(lambda: summarize(summarizers, PreprocessedDocument(document, stemmer, STOP_WORDS)), repeat=1)
+
+        rows.append((
+            sentences_count,
+            "%.3f s" % separately,
+            "%.3f s" % once,
+            "%.1f×" % (separately / once),
+        ))
+
+    print_table(("sentences", "preprocessed by every summarizer", "preprocessed once", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 10000])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Compares Reduction ratings computed from the product of count matrices
+with the former comparison of all the words of every pair of sentences.
+Run it from the root of the repository:
+
+    python -m benchmarks.reduction
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import math
+import sys
+
+from itertools import combinations
+
+from sumy.summarizers.reduction import ReductionSummarizer
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+# the pairwise computation is measured only on a sample of pairs for big documents
+PAIRWISE_SAMPLE_PAIRS = 20000
+
+
+def rate_sentences_edge(words1, words2):
+    rank = 0
+    for w1 in words1:
+        for w2 in words2:
+            rank += int(w1 == w2)
+
+    if rank == 0:
+        return 0.0
+
+    norm = math.log(len(words1)) + math.log(len(words2))
+    return 0.0 if norm == 0.0 else rank / norm
+
+
+def rate_pairs(sentences_as_words, pairs_count):
+    for _, (words1, words2) in zip(range(pairs_count), combinations(sentences_as_words, 2)):
+        rate_sentences_edge(words1, words2)
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+        summarizer = ReductionSummarizer()
+        summarizer.stop_words = STOP_WORDS
+        sentences_as_words = summarizer._preprocess(document, summarizer.stop_words).sentences_terms
+
+        vectorized = measure(lambda: summarizer.rate_sentences(document), repeat=1)
+
+        all_pairs = sentences_count * (sentences_count - 1) // 2
+        sample_pairs = min(all_pairs, PAIRWISE_SAMPLE_PAIRS)
+        pairwise = measure(lambda: rate_pairs(sentences_as_words, sample_pairs), repeat=1)
+        pairwise *= all_pairs / sample_pairs
+        estimated = "" if sample_pairs == all_pairs else " (estimated)"
+
+        rows.append((
+            sentences_count,
+            "%.3f s%s" % (pairwise, estimated),
+            "%.3f s" % vectorized,
+            "%.0f×" % (pairwise / vectorized),
+        ))
+
+    print_table(("sentences", "pairwise", "vectorized", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 5000])
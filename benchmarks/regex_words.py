@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Compares words of sentences tokenized by the default NLTK word tokenizer
+with the words tokenized by the regex engine and measures throughput of both.
+Sentences with different words are reported. Run it from the root of the repository:
+
+    python -m benchmarks.regex_words [language file [file ...]]
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+from collections import Counter
+
+from sumy.nlp.tokenizers import Tokenizer
+from benchmarks.utils import CORPORA, measure, print_table, read_paragraphs
+
+
+def compare(language, paths, examples_count=5):
+    nltk_tokenizer = Tokenizer(language)
+    regex_tokenizer = Tokenizer(language, word_engine="regex")
+    sentences = [s for p in read_paragraphs(paths) for s in nltk_tokenizer.to_sentences(p) if s]
+
+    nltk_words = [nltk_tokenizer.to_words(s) for s in sentences]
+    regex_words = [regex_tokenizer.to_words(s) for s in sentences]
+
+    differences = [(s, n, r) for s, n, r in zip(sentences, nltk_words, regex_words) if n != r]
+    missing, extra = Counter(), Counter()
+    for _, n, r in differences:
+        missing.update(Counter(n) - Counter(r))
+        extra.update(Counter(r) - Counter(n))
+
+    for sentence, _, _ in differences[:examples_count]:
+        print("%s: %s" % (language, sentence))
+    if differences:
+        print("%s: only by NLTK %s, only by regex %s\n" % (language, missing.most_common(10), extra.most_common(10)))
+
+    nltk_time = measure(lambda: [nltk_tokenizer.to_words(s) for s in sentences])
+    regex_time = measure(lambda: [regex_tokenizer.to_words(s) for s in sentences])
+
+    return (
+        language,
+        len(sentences),
+        sum(len(w) for w in nltk_words),
+        len(differences),
+        sum(missing.values()) + sum(extra.values()),
+        "%.0f" % (len(sentences) / nltk_time),
+        "%.0f" % (len(sentences) / regex_time),
+        "%.1f×" % (nltk_time / regex_time),
+    )
+
+
+def main(corpora):
+    rows = [compare(language, paths) for language, paths in corpora]
+    print_table(("language", "sentences", "words", "different sentences", "different words",
+        "NLTK sentences/s", "regex sentences/s", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([(sys.argv[1], sys.argv[2:])] if len(sys.argv) > 2 else CORPORA)
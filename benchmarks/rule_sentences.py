@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Measures accuracy of the rule based sentence tokenizer against punkt
+and throughput of both. Sentence ends found by punkt are taken as the truth.
+Paragraphs split differently are reported. Run it from the root of the repository:
+
+    python -m benchmarks.rule_sentences [language file [file ...]]
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+from sumy.nlp.tokenizers import Tokenizer
+from benchmarks.utils import CORPORA, measure, print_table, read_paragraphs
+
+
+def find_ends(paragraph, sentences):
+    ends = set()
+    position = 0
+    for sentence in sentences:
+        position = paragraph.index(sentence, position) + len(sentence)
+        ends.add(position)
+
+    return ends
+
+
+def compare(language, paths, examples_count=5):
+    punkt_tokenizer = Tokenizer(language)
+    rules_tokenizer = Tokenizer(language, sentence_engine="rules")
+    paragraphs = read_paragraphs(paths)
+
+    found = expected = correct = different_paragraphs = 0
+    for paragraph in paragraphs:
+        punkt_sentences = punkt_tokenizer.to_sentences(paragraph)
+        rules_sentences = rules_tokenizer.to_sentences(paragraph)
+        punkt_ends = find_ends(paragraph, punkt_sentences)
+        rules_ends = find_ends(paragraph, rules_sentences)
+
+        found += len(rules_ends)
+        expected += len(punkt_ends)
+        correct += len(rules_ends & punkt_ends)
+        if rules_ends != punkt_ends:
+            different_paragraphs += 1
+            if different_paragraphs <= examples_count:
+                print("%s punkt: %s\n%s rules: %s\n" % (language, punkt_sentences, language, rules_sentences))
+
+    punkt_time = measure(lambda: [punkt_tokenizer.to_sentences(p) for p in paragraphs])
+    rules_time = measure(lambda: [rules_tokenizer.to_sentences(p) for p in paragraphs])
+
+    precision = correct / found if found else 1.0
+    recall = correct / expected if expected else 1.0
+    return (
+        language,
+        len(paragraphs),
+        expected,
+        different_paragraphs,
+        "%.1f %%" % (100 * precision),
+        "%.1f %%" % (100 * recall),
+        "%.0f" % (len(paragraphs) / punkt_time),
+        "%.0f" % (len(paragraphs) / rules_time),
+        "%.1f×" % (punkt_time / rules_time),
+    )
+
+
+def main(corpora):
+    rows = [compare(language, paths) for language, paths in corpora]
+    print_table(("language", "paragraphs", "sentences", "different paragraphs", "precision", "recall",
+        "punkt paragraphs/s", "rules paragraphs/s", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([(sys.argv[1], sys.argv[2:])] if len(sys.argv) > 2 else CORPORA)
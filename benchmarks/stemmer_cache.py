@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Compares throughput of the stemmers with and without the process-wide LRU
+cache of stems for every language. Words follow Zipf's law over the
+stop-words of the language, so the most of the calls repeat like in
+a natural text. The words are normalized already so only the stemming
+is measured. Run it from the root of the repository:
+
+    python -m benchmarks.stemmer_cache [tokens count]
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import itertools
+import random
+import sys
+
+from sumy.nlp.stemmers import Stemmer
+from sumy.utils import get_stop_words
+from benchmarks.utils import measure, print_table
+
+LANGUAGES = ("arabic", "czech", "english", "french", "german", "greek", "italian",
+    "portuguese", "slovak", "spanish", "swedish", "ukrainian")
+
+
+def build_tokens(language, tokens_count, seed=42):
+    vocabulary = sorted(get_stop_words(language))
+    generator = random.Random(seed)
+    generator.shuffle(vocabulary)
+
+    cumulative_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    return generator.choices(vocabulary, cum_weights=cumulative_weights, k=tokens_count)
+
+
+def stem_words(stemmer, tokens):
+    for token in tokens:
+        stemmer(token)
+
+
+def main(tokens_count):
+    rows = []
+    for language in LANGUAGES:
+        tokens = build_tokens(language, tokens_count)
+
+        uncached = measure(lambda: stem_words(Stemmer(language), tokens), repeat=1)
+
+        cache = Stemmer.get_cache(language)
+        cache.clear()
+        cached = measure(lambda: stem_words(Stemmer(language, cache=True), tokens), repeat=1)
+
+        info = cache.info()
+        rows.append((
+            language,
+            "%.0f" % (tokens_count / uncached),
+            "%.0f" % (tokens_count / cached),
+            "%.1f×" % (uncached / cached),
+            "%.1f %%" % (100 * info.hits / (info.hits + info.misses)),
+        ))
+
+    print_table(("language", "tokens/s", "cached tokens/s", "speedup", "stems hit ratio"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
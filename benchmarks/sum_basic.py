@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Compares SumBasic rescoring only the sentences affected by the picked one
+with the former rescoring of all the remaining sentences after every pick.
+Run it from the root of the repository:
+
+    python -m benchmarks.sum_basic
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+from sumy.summarizers.sum_basic import SumBasicSummarizer
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+# rescoring of all the sentences is quadratic so it is measured only for the small documents
+MAX_RESCORED_SENTENCES_COUNT = 2000
+
+
+def compute_ratings_by_rescoring_all(summarizer, sentences):
+    word_freq = summarizer._compute_tf(sentences)
+    sentences_as_words = [summarizer._get_content_words_in_sentence(s) for s in sentences]
+    remaining = list(range(len(sentences)))
+    ratings = {}
+
+    while remaining:
+        scores = [summarizer._compute_average_probability_of_words(word_freq, sentences_as_words[i]) for i in remaining]
+        index = remaining.pop(scores.index(max(scores)))
+        ratings[sentences[index]] = -len(ratings)
+        summarizer._update_tf(word_freq, sentences_as_words[index])
+
+    return ratings
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+        summarizer = SumBasicSummarizer()
+        summarizer.stop_words = STOP_WORDS
+        sentences = document.sentences
+
+        indexed = measure(lambda: summarizer._compute_ratings(sentences), repeat=1)
+        if sentences_count <= MAX_RESCORED_SENTENCES_COUNT:
+            rescored = measure(lambda: compute_ratings_by_rescoring_all(summarizer, sentences), repeat=1)
+            rescored, speedup = "%.3f s" % rescored, "%.0f×" % (rescored / indexed)
+        else:
+            rescored = speedup = "-"
+
+        rows.append((sentences_count, rescored, "%.3f s" % indexed, speedup))
+
+    print_table(("sentences", "all rescored", "inverted index", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 2000, 20000])
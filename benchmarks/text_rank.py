@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the vectorized graph of TextRank with the former pairwise
+computation of the edges. Run it from the root of the repository:
+
+    python -m benchmarks.text_rank
+"""
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import math
+import sys
+
+import numpy
+
+from sumy.summarizers.text_rank import TextRankSummarizer
+from benchmarks.utils import STOP_WORDS, build_random_document, measure, print_table
+
+# the pairwise computation is measured only on a sample of rows for big documents
+PAIRWISE_SAMPLE_ROWS = 20
+
+
+def rate_sentences_edge(words1, words2):
+    rank = sum(words2.count(w) for w in words1)
+    if rank == 0:
+        return 0.0
+
+    norm = math.log(len(words1)) + math.log(len(words2))
+    if numpy.isclose(norm, 0.):
+        return float(rank)
+    else:
+        return rank / norm
+
+
+def create_weights_pairwise(sentences_as_words, rows_count):
+    sentences_count = len(sentences_as_words)
+    weights = numpy.zeros((rows_count, sentences_count))
+
+    for i in range(rows_count):
+        for j in range(i, sentences_count):
+            weights[i, j] = rate_sentences_edge(sentences_as_words[i], sentences_as_words[j])
+
+    return weights
+
+
+def main(sizes):
+    rows = []
+    for sentences_count in sizes:
+        document = build_random_document(sentences_count)
+        summarizer = TextRankSummarizer()
+        summarizer.stop_words = STOP_WORDS
+        sentences_as_words = summarizer._preprocess(document, summarizer.stop_words).sentences_terms
+
+        vectorized = measure(lambda: summarizer._create_matrix(document), repeat=1)
+
+        # rows at the beginning are the most expensive ones, the estimate is an upper bound
+        sample_rows = min(sentences_count, PAIRWISE_SAMPLE_ROWS)
+        pairwise = measure(lambda: create_weights_pairwise(sentences_as_words, sample_rows), repeat=1)
+        pairwise *= sentences_count / sample_rows / 2
+        estimated = "" if sample_rows == sentences_count else " (estimated)"
+
+        rows.append((
+            sentences_count,
+            "%.3f s%s" % (pairwise, estimated),
+            "%.3f s" % vectorized,
+            "%.0f×" % (pairwise / vectorized),
+        ))
+
+    print_table(("sentences", "pairwise", "vectorized", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 5000])
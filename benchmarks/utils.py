@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import glob
+import io
+import itertools
+import random
+import timeit
+
+from sumy.models.dom import ObjectDocumentModel, Paragraph, Sentence
+
+
+# the most frequent words of random documents act as stop-words
+STOP_WORDS = tuple("word%d" % i for i in range(100))
+
+# texts of the repository used to compare the tokenizers
+CORPORA = (
+    ("english", ["README.md"] + sorted(glob.glob("docs/*.md")) + ["tests/data/articles/svd_converges.txt"]),
+    ("czech", ["tests/data/articles/prevko_cz_1.txt", "tests/data/snippets/prevko.txt"]),
+)
+
+
+class WhitespaceTokenizer(object):
+    """Cheap tokenizer so the benchmarks measure summarizers, not NLTK."""
+    language = "english"
+
+    @staticmethod
+    def to_words(sentence):
+        return tuple(sentence.split())
+
+
+def build_random_document(sentences_count, vocabulary_size=None, seed=42):
+    """
+    Builds document with sentences of random words. Frequencies of the words
+    follow Zipf's law so it resembles a natural language a bit.
+    """
+    generator = random.Random(seed)
+    if vocabulary_size is None:
+        vocabulary_size = max(1000, 2 * sentences_count)
+
+    vocabulary = ["word%d" % i for i in range(vocabulary_size)]
+    # cumulative weights are computed once, not on every call of `choices`
+    cumulative_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(vocabulary_size)))
+
+    tokenizer = WhitespaceTokenizer()
+    paragraphs = []
+    sentences = []
+    for _ in range(sentences_count):
+        words = generator.choices(vocabulary, cum_weights=cumulative_weights, k=generator.randint(5, 30))
+        sentences.append(Sentence(" ".join(words), tokenizer))
+        if len(sentences) == 10:
+            paragraphs.append(Paragraph(sentences))
+            sentences = []
+
+    if sentences:
+        paragraphs.append(Paragraph(sentences))
+
+    document = ObjectDocumentModel(paragraphs)
+    # warm up cached words so only summarization is measured
+    for sentence in document.sentences:
+        sentence.words
+
+    return document
+
+
+def read_paragraphs(paths):
+    """Reads paragraphs separated by an empty line from the files."""
+    paragraphs = []
+    for path in paths:
+        with io.open(path, encoding="utf-8") as file:
+            paragraphs.extend(p for p in file.read().split("\n\n") if p.strip())
+
+    return paragraphs
+
+
+def measure(function, repeat=3):
+    """Returns the best time of ``repeat`` runs of the function in seconds."""
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def print_table(header, rows):
+    widths = [max(len(str(c)) for c in column) for column in zip(header, *rows)]
+    line = "  ".join("%%%ds" % w for w in widths)
+
+    print(line % tuple(header))
+    for row in rows:
+        print(line % tuple(row))
@@ -16,6 +16,7 @@ dependencies = [
     "breadability>=0.1.20",
     "requests>=2.7.0",
     "pycountry>=18.2.23",
+    "numpy",
     "nltk>=3.0.2,<3.2.0" if VERSION_SUFFIX == "3.3" else "nltk>=3.0.2",  # NLTK 3.2 dropped support for Python 3.3
 ]
 if VERSION_SUFFIX == "3.4":  # lxml 4.4.0 dropped support for Python 3.4
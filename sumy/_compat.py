@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
+from abc import ABCMeta
 from sys import version_info
 
 
@@ -28,6 +29,9 @@ try:
 except ImportError:
     from collections import Sequence
 
+# base of abstract classes with the same syntax in Python 2 and 3
+AbstractBase = ABCMeta(str("AbstractBase"), (object,), {})
+
 
 def unicode_compatible(cls):
     """
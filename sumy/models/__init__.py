@@ -5,3 +5,5 @@ from __future__ import division, print_function, unicode_literals
 
 
 from .tf import TfDocumentModel
+from .vocabulary import TermsSequences, Vocabulary
+from .preprocessed import PreprocessedDocument
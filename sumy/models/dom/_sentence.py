@@ -20,6 +20,29 @@ class Sentence(object):
     def words(self):
         return self._tokenizer.to_words(self._text)
 
+    @words.setter
+    def words(self, words):
+        """Sets words tokenized in advance so the tokenizer of the sentence is not called."""
+        self._cached_property_words = words
+
+    @staticmethod
+    def tokenize_words(sentences):
+        """
+        Tokenizes words of all the sentences by one batch call of their
+        tokenizer and caches them. Sentences with tokenizers without
+        method ``to_words_batch`` are tokenized lazily as before.
+        """
+        sentences_by_tokenizer = {}
+        for sentence in sentences:
+            if not hasattr(sentence, "_cached_property_words") and hasattr(sentence._tokenizer, "to_words_batch"):
+                sentences_by_tokenizer.setdefault(id(sentence._tokenizer), []).append(sentence)
+
+        for tokenizer_sentences in sentences_by_tokenizer.values():
+            tokenizer = tokenizer_sentences[0]._tokenizer
+            words = tokenizer.to_words_batch([s._text for s in tokenizer_sentences])
+            for sentence, sentence_words in zip(tokenizer_sentences, words):
+                sentence.words = sentence_words
+
     @property
     def is_heading(self):
         return self._is_heading
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+from array import array
+from collections import Counter
+
+from .._compat import to_unicode, unicode_compatible
+from ..nlp.stemmers import null_stemmer
+from ..utils import cached_property
+from .vocabulary import TermsSequences, Vocabulary
+
+
+@unicode_compatible
+class PreprocessedDocument(object):
+    """
+    Document with the words of all its sentences normalized, filtered from
+    stop-words and stemmed only once, so it can be summarized by many summarizers
+    without repeating the work. Every distinct stem (term) is mapped to an integer
+    id by the vocabulary and the sentences are kept as compact sequences of the ids.
+
+    Summarizers given the preprocessed document use its stemmer and stop-words
+    instead of their own. It has the same sentences, headings, paragraphs and
+    words as the original document, so every summarizer accepts it.
+
+    :param ObjectDocumentModel document:
+        Preprocessed document.
+    :param stemmer:
+        Callable stemming the normalized words.
+    :param stop_words:
+        Words left out of the content terms of the sentences.
+    :param Vocabulary vocabulary:
+        Vocabulary shared with other documents, new terms of the document
+        are added into it. New vocabulary is created by default.
+    """
+    def __init__(self, document, stemmer=null_stemmer, stop_words=(), vocabulary=None):
+        if not callable(stemmer):
+            raise ValueError("Stemmer has to be a callable object")
+
+        self._document = document
+        self._stemmer = stemmer
+        self._stop_words = frozenset(map(self.normalize_word, stop_words))
+        self._vocabulary = Vocabulary() if vocabulary is None else vocabulary
+        # every distinct word is normalized and stemmed only once
+        self._words = {}
+
+        self._sentences_all_terms, self._sentences_terms = self._preprocess(document.sentences)
+        self._headings_all_terms, self._headings_terms = self._preprocess(document.headings)
+        self._document_terms = array(str("i"))
+        self._to_terms(document.words, array(str("i")), self._document_terms)
+
+    @staticmethod
+    def normalize_word(word):
+        return to_unicode(word).lower()
+
+    @property
+    def document(self):
+        return self._document
+
+    @property
+    def paragraphs(self):
+        return self._document.paragraphs
+
+    @property
+    def sentences(self):
+        return self._document.sentences
+
+    @property
+    def headings(self):
+        return self._document.headings
+
+    @property
+    def words(self):
+        return self._document.words
+
+    @property
+    def stemmer(self):
+        return self._stemmer
+
+    @property
+    def stop_words(self):
+        return self._stop_words
+
+    @property
+    def vocabulary(self):
+        """:class:`Vocabulary` of the terms (normalized stems)."""
+        return self._vocabulary
+
+    @property
+    def terms(self):
+        """Terms by their ids."""
+        return self._vocabulary.terms
+
+    @property
+    def sentences_terms(self):
+        """Ids of the terms of content words (not stop-words) of every sentence."""
+        return self._sentences_terms
+
+    @property
+    def sentences_all_terms(self):
+        """Ids of the terms of all the words of every sentence, stop-words included."""
+        return self._sentences_all_terms
+
+    @property
+    def headings_terms(self):
+        return self._headings_terms
+
+    @property
+    def headings_all_terms(self):
+        return self._headings_all_terms
+
+    @property
+    def document_terms(self):
+        """Ids of the terms of content words of the whole document (headings included) in their order."""
+        return self._document_terms
+
+    @cached_property
+    def sentences_counts(self):
+        """Count vectors of the sentences, mapping key = term id, value = number of occurrences."""
+        return tuple(Counter(terms) for terms in self._sentences_terms)
+
+    def _preprocess(self, sentences):
+        """Returns :class:`TermsSequences` of all the words and of the content words of the sentences."""
+        all_terms, all_offsets = array(str("i")), array(str("l"), [0])
+        content_terms, content_offsets = array(str("i")), array(str("l"), [0])
+        for sentence in sentences:
+            self._to_terms(sentence.words, all_terms, content_terms)
+            all_offsets.append(len(all_terms))
+            content_offsets.append(len(content_terms))
+
+        return TermsSequences(all_terms, all_offsets), TermsSequences(content_terms, content_offsets)
+
+    def _to_terms(self, words, terms, content_terms):
+        """Appends ids of the terms of all the words and of the content words only."""
+        for word in words:
+            term = self._words.get(word)
+            if term is None:
+                term = self._words[word] = self._add_word(word)
+
+            term_id, is_stop_word = term
+            terms.append(term_id)
+            if not is_stop_word:
+                content_terms.append(term_id)
+
+    def _add_word(self, word):
+        word = self.normalize_word(word)
+        return self._vocabulary.add(self._stemmer(word)), word in self._stop_words
+
+    def __unicode__(self):
+        return "<Preprocessed DOM with %d sentences & %d terms>" % (len(self.sentences), len(self._vocabulary))
+
+    def __repr__(self):
+        return self.__str__()
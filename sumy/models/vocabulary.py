@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+from array import array
+
+from .._compat import Sequence, unicode_compatible
+
+
+@unicode_compatible
+class Vocabulary(object):
+    """
+    Interns terms (normalized stems) to dense integer ids 0, 1, 2, ... in order
+    of their first occurrence. One vocabulary can be shared by more documents
+    and summarizers so the same term has the same id everywhere.
+    """
+    def __init__(self, terms=()):
+        self._ids = {}
+        self._terms = []
+        for term in terms:
+            self.add(term)
+
+    def add(self, term):
+        """Returns id of the term, the new term is given the next free id."""
+        term_id = self._ids.get(term)
+        if term_id is None:
+            term_id = self._ids[term] = len(self._terms)
+            self._terms.append(term)
+
+        return term_id
+
+    def get(self, term, default=None):
+        return self._ids.get(term, default)
+
+    def term(self, term_id):
+        return self._terms[term_id]
+
+    @property
+    def terms(self):
+        """Terms by their ids."""
+        return tuple(self._terms)
+
+    def to_ids(self, terms):
+        """Returns ids of the terms as compact array, new terms are added."""
+        return array(str("i"), (self.add(t) for t in terms))
+
+    def __getitem__(self, term):
+        return self._ids[term]
+
+    def __contains__(self, term):
+        return term in self._ids
+
+    def __iter__(self):
+        return iter(self._terms)
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __unicode__(self):
+        return "<Vocabulary with %d terms>" % len(self._terms)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class TermsSequences(Sequence):
+    """
+    Immutable sequence of sequences of term ids (the sentences of a document).
+    All the ids are stored in one flat ``array('i')`` buffer, 4 bytes per id,
+    with offsets of the sequences in the buffer. Items are ``array('i')`` too.
+    Both buffers can be viewed as NumPy arrays by ``numpy.asarray`` without copying.
+    """
+    __slots__ = ("_ids", "_offsets",)
+
+    def __init__(self, ids, offsets):
+        self._ids = ids
+        self._offsets = offsets
+
+    @classmethod
+    def from_sequences(cls, sequences):
+        ids = array(str("i"))
+        offsets = array(str("l"), [0])
+        for sequence in sequences:
+            ids.extend(sequence)
+            offsets.append(len(ids))
+
+        return cls(ids, offsets)
+
+    @property
+    def ids(self):
+        """Flat buffer of the ids of all the sequences."""
+        return self._ids
+
+    @property
+    def offsets(self):
+        """Start of every sequence in the flat buffer and the end of the last one."""
+        return self._offsets
+
+    def lengths(self):
+        offsets = self._offsets
+        return [offsets[i + 1] - offsets[i] for i in range(len(self))]
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Sequence index out of range")
+
+        return self._ids[self._offsets[index]:self._offsets[index + 1]]
+
+    def __iter__(self):
+        ids, offsets = self._ids, self._offsets
+        for i in range(len(self)):
+            yield ids[offsets[i]:offsets[i + 1]]
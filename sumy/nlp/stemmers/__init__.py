@@ -3,6 +3,8 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
+import threading
+
 import nltk.stem.snowball as nltk_stemmers_module
 
 from .czech import stem_word as czech_stemmer
@@ -10,7 +12,7 @@ from .ukrainian import stem_word as ukrainian_stemmer
 from .greek import stem_word as greek_stemmer
 
 from ..._compat import to_unicode
-from ...utils import normalize_language
+from ...utils import LruCache, normalize_language
 
 
 def null_stemmer(object):
@@ -30,18 +32,50 @@ class Stemmer(object):
         'greek': greek_stemmer,
     }
 
-    def __init__(self, language):
-        language = normalize_language(language)
-        self._stemmer = null_stemmer
-        if language.lower() in self.SPECIAL_STEMMERS:
-            self._stemmer = self.SPECIAL_STEMMERS[language.lower()]
-            return
+    # max. number of stems kept in the process-wide cache of every language
+    CACHE_SIZE = 100000
+    _caches = {}
+    _caches_lock = threading.Lock()
+
+    def __init__(self, language, cache=False):
+        """
+        :param bool cache:
+            Stems are memoized in the LRU cache of the language shared
+            by the whole process, see :meth:`get_cache`.
+        """
+        if cache:
+            self._stemmer = self.get_cache(language)
+        else:
+            self._stemmer = self._create_stemmer(normalize_language(language))
+
+    @classmethod
+    def _create_stemmer(cls, language):
+        if language.lower() in cls.SPECIAL_STEMMERS:
+            return cls.SPECIAL_STEMMERS[language.lower()]
         stemmer_classname = language.capitalize() + 'Stemmer'
         try:
             stemmer_class = getattr(nltk_stemmers_module, stemmer_classname)
         except AttributeError:
             raise LookupError("Stemmer is not available for language %s." % language)
-        self._stemmer = stemmer_class().stem
+        return stemmer_class().stem
+
+    @classmethod
+    def get_cache(cls, language):
+        """
+        Returns the LRU cache of stems of the language shared by all the stemmers
+        created with ``cache=True`` in the process. The cache keeps ``CACHE_SIZE``
+        stems unless its ``max_size`` is changed and ``info()`` returns its hits,
+        misses and evictions.
+
+        :rtype: sumy.utils.LruCache
+        """
+        language = normalize_language(language)
+        with cls._caches_lock:
+            cache = cls._caches.get(language)
+            if cache is None:
+                cache = cls._caches[language] = LruCache(cls._create_stemmer(language), cls.CACHE_SIZE)
+
+        return cache
 
     def __call__(self, word):
         return self._stemmer(word)
@@ -3,22 +3,89 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
+import abc
 import re
 import string
+import threading
 import zipfile
 
 import nltk
 
-from .._compat import to_string, to_unicode, unicode
+from .._compat import AbstractBase, to_string, to_unicode, unicode
 from ..utils import normalize_language
 
 
 class DefaultWordTokenizer(object):
     """NLTK tokenizer"""
+    _word_tokenizer = None
+
     @staticmethod
     def tokenize(text):
         return nltk.word_tokenize(text)
 
+    @classmethod
+    def tokenize_batch(cls, texts):
+        """Same as ``nltk.word_tokenize`` but the punkt model is loaded only once for all the texts."""
+        sentences_tokenizer = nltk.data.load("tokenizers/punkt/english.pickle")
+        word_tokenizer = cls._get_word_tokenizer()
+        return [
+            [word for sentence in sentences for word in word_tokenizer.tokenize(sentence)]
+            for sentences in sentences_tokenizer.tokenize_sents(texts)
+        ]
+
+    @classmethod
+    def _get_word_tokenizer(cls):
+        if cls._word_tokenizer is None:
+            # `nltk.word_tokenize` uses NLTKWordTokenizer since NLTK 3.5 and TreebankWordTokenizer before
+            word_tokenizer_class = getattr(nltk.tokenize, "NLTKWordTokenizer", nltk.tokenize.TreebankWordTokenizer)
+            cls._word_tokenizer = word_tokenizer_class()
+
+        return cls._word_tokenizer
+
+
+def _ignore_case(word):
+    return "".join("[%s%s]" % (c.lower(), c.upper()) for c in word)
+
+
+class RegexWordTokenizer(object):
+    """
+    Fast alternative of ``DefaultWordTokenizer`` for alphabetic languages.
+    It extracts only the words kept by ``Tokenizer.to_words`` (letters with
+    inner hyphens or apostrophes) by one pass of a compiled regex. Word
+    boundaries, dashes, quotes, final periods and English clitics ('s, n't, ...)
+    follow the rules of ``nltk.word_tokenize`` so results are almost the same.
+    Tokens containing digits or inner periods (numbers, "e.g.") are skipped
+    as a whole. Use ``python -m benchmarks.regex_words`` to compare both.
+    """
+    # characters always split from words by NLTK (en and em dashes included)
+    _SEPARATORS = r"""\s«“‘„`»”’,;:@#$%&?!*\[\](){}<>\"\u2012-\u2015"""
+    _BOUNDARY = r"(?=[" + _SEPARATORS + r"]|--|\.\.|$)"
+    _LETTERS = r"[^\W\d_]+"
+    _CLITIC = r"(?:'[sSmMdD]|'ll|'LL|'re|'RE|'ve|'VE|n't|N'T|')"
+    _FINAL_PERIOD = r"""(?:\.[\])}>"'»”’]*\s*$)"""
+    # opening quote is split from the following word unless it starts a clitic ('s, 'n, ...)
+    _OPENING_QUOTE = r"(?<!\w)'(?!(?:" + "|".join(map(_ignore_case, ("re", "ve", "ll", "m", "t", "s", "d", "n"))) + \
+        r")\b)(?=\w)"
+    # "cannot" -> "can", "not" etc.
+    _SPLIT_WORDS = "|".join(r"\b%s(?=%s\b)" % (_ignore_case(start), _ignore_case(end)) for start, end in (
+        ("can", "not"), ("gim", "me"), ("gon", "na"), ("got", "ta"), ("lem", "me"), ("wan", "na"),
+    ))
+
+    _PATTERN = re.compile(
+        r"((?:n't|N'T)" + _BOUNDARY + r"|" + _SPLIT_WORDS + r"|" + _LETTERS +
+        r"(?:-" + _LETTERS + r"|'(?!(?:[sSmMdD]|ll|LL|re|RE|ve|VE|[tT])" + _BOUNDARY + r")" + _LETTERS + r")*-?" +
+        # clitics and the final period are split from the word
+        r"(?=" + _CLITIC + r"?" + _FINAL_PERIOD + r"?" + _BOUNDARY + r"))" +
+        r"|" + _OPENING_QUOTE +
+        # other tokens are skipped as a whole
+        r"|(?:[^" + _SEPARATORS + r"\-.']|(?!" + _OPENING_QUOTE + r")'|(?<!-)-(?!-)|\.(?!\.))+",
+        re.UNICODE
+    )
+
+    @classmethod
+    def tokenize(cls, text):
+        return [word for word in cls._PATTERN.findall(text) if word]
+
 
 class HebrewWordTokenizer:
     """https://github.com/iddoberger/awesome-hebrew-nlp"""
@@ -42,20 +109,70 @@ class HebrewWordTokenizer:
         ]
 
 
-class JapaneseWordTokenizer:
-    @staticmethod
-    def tokenize(text):
-        try:
-            from sudachipy import Dictionary, MorphemeList
-        except ImportError:
-            raise ValueError(
-                "Japanese tokenizer requires SudachiPy and SudachiDict. "
-                "Please, install them by commands 'pip install sudachipy sudachidict_core'."
-            )
-        tokenizer = Dictionary().create()
-        morphemes = tokenizer.tokenize(text)
+class JapaneseWordTokenizer(object):
+    """
+    SudachiPy tokenizer. The system dictionary is loaded lazily only once per
+    process and every thread creates its own Sudachi tokenizers from it
+    because they can't be shared by threads.
+
+    :param split_mode: Sudachi split mode "A" (the shortest units), "B"
+        (middle units) or "C" (named entities, the default).
+    """
+    SPLIT_MODES = ("A", "B", "C")
+
+    _dictionary = None
+    _dictionary_lock = threading.Lock()
+    _local = threading.local()
+
+    def __init__(self, split_mode="C"):
+        if split_mode not in self.SPLIT_MODES:
+            raise ValueError("Split mode has to be one of %s, not %r." % (", ".join(self.SPLIT_MODES), split_mode))
+        self._split_mode = split_mode
+
+    @property
+    def split_mode(self):
+        return self._split_mode
+
+    @classmethod
+    def get_dictionary(cls):
+        """Returns SudachiPy dictionary shared by all the Japanese tokenizers."""
+        with JapaneseWordTokenizer._dictionary_lock:
+            if JapaneseWordTokenizer._dictionary is None:
+                try:
+                    from sudachipy import Dictionary
+                except ImportError:
+                    raise ValueError(
+                        "Japanese tokenizer requires SudachiPy and SudachiDict. "
+                        "Please, install them by commands 'pip install sudachipy sudachidict_core'."
+                    )
+                JapaneseWordTokenizer._dictionary = Dictionary()
+
+            return JapaneseWordTokenizer._dictionary
+
+    def _get_tokenizer(self):
+        tokenizers = getattr(self._local, "tokenizers", None)
+        if tokenizers is None:
+            tokenizers = self._local.tokenizers = {}
+
+        tokenizer = tokenizers.get(self._split_mode)
+        if tokenizer is None:
+            from sudachipy import SplitMode
+            dictionary = self.get_dictionary()
+            # "create" is deprecated by the newer SudachiPy versions
+            create = getattr(dictionary, "tokenizer", None) or dictionary.create
+            tokenizer = tokenizers[self._split_mode] = create(mode=getattr(SplitMode, self._split_mode))
+
+        return tokenizer
+
+    def tokenize(self, text):
+        morphemes = self._get_tokenizer().tokenize(text)
         return [m.surface() for m in morphemes]
 
+    def tokenize_batch(self, texts):
+        """Tokenizes all the texts by one Sudachi tokenizer, returns list of results."""
+        tokenizer = self._get_tokenizer()
+        return [[m.surface() for m in tokenizer.tokenize(text)] for text in texts]
+
 
 class ChineseWordTokenizer:
     @staticmethod
@@ -66,28 +183,97 @@ class ChineseWordTokenizer:
             raise ValueError("Chinese tokenizer requires jieba. Please, install it by command 'pip install jieba'.")
         return jieba.cut(text)
 
+    @classmethod
+    def tokenize_batch(cls, texts):
+        """
+        Jieba cuts every line of the text separately (in parallel after
+        ``jieba.enable_parallel()``) so the texts are cut by one call joined
+        by new lines. Texts containing line breaks are cut one by one.
+        """
+        texts = list(texts)
+        if not texts or any("\n" in text or "\r" in text for text in texts):
+            return [list(cls.tokenize(text)) for text in texts]
+
+        words_of_texts = [[]]
+        for word in cls.tokenize("\n".join(texts)):
+            if word == "\n":
+                words_of_texts.append([])
+            else:
+                words_of_texts[-1].append(word)
+
+        return words_of_texts
+
+
+class KiwiTokenizer(AbstractBase):
+    """
+    Base of the Korean tokenizers. Loading of the Kiwi morphological model takes
+    seconds so one Kiwi instance is created lazily on the first use and shared
+    by all the Korean tokenizers in the process. The lock guards only the loading,
+    kiwipiepy documents Kiwi as safe to be called from more threads at once
+    (see "multithreading" in its documentation). Many texts are better passed
+    to Kiwi at once by ``tokenize_batch`` which can be processed by more Kiwi workers.
+    """
+    # number of threads used by Kiwi for batches, -1 means all the available cores
+    NUM_WORKERS = None
+
+    _kiwi = None
+    _kiwi_lock = threading.Lock()
 
-class KoreanSentencesTokenizer:
-    @staticmethod
-    def tokenize(text):
-        try:
-            from kiwipiepy import Kiwi
-        except ImportError:
-            raise ValueError("Korean tokenizer requires kiwipiepy. Please, install it by command 'pip install kiwipiepy'.")
-        kiwi = Kiwi()
-        return [sent.text for sent in kiwi.split_into_sents(text)]
+    @classmethod
+    def get_kiwi(cls):
+        """Returns Kiwi instance shared by all the Korean tokenizers."""
+        if KiwiTokenizer._kiwi is not None:
+            return KiwiTokenizer._kiwi
 
+        with KiwiTokenizer._kiwi_lock:
+            if KiwiTokenizer._kiwi is None:
+                try:
+                    from kiwipiepy import Kiwi
+                except ImportError:
+                    raise ValueError(
+                        "Korean tokenizer requires kiwipiepy. Please, install it by command 'pip install kiwipiepy'."
+                    )
+                kiwi = Kiwi(num_workers=cls.NUM_WORKERS)
+                # the model is loaded by the first analysis
+                kiwi.tokenize("")
+                KiwiTokenizer._kiwi = kiwi
 
-class KoreanWordTokenizer:
-    @staticmethod
-    def tokenize(text):
-        try:
-            from kiwipiepy import Kiwi
-        except ImportError:
-            raise ValueError("Korean tokenizer requires kiwipiepy. Please, install it by command 'pip install kiwipiepy'.")
-        kiwi = Kiwi()
+            return KiwiTokenizer._kiwi
+
+    def tokenize(self, text):
+        return self.tokenize_batch((text,))[0]
+
+    def tokenize_batch(self, texts):
+        """Tokenizes all the texts by one call of Kiwi, returns list of results."""
+        texts = list(texts)
+        if not texts:
+            return []
+
+        return [self._process(result) for result in self._analyze(self.get_kiwi(), texts)]
+
+    @abc.abstractmethod
+    def _analyze(self, kiwi, texts):
+        """Returns results of Kiwi analysis of every text."""
+
+    @abc.abstractmethod
+    def _process(self, result):
+        """Converts Kiwi analysis of a text into list of strings."""
+
+
+class KoreanSentencesTokenizer(KiwiTokenizer):
+    def _analyze(self, kiwi, texts):
+        return kiwi.split_into_sents(texts)
+
+    def _process(self, sentences):
+        return [sent.text for sent in sentences]
+
+
+class KoreanWordTokenizer(KiwiTokenizer):
+    def _analyze(self, kiwi, texts):
+        return kiwi.tokenize(texts)
+
+    def _process(self, tokens):
         # Extract nouns similar to konlpy's Kkma().nouns()
-        tokens = kiwi.tokenize(text)
         return [token.form for token in tokens if token.tag.startswith('N')]
 
 
@@ -110,6 +296,59 @@ class GreekSentencesTokenizer:
         return [sentence.strip() for sent_gen in sentences for sentence in sent_gen]
 
 
+class RuleBasedSentencesTokenizer(object):
+    """
+    Fast alternative of punkt sentence tokenizer. Sentences end by '.', '!',
+    '?' or '…' (optionally followed by closing quotes or brackets) and
+    a white space. Period does not end a sentence after an abbreviation
+    or an initial and after a number or a short word (an unknown abbreviation)
+    if the next word is in lower case. Ellipsis ends a sentence only if the next word is capitalized.
+    It is less accurate than punkt but much faster for large volumes of text.
+    Use ``python -m benchmarks.rule_sentences`` to compare both.
+
+    :param abbreviations: Abbreviations without the final period, e.g. "e.g".
+    """
+    _END_PATTERN = re.compile(r"""(?<!\S)(\S*?)([.!?…]+)[\])}>"'»”’]*(?=\s+(\S)|\s*$)""", re.UNICODE)
+    _OPENING_CHARACTERS = "([{<\"'«“‘„"
+
+    def __init__(self, abbreviations=()):
+        self._abbreviations = frozenset(a.rstrip(".").lower() for a in abbreviations)
+
+    def tokenize(self, text):
+        sentences = []
+        start = 0
+        for match in self._END_PATTERN.finditer(text):
+            if self._is_sentence_end(*match.groups()):
+                sentences.append(text[start:match.end()].strip())
+                start = match.end()
+
+        rest = text[start:].strip()
+        if rest:
+            sentences.append(rest)
+
+        return sentences
+
+    def _is_sentence_end(self, word, punctuation, next_character):
+        word = word.lstrip(self._OPENING_CHARACTERS)
+        if next_character is None:
+            return True
+        elif "." not in punctuation and "…" not in punctuation:
+            return True
+        elif punctuation != ".":
+            # ellipsis
+            return next_character.isupper()
+        elif next_character.islower() and (word.isdigit() or (word.isalpha() and len(word) <= 4)):
+            # ordinal number or short word looking like an unknown abbreviation
+            return False
+        elif word.lower() in self._abbreviations:
+            return False
+        elif len(word) == 1 and word.isalpha():
+            # initial of the name
+            return False
+        else:
+            return True
+
+
 class ArabicWordTokenizer:
     @staticmethod
     def tokenize(text):
@@ -169,6 +408,32 @@ class Tokenizer(object):
                   "μ.Χ", "π.μ", "μ.μ", "δηλ", "βλ", "κ.ο.κ", "σελ", "κεφ", "χιλ", "αρ"],
     }
 
+    # abbreviations used by the rule based sentence tokenizer with LANGUAGE_EXTRA_ABREVS,
+    # the language of the tokenizer is looked up before its alias
+    LANGUAGE_ABBREVIATIONS = {
+        "czech": ["atd", "apod", "např", "tzv", "tj", "resp", "str", "mj", "př", "č", "tel", "ul", "nám", "sv",
+                  "hod", "tis", "mil", "mld", "kč", "ing", "mgr", "bc", "doc", "prof", "dr", "mudr", "judr",
+                  "phdr", "rndr", "p", "pí", "n.l", "př.n.l"],
+        "dutch": ["dhr", "mevr", "bijv", "enz", "o.a", "d.w.z", "ca", "nr", "blz", "m.a.w", "z.g.a.n"],
+        "english": ["mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "inc", "ltd", "corp", "jan",
+                    "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec", "vol", "fig",
+                    "approx", "dept", "gov", "rev", "sgt", "capt", "col", "lt", "mt", "ave", "blvd", "u.s",
+                    "u.k", "a.m", "p.m", "cf", "viz", "ph.d"],
+        "french": ["m", "mm", "mme", "mlle", "dr", "etc", "cf", "ex", "env", "av", "bd", "st", "ste", "vol",
+                   "p.ex", "c.-à-d", "janv", "févr", "avr", "juil", "sept", "oct", "nov", "déc"],
+        "german": ["bzw", "ca", "usw", "vgl", "z.b", "d.h", "u.a", "evtl", "ggf", "inkl", "nr", "dr", "prof",
+                   "hr", "fr", "str", "abs", "bd", "jh", "mio", "mrd", "sog", "u.ä", "z.t", "u.s.w", "etc"],
+        "italian": ["sig", "sigg", "dott", "prof", "ecc", "pag", "ing", "avv", "es", "ca", "n"],
+        "portuguese": ["sr", "sra", "dr", "dra", "prof", "etc", "pág", "av", "ex", "p.ex", "n"],
+        "slovak": ["atď", "napr", "tzv", "tj", "t.j", "resp", "príp", "str", "č", "tel", "ul", "nám", "sv", "hod",
+                   "tis", "mil", "mld", "roč", "obr", "tab", "ing", "mgr", "bc", "doc", "prof", "dr", "mudr", "judr",
+                   "phdr", "rndr", "paeddr", "p", "pí", "n.l", "pred.n.l", "s.r.o", "a.s"],
+        "russian": ["т.е", "т.д", "т.п", "др", "пр", "г", "гг", "см", "стр", "им", "ул", "тыс", "млн", "млрд",
+                    "руб", "т.к", "напр"],
+        "spanish": ["sr", "sra", "srta", "dr", "dra", "ud", "uds", "etc", "pág", "núm", "av", "ej", "aprox",
+                    "p.ej", "ee.uu"],
+    }
+
     SPECIAL_SENTENCE_TOKENIZERS = {
         'ukrainian': nltk.RegexpTokenizer(r'[.!?…»]', gaps=True),
         'hebrew': nltk.RegexpTokenizer(r'\.\s+', gaps=True),
@@ -190,21 +455,39 @@ class Tokenizer(object):
         'thai': ThaiWordTokenizer(),
     }
 
-    def __init__(self, language):
+    # "rules" is fast alternative of punkt sentence tokenizer
+    SENTENCE_ENGINES = ("default", "rules")
+    # "regex" is fast alternative of NLTK word tokenizer for alphabetic languages
+    WORD_ENGINES = ("default", "regex")
+
+    def __init__(self, language, word_engine="default", sentence_engine="default"):
         language = normalize_language(language)
         self._language = language
 
         tokenizer_language = self.LANGUAGE_ALIASES.get(language, language)
-        self._sentence_tokenizer = self._get_sentence_tokenizer(tokenizer_language)
-        self._word_tokenizer = self._get_word_tokenizer(tokenizer_language)
+        self._sentence_tokenizer = self._get_sentence_tokenizer(tokenizer_language, sentence_engine)
+        self._word_tokenizer = self._get_word_tokenizer(tokenizer_language, word_engine)
 
     @property
     def language(self):
         return self._language
 
-    def _get_sentence_tokenizer(self, language):
+    def _get_sentence_tokenizer(self, language, engine="default"):
+        if engine not in self.SENTENCE_ENGINES:
+            raise ValueError(
+                "Sentence engine has to be one of %s, not %r." % (", ".join(self.SENTENCE_ENGINES), engine)
+            )
+
         if language in self.SPECIAL_SENTENCE_TOKENIZERS:
+            if engine != "default":
+                raise ValueError("Sentence engine %r is not available for language %r." % (engine, language))
             return self.SPECIAL_SENTENCE_TOKENIZERS[language]
+        elif engine == "rules":
+            abbreviations = self.LANGUAGE_ABBREVIATIONS.get(self._language, self.LANGUAGE_ABBREVIATIONS.get(language, []))
+            # the rules see words without white spaces so abbreviations like "z. B" never match
+            extra_abbreviations = [a for a in self.LANGUAGE_EXTRA_ABREVS.get(self._language, []) if " " not in a]
+            return RuleBasedSentencesTokenizer(abbreviations + extra_abbreviations)
+
         try:
             path = to_string("tokenizers/punkt/%s.pickle") % to_string(language)
             return nltk.data.load(path)
@@ -215,23 +498,60 @@ class Tokenizer(object):
                 "Original error was:\n" + str(e)
             )
 
-    def _get_word_tokenizer(self, language):
+    def _get_word_tokenizer(self, language, engine="default"):
+        if engine not in self.WORD_ENGINES:
+            raise ValueError("Word engine has to be one of %s, not %r." % (", ".join(self.WORD_ENGINES), engine))
+
         if language in self.SPECIAL_WORD_TOKENIZERS:
+            if engine != "default":
+                raise ValueError("Word engine %r is not available for language %r." % (engine, language))
             return self.SPECIAL_WORD_TOKENIZERS[language]
+        elif engine == "regex":
+            return RegexWordTokenizer()
         else:
             return DefaultWordTokenizer()
 
     def to_sentences(self, paragraph):
-        if hasattr(self._sentence_tokenizer, '_params'):
-            extra_abbreviations = self.LANGUAGE_EXTRA_ABREVS.get(self._language, [])
-            self._sentence_tokenizer._params.abbrev_types.update(extra_abbreviations)
+        self._add_extra_abbreviations()
         sentences = self._sentence_tokenizer.tokenize(to_unicode(paragraph))
         return tuple(map(unicode.strip, sentences))
 
+    def to_sentences_batch(self, paragraphs):
+        """
+        Splits all the paragraphs into sentences at once by the batch API
+        of the tokenizer if there is any. Returns list of tuples of sentences.
+        """
+        self._add_extra_abbreviations()
+        paragraphs = [to_unicode(p) for p in paragraphs]
+        return [tuple(map(unicode.strip, s)) for s in self._tokenize_batch(self._sentence_tokenizer, paragraphs)]
+
     def to_words(self, sentence):
         words = self._word_tokenizer.tokenize(to_unicode(sentence))
         return tuple(filter(self._is_word, words))
 
+    def to_words_batch(self, sentences):
+        """
+        Tokenizes all the sentences into words at once by the batch API
+        of the tokenizer if there is any. Returns list of tuples of words.
+        """
+        sentences = [to_unicode(s) for s in sentences]
+        return [tuple(filter(self._is_word, w)) for w in self._tokenize_batch(self._word_tokenizer, sentences)]
+
+    def _add_extra_abbreviations(self):
+        if hasattr(self._sentence_tokenizer, '_params'):
+            extra_abbreviations = self.LANGUAGE_EXTRA_ABREVS.get(self._language, [])
+            self._sentence_tokenizer._params.abbrev_types.update(extra_abbreviations)
+
+    @staticmethod
+    def _tokenize_batch(tokenizer, texts):
+        if hasattr(tokenizer, "tokenize_batch"):
+            return tokenizer.tokenize_batch(texts)
+        elif hasattr(tokenizer, "tokenize_sents"):
+            # NLTK tokenizers
+            return tokenizer.tokenize_sents(texts)
+        else:
+            return [tokenizer.tokenize(text) for text in texts]
+
     @staticmethod
     def _is_word(word):
         return bool(Tokenizer._WORD_PATTERN.match(word))
@@ -85,21 +85,30 @@ class HtmlParser(DocumentParser):
 
         annotated_text = self._article.main_text
 
-        paragraphs = []
+        headings_of_paragraphs = []
+        texts = []
         for paragraph in annotated_text:
-            sentences = []
+            headings = []
 
             current_text = ""
             for text, annotations in paragraph:
                 if annotations and ("h1" in annotations or "h2" in annotations or "h3" in annotations):
-                    sentences.append(Sentence(text, self._tokenizer, is_heading=True))
+                    headings.append(Sentence(text, self._tokenizer, is_heading=True))
                 # skip <pre> nodes
                 elif not (annotations and "pre" in annotations):
                     # be sure to not add empty space between word and punctuations
                     current_text += "" + text if text[0] in punctuation else " " + text
 
-            new_sentences = self.tokenize_sentences(current_text)
-            sentences.extend(Sentence(s, self._tokenizer) for s in new_sentences)
+            headings_of_paragraphs.append(headings)
+            texts.append(current_text)
+
+        # all the texts are split into sentences at once
+        paragraphs = []
+        for headings, new_sentences in zip(headings_of_paragraphs, self.tokenize_sentences_batch(texts)):
+            sentences = headings + [Sentence(s, self._tokenizer) for s in new_sentences]
             paragraphs.append(Paragraph(sentences))
 
-        return ObjectDocumentModel(paragraphs)
+        document = ObjectDocumentModel(paragraphs)
+        Sentence.tokenize_words(document.headings + document.sentences)
+
+        return document
@@ -37,5 +37,13 @@ class DocumentParser(object):
     def tokenize_sentences(self, paragraph):
         return [s for s in self._tokenizer.to_sentences(paragraph) if s.strip()]
 
+    def tokenize_sentences_batch(self, paragraphs):
+        if hasattr(self._tokenizer, "to_sentences_batch"):
+            sentences_of_paragraphs = self._tokenizer.to_sentences_batch(paragraphs)
+        else:
+            sentences_of_paragraphs = [self._tokenizer.to_sentences(p) for p in paragraphs]
+
+        return [[s for s in sentences if s.strip()] for sentences in sentences_of_paragraphs]
+
     def tokenize_words(self, sentence):
         return self._tokenizer.to_words(sentence)
@@ -66,36 +66,49 @@ class PlaintextParser(DocumentParser):
                 heading = Sentence(line, self._tokenizer, is_heading=True)
                 current_paragraph.append(heading)
             elif not line and current_paragraph:
-                sentences = self._to_sentences(current_paragraph)
-                paragraphs.append(Paragraph(sentences))
+                paragraphs.append(self._join_lines(current_paragraph))
                 current_paragraph = []
             elif line:
                 current_paragraph.append(line)
 
-        sentences = self._to_sentences(current_paragraph)
-        paragraphs.append(Paragraph(sentences))
+        paragraphs.append(self._join_lines(current_paragraph))
 
-        return ObjectDocumentModel(paragraphs)
+        # all the texts are split into sentences at once
+        texts = [item for items in paragraphs for item in items if not isinstance(item, Sentence)]
+        sentences_of_texts = iter(self.tokenize_sentences_batch(texts))
+        document = ObjectDocumentModel(Paragraph(self._to_sentences(items, sentences_of_texts)) for items in paragraphs)
+        Sentence.tokenize_words(document.headings + document.sentences)
 
-    def _to_sentences(self, lines):
+        return document
+
+    def _join_lines(self, lines):
+        """Joins lines between headings into texts of sentences."""
         text = ""
-        sentence_objects = []
+        items = []
 
         for line in lines:
             if isinstance(line, Sentence):
                 if text:
-                    sentence_objects.extend(self._to_sentence_objects(text))
+                    items.append(text)
 
-                sentence_objects.append(line)
+                items.append(line)
                 text = ""
             else:
                 text += " " + line
 
         text = text.strip()
         if text:
-            sentence_objects.extend(self._to_sentence_objects(text))
+            items.append(text)
 
-        return sentence_objects
+        return items
 
-    def _to_sentence_objects(self, text):
-        return (Sentence(s, self._tokenizer) for s in self.tokenize_sentences(text))
+    def _to_sentences(self, items, sentences_of_texts):
+        sentence_objects = []
+        for item in items:
+            if isinstance(item, Sentence):
+                sentence_objects.append(item)
+            else:
+                sentences = next(sentences_of_texts)
+                sentence_objects.extend(Sentence(s, self._tokenizer) for s in sentences)
+
+        return sentence_objects
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# upper bound of pairs materialized at once while computing a Gram matrix
+_MAX_PAIRS_IN_CHUNK = 1 << 22
+
+
+class CsrMatrix(object):
+    """
+    Sparse matrix in the compressed sparse row (CSR) format stored in plain
+    NumPy arrays. It implements only operations needed by the summarizers
+    so SciPy is not required. Memory is proportional to the number of
+    non-zero items.
+    """
+    def __init__(self, data, indices, indptr, shape):
+        self.data = numpy.asarray(data, dtype=numpy.float64)
+        self.indices = numpy.asarray(indices, dtype=numpy.int64)
+        self.indptr = numpy.asarray(indptr, dtype=numpy.int64)
+        self.shape = tuple(shape)
+
+    @classmethod
+    def from_coo(cls, rows, cols, values, shape):
+        """Creates matrix from items in coordinate format. Duplicate items are summed."""
+        rows_count, cols_count = shape
+        keys = numpy.asarray(rows, dtype=numpy.int64) * cols_count + numpy.asarray(cols, dtype=numpy.int64)
+        keys, values = _coalesce(keys, numpy.asarray(values, dtype=numpy.float64))
+
+        return cls._from_sorted_keys(keys, values, shape)
+
+    @classmethod
+    def _from_sorted_keys(cls, keys, values, shape):
+        rows_count, cols_count = shape
+        rows, cols = numpy.divmod(keys, cols_count)
+        indptr = numpy.zeros(rows_count + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(rows, minlength=rows_count), out=indptr[1:])
+
+        return cls(values, cols, indptr, shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def T(self):
+        return CsrMatrix.from_coo(self.indices, self.row_indices(), self.data, self.shape[::-1])
+
+    def __len__(self):
+        return self.shape[0]
+
+    def row_indices(self):
+        """Returns row index of every stored item."""
+        return numpy.repeat(numpy.arange(self.shape[0]), numpy.diff(self.indptr))
+
+    def row_sums(self):
+        return numpy.bincount(self.row_indices(), weights=self.data, minlength=self.shape[0])
+
+    def take_rows(self, rows):
+        """Returns new matrix with only the given rows in the given order."""
+        rows = numpy.asarray(rows, dtype=numpy.int64)
+        lengths = numpy.diff(self.indptr)[rows]
+        indptr = numpy.zeros(len(rows) + 1, dtype=numpy.int64)
+        numpy.cumsum(lengths, out=indptr[1:])
+        items = numpy.repeat(self.indptr[rows] - indptr[:-1], lengths) + numpy.arange(indptr[-1])
+
+        return CsrMatrix(self.data[items], self.indices[items], indptr, (len(rows), self.shape[1]))
+
+    def scale_rows(self, factors):
+        """Returns new matrix with every row multiplied by its factor."""
+        factors = numpy.asarray(factors, dtype=numpy.float64)
+        return CsrMatrix(self.data * factors[self.row_indices()], self.indices, self.indptr, self.shape)
+
+    def dot(self, other):
+        """Multiplies the matrix by a dense vector or a dense matrix."""
+        other = numpy.asarray(other, dtype=numpy.float64)
+        products = self.data.reshape((-1,) + (1,) * (other.ndim - 1)) * other[self.indices]
+
+        result = numpy.zeros((self.shape[0],) + other.shape[1:])
+        starts = self.indptr[:-1]
+        non_empty_rows = starts < self.indptr[1:]
+        if self.nnz:
+            # items of empty rows don't exist so every sum spans a single row
+            result[non_empty_rows] = numpy.add.reduceat(products, starts[non_empty_rows], axis=0)
+
+        return result
+
+    def toarray(self):
+        array = numpy.zeros(self.shape)
+        array[self.row_indices(), self.indices] = self.data
+        return array
+
+
+class RankOneUpdatedMatrix(object):
+    """
+    Matrix ``matrix + outer(left, right)`` that is never stored densely.
+    It supports products with dense vectors and matrices, so a sparse matrix
+    shifted by a dense rank-one term stays sparse in memory.
+    """
+    def __init__(self, matrix, left, right):
+        self.matrix = matrix
+        self.left = numpy.asarray(left, dtype=numpy.float64)
+        self.right = numpy.asarray(right, dtype=numpy.float64)
+        self.shape = matrix.shape
+
+    @property
+    def T(self):
+        return RankOneUpdatedMatrix(self.matrix.T, self.right, self.left)
+
+    def dot(self, other):
+        other = numpy.asarray(other, dtype=numpy.float64)
+        return self.matrix.dot(other) + numpy.multiply.outer(self.left, self.right.dot(other))
+
+    def toarray(self):
+        return self.matrix.toarray() + numpy.outer(self.left, self.right)
+
+
+def gram_matrix(rows, cols, values, rows_count, sparse=False, threshold=None):
+    """
+    Computes Gram matrix ``A . A^T`` of the sparse matrix ``A`` given
+    in coordinate format. Only the rows sharing some column are multiplied
+    so the work is proportional to the sum of squared column frequencies
+    instead of |rows|²×|columns|.
+
+    :param numpy.ndarray rows:
+        Row indices of non-zero items of the matrix ``A``.
+    :param numpy.ndarray cols:
+        Column indices of non-zero items of the matrix ``A``.
+    :param numpy.ndarray values:
+        Values of non-zero items of the matrix ``A``.
+    :param int rows_count:
+        Number of rows of the matrix ``A``.
+    :param bool sparse:
+        Returns :class:`CsrMatrix` instead of dense array if true.
+    :param float threshold:
+        Only items greater than threshold are kept in the sparse matrix.
+        Items are dropped as soon as their rows are computed so the memory
+        is proportional to the number of kept items.
+    :rtype: numpy.ndarray | CsrMatrix
+    :returns:
+        Matrix of shape |rows|×|rows|.
+    """
+    shape = (rows_count, rows_count)
+    if sparse:
+        all_keys, all_sums = [], []
+        for keys, products in _iterate_row_pairs(rows, cols, values, rows_count):
+            keys, sums = _coalesce(keys, products)
+            if threshold is not None:
+                kept = sums > threshold
+                keys, sums = keys[kept], sums[kept]
+            all_keys.append(keys)
+            all_sums.append(sums)
+
+        # blocks of rows are disjoint and ordered so the keys are sorted already
+        keys = numpy.concatenate(all_keys) if all_keys else numpy.zeros(0, dtype=numpy.int64)
+        sums = numpy.concatenate(all_sums) if all_sums else numpy.zeros(0)
+        return CsrMatrix._from_sorted_keys(keys, sums, shape)
+
+    gram = numpy.zeros(rows_count * rows_count)
+    for keys, products in _iterate_row_pairs(rows, cols, values, rows_count):
+        keys, products = _coalesce(keys, products)
+        gram[keys] = products
+
+    return gram.reshape(shape)
+
+
+def bucket_similarities(matrix, bucket_rows, bucket_cols, threshold=None):
+    """
+    Computes dot products of the rows of the sparse matrix that share at least
+    one bucket. Other pairs of rows are not compared at all.
+
+    :param CsrMatrix matrix:
+        Matrix with compared rows.
+    :param numpy.ndarray bucket_rows:
+        Indices of rows placed into the buckets.
+    :param numpy.ndarray bucket_cols:
+        Indices of buckets the rows are placed into.
+    :param float threshold:
+        Only dot products greater than threshold are kept.
+    :rtype: CsrMatrix
+    :returns:
+        Matrix of shape |rows|×|rows|.
+    """
+    rows_count = matrix.shape[0]
+    buffer = numpy.zeros((max(1, _MAX_PAIRS_IN_CHUNK // max(1, matrix.shape[1])), matrix.shape[1]))
+
+    all_keys, all_products = [], []
+    for keys, _ in _iterate_row_pairs(bucket_rows, bucket_cols, numpy.ones(len(bucket_rows)), rows_count):
+        # rows sharing more buckets are paired more times
+        keys.sort()
+        keys = keys[numpy.concatenate(([True], keys[1:] != keys[:-1]))]
+        left, right = numpy.divmod(keys, rows_count)
+        products = _rows_dot_products(matrix, left, right, buffer)
+        if threshold is not None:
+            kept = products > threshold
+            keys, products = keys[kept], products[kept]
+        all_keys.append(keys)
+        all_products.append(products)
+
+    keys = numpy.concatenate(all_keys) if all_keys else numpy.zeros(0, dtype=numpy.int64)
+    products = numpy.concatenate(all_products) if all_products else numpy.zeros(0)
+    return CsrMatrix._from_sorted_keys(keys, products, (rows_count, rows_count))
+
+
+def _rows_dot_products(matrix, left, right, buffer):
+    """
+    Computes dot products of rows ``left[i]`` and ``right[i]`` of the sparse matrix.
+    Indices ``left`` are sorted. Blocks of the left rows are scattered into the dense
+    ``buffer`` of zeros so every item of the right row is looked up directly.
+    """
+    lengths = numpy.diff(matrix.indptr)
+    block_size = len(buffer)
+    products = numpy.zeros(len(left))
+
+    start = 0
+    while start < len(left):
+        first_row = left[start]
+        last_row = min(first_row + block_size, matrix.shape[0])
+        end = numpy.searchsorted(left, last_row)
+
+        block_items = slice(matrix.indptr[first_row], matrix.indptr[last_row])
+        block_rows = numpy.repeat(numpy.arange(last_row - first_row), lengths[first_row:last_row])
+        buffer[block_rows, matrix.indices[block_items]] = matrix.data[block_items]
+
+        # every item of the right row is multiplied by the same column of the left row
+        right_lengths = lengths[right[start:end]]
+        pairs = numpy.repeat(numpy.arange(end - start), right_lengths)
+        items = numpy.repeat(matrix.indptr[right[start:end]] - numpy.cumsum(right_lengths) + right_lengths, right_lengths) \
+            + numpy.arange(len(pairs))
+        item_products = buffer[left[start + pairs] - first_row, matrix.indices[items]] * matrix.data[items]
+        products[start:end] = numpy.bincount(pairs, weights=item_products, minlength=end - start)
+
+        buffer[block_rows, matrix.indices[block_items]] = 0.0
+        start = end
+
+    return products
+
+
+def _iterate_row_pairs(rows, cols, values, rows_count):
+    """
+    Yields pairs of items sharing the same column as flat indices into
+    |rows|×|rows| matrix together with product of their values. Pairs are
+    yielded in blocks of complete rows.
+    """
+    rows = numpy.asarray(rows, dtype=numpy.int64)
+    cols = numpy.asarray(cols, dtype=numpy.int64)
+    values = numpy.asarray(values, dtype=numpy.float64)
+    if not len(cols):
+        return
+
+    order = numpy.lexsort((rows, cols))
+    rows, cols, values = rows[order], cols[order], values[order]
+
+    # every column forms one continuous group of items now
+    starts = numpy.concatenate(([0], numpy.flatnonzero(numpy.diff(cols)) + 1))
+    lengths = numpy.diff(numpy.append(starts, len(cols)))
+    item_lengths = numpy.repeat(lengths, lengths)
+    item_group_starts = numpy.repeat(starts, lengths)
+
+    # every item is paired with all the items of its group (itself included)
+    pairs_counts = numpy.cumsum(numpy.bincount(rows, weights=item_lengths, minlength=rows_count))
+    row_order = numpy.argsort(rows, kind="mergesort")
+    row_starts = numpy.searchsorted(rows[row_order], numpy.arange(rows_count + 1))
+
+    first_row = 0
+    while first_row < rows_count:
+        done_pairs = pairs_counts[first_row - 1] if first_row else 0
+        last_row = numpy.searchsorted(pairs_counts, done_pairs + _MAX_PAIRS_IN_CHUNK, side="right")
+        last_row = min(max(last_row, first_row + 1), rows_count)
+
+        left_items = row_order[row_starts[first_row]:row_starts[last_row]]
+        if len(left_items):
+            left_lengths = item_lengths[left_items]
+            left = numpy.repeat(left_items, left_lengths)
+            offsets = numpy.arange(len(left)) - numpy.repeat(numpy.cumsum(left_lengths) - left_lengths, left_lengths)
+            right = item_group_starts[left] + offsets
+
+            yield rows[left] * rows_count + rows[right], values[left] * values[right]
+
+        first_row = last_row
+
+
+def _coalesce(keys, values):
+    """Sums values with the same key and returns unique keys with the sums."""
+    unique_keys, inverse = numpy.unique(keys, return_inverse=True)
+    return unique_keys, numpy.bincount(inverse.ravel(), weights=values, minlength=len(unique_keys))
@@ -4,14 +4,25 @@ from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
 
+import heapq
+
 from collections import namedtuple
 from operator import attrgetter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from ..utils import ItemsCount
 from .._compat import to_unicode
 from ..nlp.stemmers import null_stemmer
+from ..models import PreprocessedDocument
 
 
 SentenceInfo = namedtuple("SentenceInfo", ("sentence", "order", "rating",))
+# rating of sentences left out by the summarizers ranking only the best sentences
+UNSELECTED_RATING = float("-inf")
 
 
 class AbstractSummarizer(object):
@@ -31,23 +42,87 @@ class AbstractSummarizer(object):
     def normalize_word(word):
         return to_unicode(word).lower()
 
+    def _preprocess(self, document, stop_words=()):
+        """
+        Returns the document preprocessed by the stemmer of the summarizer.
+        Document preprocessed already is returned as is, with its own stemmer
+        and stop-words.
+        """
+        if isinstance(document, PreprocessedDocument):
+            return document
+
+        return PreprocessedDocument(document, self._stemmer, stop_words)
+
+    @staticmethod
+    def _get_items_count(count, total_count):
+        """
+        Resolves count of sentences (number, percentage, ...) for the document with
+        `total_count` sentences. Returns ``None`` for custom callables choosing the
+        sentences by their ratings.
+        """
+        if not callable(count):
+            count = ItemsCount(count)
+        if not isinstance(count, ItemsCount):
+            return None
+
+        return len(count(range(total_count)))
+
     @staticmethod
     def _get_best_sentences(sentences, count, rating, *args, **kwargs):
-        rate = rating
+        """
+        Returns `count` best rated sentences in their document order.
+
+        :param rating:
+            Ratings of the sentences by their positions (sequence or NumPy array),
+            mapping key = sentence, value = rating or callable rating the sentence.
+        """
         if isinstance(rating, dict):
             assert not args and not kwargs
-            def rate(s): return rating[s]
+            rating = [rating[s] for s in sentences]
+        elif callable(rating):
+            rating = [rating(s, *args, **kwargs) for s in sentences]
 
-        infos = (SentenceInfo(s, o, rate(s, *args, **kwargs))
-            for o, s in enumerate(sentences))
+        if not callable(count):
+            count = ItemsCount(count)
+        if not isinstance(count, ItemsCount):
+            return AbstractSummarizer._get_best_sentences_by_infos(sentences, count, rating)
+
+        count = AbstractSummarizer._get_items_count(count, len(sentences))
+        return tuple(sentences[i] for i in AbstractSummarizer._get_best_positions(rating, count))
+
+    @staticmethod
+    def _get_best_sentences_by_infos(sentences, count, ratings):
+        """Custom `count` callables choose from all the sentences sorted by rating."""
+        infos = (SentenceInfo(s, o, r) for o, (s, r) in enumerate(zip(sentences, ratings)))
 
         # sort sentences by rating in descending order
         infos = sorted(infos, key=attrgetter("rating"), reverse=True)
         # get `count` first best rated sentences
-        if not callable(count):
-            count = ItemsCount(count)
         infos = count(infos)
         # sort sentences by their order in document
         infos = sorted(infos, key=attrgetter("order"))
 
         return tuple(i.sentence for i in infos)
+
+    @staticmethod
+    def _get_best_positions(ratings, count):
+        """
+        Returns positions of `count` best ratings in ascending order. The first
+        positions win among the equal ratings, the same way as in the stable sort.
+        NaN ratings of numpy arrays (e.g. LexRank of stop-words only) are the worst.
+        """
+        total_count = len(ratings)
+        if count >= total_count:
+            return list(range(total_count))
+        if count <= 0:
+            return []
+
+        if numpy is not None and isinstance(ratings, numpy.ndarray):
+            if ratings.dtype.kind == "f":
+                ratings = numpy.where(numpy.isnan(ratings), -numpy.inf, ratings)
+            threshold = numpy.partition(ratings, total_count - count)[total_count - count]
+            better = numpy.flatnonzero(ratings > threshold)
+            equal = numpy.flatnonzero(ratings == threshold)[:count - len(better)]
+            return numpy.sort(numpy.concatenate((better, equal))).tolist()
+
+        return sorted(heapq.nlargest(count, range(total_count), key=ratings.__getitem__))
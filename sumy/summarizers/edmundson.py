@@ -3,7 +3,15 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-from collections import defaultdict
+from collections import Counter, namedtuple
+from itertools import chain
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..models import PreprocessedDocument
 from ..nlp.stemmers import null_stemmer
 from ._summarizer import AbstractSummarizer
 from .edmundson_cue import EdmundsonCueMethod
@@ -15,7 +23,16 @@ from .edmundson_location import EdmundsonLocationMethod
 _EMPTY_SET = frozenset()
 
 
+EdmundsonWeights = namedtuple("EdmundsonWeights", ("cue_weight", "key_weight", "title_weight",
+    "location_weight", "w_h", "w_p1", "w_p2", "w_s1", "w_s2",))
+# defaults are the same as in the summarizer and its location method
+EdmundsonWeights.__new__.__defaults__ = (1.0, 0.0, 1.0, 1.0, 1, 1, 1, 1, 1)
+
+
 class EdmundsonSummarizer(AbstractSummarizer):
+    # columns of the matrix of sentence features
+    FEATURES = ("bonus", "stigma", "key", "title", "first_paragraph",
+        "last_paragraph", "first_sentence", "last_sentence",)
     _bonus_words = _EMPTY_SET
     _stigma_words = _EMPTY_SET
     _null_words = _EMPTY_SET
@@ -62,30 +79,141 @@ class EdmundsonSummarizer(AbstractSummarizer):
         self._null_words = frozenset(map(self.stem_word, collection))
 
     def __call__(self, document, sentences_count):
-        ratings = defaultdict(int)
-
-        if self._cue_weight > 0.0:
-            method = self._build_cue_method_instance()
-            ratings = self._update_ratings(ratings, method.rate_sentences(document))
-        if self._key_weight > 0.0:
-            method = self._build_key_method_instance()
-            ratings = self._update_ratings(ratings, method.rate_sentences(document))
-        if self._title_weight > 0.0:
-            method = self._build_title_method_instance()
-            ratings = self._update_ratings(ratings, method.rate_sentences(document))
-        if self._location_weight > 0.0:
-            method = self._build_location_method_instance()
-            ratings = self._update_ratings(ratings, method.rate_sentences(document))
+        self._ensure_dependencies_installed()
 
-        return self._get_best_sentences(document.sentences, sentences_count, ratings)
-
-    def _update_ratings(self, ratings, new_ratings):
-        assert len(ratings) == 0 or len(ratings) == len(new_ratings)
+        weights = self._get_features_weights()
+        ratings = self._compute_features(document).dot(weights)
 
-        for sentence, rating in new_ratings.items():
-            ratings[sentence] += rating
+        return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
-        return ratings
+    @staticmethod
+    def _ensure_dependencies_installed():
+        if numpy is None:
+            raise ValueError("Edmundson summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+
+    def compute_features(self, document, key_threshold=0.5):
+        """
+        Computes matrix |sentences|×|features| of the document. It can be reused
+        for the summaries with various weights by :meth:`summarize_with_weights`.
+        Columns of the matrix are given by :attr:`FEATURES`.
+
+        :param float key_threshold:
+            Bonus words more frequent than this fraction of the most frequent
+            bonus word are the key words (same as ``weight`` of :meth:`key_method`).
+        """
+        self._ensure_dependencies_installed()
+        return self._compute_features(document, key_threshold=key_threshold)
+
+    def summarize_with_weights(self, document, sentences_count, weights, features=None, key_threshold=0.5):
+        """
+        Summarizes the document with every configuration of weights at once.
+        The features of the document are computed only once (or passed from
+        :meth:`compute_features`) and all configurations are rated by single
+        matrix product.
+
+        :param weights:
+            Iterable of :class:`EdmundsonWeights` configurations.
+        :param numpy.ndarray features:
+            Precomputed features of the document.
+        :param float key_threshold:
+            Threshold of the key words used when the features are not given,
+            see :meth:`compute_features`.
+        :returns list:
+            Summary of the document for every configuration of weights.
+        """
+        self._ensure_dependencies_installed()
+
+        weights = numpy.array([self._get_features_weights(w) for w in weights]).reshape((-1, len(self.FEATURES)))
+        if features is None:
+            features = self._compute_features(document, key_threshold=key_threshold)
+
+        ratings = features.dot(weights.T)
+        return [self._get_best_sentences(document.sentences, sentences_count, r) for r in ratings.T]
+
+    def _get_features_weights(self, weights=None):
+        """
+        Returns weights of the columns of the features matrix combining the enabled
+        methods. The summarizer's weights and default parameters of the methods
+        are used if no :class:`EdmundsonWeights` are given.
+        """
+        if weights is None:
+            weights = EdmundsonWeights(self._cue_weight, self._key_weight, self._title_weight, self._location_weight)
+        else:
+            self._ensure_correct_weights(weights.cue_weight, weights.key_weight,
+                weights.title_weight, weights.location_weight)
+
+        if weights.cue_weight > 0.0:
+            self.__check_bonus_words()
+            self.__check_stigma_words()
+        if weights.key_weight > 0.0:
+            self.__check_bonus_words()
+        if weights.title_weight > 0.0 or weights.location_weight > 0.0:
+            self.__check_null_words()
+
+        cue, location = weights.cue_weight, weights.location_weight
+        # location method rates the title words too
+        return numpy.array([cue, -cue, weights.key_weight, weights.title_weight + location*weights.w_h,
+            location*weights.w_p1, location*weights.w_p2, location*weights.w_s1, location*weights.w_s2],
+            dtype=numpy.float64)
+
+    def _compute_features(self, document, key_threshold=0.5):
+        """
+        Computes matrix |sentences|×|features| in one pass over the document.
+        Every distinct word is stemmed once and the features are:
+
+        - number of bonus and stigma words (cue method)
+        - number of frequent bonus words (key method)
+        - number of non-null words from the headings (title method)
+        - indicators of the first/last paragraph and the first/last sentence
+          in paragraph (location method)
+        """
+        if isinstance(document, PreprocessedDocument):
+            # words are compared by ids of their terms
+            vocabulary = document.vocabulary
+            bonus_words, stigma_words, null_words = (frozenset(vocabulary[w] for w in words if w in vocabulary)
+                for words in (self._bonus_words, self._stigma_words, self._null_words))
+            sentences_words, headings_words = document.sentences_all_terms, document.headings_all_terms
+        else:
+            stems = {}
+            for word in document.words:
+                if word not in stems:
+                    stems[word] = self.stem_word(word)
+
+            bonus_words, stigma_words, null_words = self._bonus_words, self._stigma_words, self._null_words
+            sentences_words = [[stems[w] for w in s.words] for s in document.sentences]
+            headings_words = [[stems[w] for w in h.words] for h in document.headings]
+
+        # frequent bonus words of the document
+        bonus_counts = Counter(w for words in chain(headings_words, sentences_words) for w in words if w in bonus_words)
+        max_bonus_count = max(bonus_counts.values()) if bonus_counts else 0
+        key_words = frozenset(w for w, c in bonus_counts.items() if c/max_bonus_count > key_threshold)
+
+        title_words = frozenset(w for words in headings_words for w in words if w not in null_words)
+
+        features = []
+        sentences_words = iter(sentences_words)
+        paragraphs = document.paragraphs
+        for paragraph_order, paragraph in enumerate(paragraphs):
+            sentences = paragraph.sentences
+            is_first_paragraph = paragraph_order == 0
+            is_last_paragraph = not is_first_paragraph and paragraph_order == len(paragraphs) - 1
+
+            for sentence_order, words in zip(range(len(sentences)), sentences_words):
+                is_first_sentence = sentence_order == 0
+                is_last_sentence = not is_first_sentence and sentence_order == len(sentences) - 1
+
+                features.append((
+                    sum(w in bonus_words for w in words),
+                    sum(w in stigma_words for w in words),
+                    sum(w in key_words for w in words),
+                    sum(w in title_words for w in words),
+                    is_first_paragraph,
+                    is_last_paragraph,
+                    is_first_sentence,
+                    is_last_sentence,
+                ))
+
+        return numpy.array(features, dtype=numpy.float64).reshape((len(features), len(self.FEATURES)))
 
     def cue_method(self, document, sentences_count, bonus_word_value=1, stigma_word_value=1):
         summarization_method = self._build_cue_method_instance()
@@ -5,7 +5,16 @@ from __future__ import division, print_function, unicode_literals
 
 import math
 
-from ._summarizer import AbstractSummarizer
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..models import PreprocessedDocument
+from ._summarizer import AbstractSummarizer, UNSELECTED_RATING
+from ._sparse import CsrMatrix
 
 
 class KLSummarizer(AbstractSummarizer):
@@ -18,11 +27,23 @@ class KLSummarizer(AbstractSummarizer):
     stop_words = frozenset()
 
     def __call__(self, document, sentences_count):
+        self._ensure_dependencies_installed()
+
         sentences = document.sentences
-        ratings = self._compute_ratings(sentences)
+        # only the sentences in summary are picked
+        limit = self._get_items_count(sentences_count, len(sentences))
+        if isinstance(document, PreprocessedDocument):
+            ratings = self._compute_preprocessed_ratings(document, limit)
+        else:
+            ratings = self._compute_ratings(sentences, limit)
 
         return self._get_best_sentences(sentences, sentences_count, ratings)
 
+    @staticmethod
+    def _ensure_dependencies_installed():
+        if numpy is None:
+            raise ValueError("KL-Sum summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+
     @staticmethod
     def _get_all_words_in_doc(sentences):
         return [w for s in sentences for w in s.words]
@@ -108,40 +129,109 @@ class KLSummarizer(AbstractSummarizer):
         """
         return kls.index(min(kls))
 
-    def _compute_ratings(self, sentences):
+    def _compute_ratings(self, sentences, limit=None):
+        """Returns ratings of the sentences by their positions, see :meth:`_compute_ratings_of_words`."""
         word_freq = self.compute_tf(sentences)
-        ratings = {}
-        summary = []
-
-        # make it a list so that it can be modified
-        sentences_list = list(sentences)
-
         # get all content words once for efficiency
         sentences_as_words = [self._get_content_words_in_sentence(s) for s in sentences]
+        # summary words are counted as they are, without the normalization
+        summary_words = [s.words for s in sentences]
 
-        # Removes one sentence per iteration by adding to summary
-        while len(sentences_list) > 0:
-            # will store all the kls values for this pass
-            kls = []
+        return self._compute_ratings_of_words(word_freq, sentences_as_words, summary_words, limit)
 
-            # converts summary to word list
-            summary_as_word_list = self._get_all_words_in_doc(summary)
-
-            for s in sentences_as_words:
-                # calculates the joint frequency through combining the word lists
-                joint_freq = self._joint_freq(s, summary_as_word_list)
+    def _compute_preprocessed_ratings(self, document, limit=None):
+        """
+        Returns ratings of the sentences of :class:`PreprocessedDocument`. Its
+        content terms are used for the frequencies and the sentences, terms
+        of all the words of the picked sentences are counted into the summary.
+        """
+        sentences_terms = document.sentences_terms
+        frequencies = Counter(sentences_terms.ids)
+        terms_count = sum(frequencies.values())
+        word_freq = dict((t, f / terms_count) for t, f in frequencies.items())
 
-                # adds the calculated kl divergence to the list in index = sentence used
-                kls.append(self._kl_divergence(joint_freq, word_freq))
+        return self._compute_ratings_of_words(word_freq, sentences_terms, document.sentences_all_terms, limit)
 
-            # to consider and then add it into the summary
-            index_to_remove = self._find_index_of_best_sentence(kls)
-            best_sentence = sentences_list.pop(index_to_remove)
-            del sentences_as_words[index_to_remove]
-            summary.append(best_sentence)
+    def _compute_ratings_of_words(self, word_freq, sentences_as_words, summary_words, limit=None):
+        """
+        Returns ratings of the sentences given by their content words. Greedily picks
+        the sentence with the smallest KL divergence of the summary extended by the
+        sentence. Words of the picked sentence counted into the summary are given by
+        ``summary_words``. Only counts of the summary words are kept between the picks
+        and all the candidates are scored at once. Sentences not picked within the
+        ``limit`` are rated by :data:`UNSELECTED_RATING`.
+        """
+        vocabulary = dict((w, i) for i, w in enumerate(word_freq))
+        probabilities = numpy.array([word_freq[w] for w in vocabulary], dtype=numpy.float64)
+        log_probabilities = numpy.log(probabilities)
+
+        lengths = numpy.array([len(words) for words in sentences_as_words], dtype=numpy.float64)
+        counts = self._create_count_matrix(sentences_as_words, vocabulary)
+        rows, cols = counts.row_indices(), counts.indices
+        # columns of the words are needed to rescore only items of the words added to summary
+        items_by_cols = numpy.argsort(cols, kind="mergesort")
+        cols_starts = numpy.searchsorted(cols[items_by_cols], numpy.arange(len(vocabulary) + 1))
+
+        summary_counts = numpy.zeros(len(vocabulary))
+        summary_length = 0
+        # contribution of every item (sentence, word) to the KL divergence of the summary
+        # extended by the sentence, words already present in the summary only correct their counts
+        items_kl = probabilities[cols] * (log_probabilities[cols] - numpy.log(counts.data))
+        items_new_probability = probabilities[cols]
+
+        sentences_count = len(sentences_as_words)
+        ratings = [UNSELECTED_RATING] * sentences_count
+        remaining = numpy.ones(sentences_count, dtype=bool)
+        picks_count = sentences_count if limit is None else min(limit, sentences_count)
+        for iteration in range(picks_count):
+            in_summary = summary_counts > 0
+            summary_kl = numpy.sum(probabilities[in_summary] * (log_probabilities[in_summary] - numpy.log(summary_counts[in_summary])))
+            summary_probability = numpy.sum(probabilities[in_summary])
+
+            kls = summary_kl + numpy.bincount(rows, weights=items_kl, minlength=sentences_count)
+            probability = summary_probability + numpy.bincount(rows, weights=items_new_probability, minlength=sentences_count)
+            total_lengths = lengths + summary_length
+            # joint frequencies are empty for the empty sentence and the empty summary
+            kls += numpy.where(total_lengths > 0, probability, 0.0) * numpy.log(numpy.maximum(total_lengths, 1))
+
+            # the best sentence is the one with the smallest kl_divergence
+            kls[~remaining] = numpy.inf
+            index = int(numpy.argmin(kls))
+            remaining[index] = False
 
             # value is the iteration in which it was removed multiplied by -1 so that
             # the first sentences removed (the most important) have highest values
-            ratings[best_sentence] = -1 * len(ratings)
+            ratings[index] = -1 * iteration
+
+            summary_length += len(summary_words[index])
+            touched_cols = set()
+            for word in summary_words[index]:
+                col = vocabulary.get(word)
+                if col is not None:
+                    summary_counts[col] += 1
+                    touched_cols.add(col)
+
+            touched_cols = numpy.array(sorted(touched_cols), dtype=numpy.int64)
+            if len(touched_cols):
+                lengths_of_cols = cols_starts[touched_cols + 1] - cols_starts[touched_cols]
+                offsets = numpy.arange(lengths_of_cols.sum()) - numpy.repeat(numpy.cumsum(lengths_of_cols) - lengths_of_cols, lengths_of_cols)
+                items = items_by_cols[numpy.repeat(cols_starts[touched_cols], lengths_of_cols) + offsets]
+                items_cols = cols[items]
+                items_counts = summary_counts[items_cols]
+                items_kl[items] = probabilities[items_cols] * (numpy.log(items_counts) - numpy.log(items_counts + counts.data[items]))
+                items_new_probability[items] = 0.0
 
         return ratings
+
+    @staticmethod
+    def _create_count_matrix(sentences_as_words, vocabulary):
+        """Creates matrix |sentences|×|words| with counts of the words in the sentences."""
+        rows, cols = [], []
+        for row, words in enumerate(sentences_as_words):
+            for word in words:
+                col = vocabulary.get(word)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+
+        return CsrMatrix.from_coo(rows, cols, numpy.ones(len(rows)), (len(sentences_as_words), len(vocabulary)))
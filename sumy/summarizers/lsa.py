@@ -3,8 +3,7 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-import math
-
+from collections import namedtuple
 from warnings import warn
 
 try:
@@ -16,12 +15,28 @@ try:
     from numpy.linalg import svd as singular_value_decomposition
 except ImportError:
     singular_value_decomposition = None
+from ..models import PreprocessedDocument
 from ._summarizer import AbstractSummarizer
+from ._sparse import CsrMatrix, RankOneUpdatedMatrix
+
+
+MatrixInfo = namedtuple("MatrixInfo", ("shape", "non_zero_count", "density",))
 
 
 class LsaSummarizer(AbstractSummarizer):
     MIN_DIMENSIONS = 3
     REDUCTION_RATIO = 1/1
+    # only the used singular triplets are computed by randomized SVD if the ratio is below 1
+    RANDOMIZED_SVD_OVERSAMPLING = 10
+    RANDOMIZED_SVD_POWER_ITERATIONS = 4
+    RANDOM_SEED = 0
+    # store the term matrix as a sparse matrix, best used with the reduction ratio below 1
+    sparse = False
+    # words are pruned by number of sentences containing them (absolute count or fraction if float)
+    # and only `max_vocabulary` most frequent words are kept
+    min_df = 0
+    max_df = 1.0
+    max_vocabulary = None
     _stop_words = frozenset()
 
     @property
@@ -40,30 +55,69 @@ class LsaSummarizer(AbstractSummarizer):
         if not dictionary:
             return ()
 
+        dictionary = self._prune_dictionary(document, dictionary)
+        # all words pruned
+        if not dictionary:
+            return ()
+
         matrix = self._create_matrix(document, dictionary)
         matrix = self._compute_term_frequency(matrix)
-        u, sigma, v = singular_value_decomposition(matrix, full_matrices=False)
 
-        ranks = iter(self._compute_ranks(sigma, v))
-        return self._get_best_sentences(document.sentences, sentences_count,
-            lambda s: next(ranks))
+        dimensions = self._compute_dimensions(min(matrix.shape))
+        if dimensions < min(matrix.shape):
+            u, sigma, v = self._randomized_svd(matrix, dimensions)
+        else:
+            if self.sparse:
+                matrix = matrix.toarray()
+            u, sigma, v = singular_value_decomposition(matrix, full_matrices=False)
+
+        ranks = self._compute_ranks(sigma, v, dimensions)
+        return self._get_best_sentences(document.sentences, sentences_count, ranks)
+
+    def matrix_info(self, document):
+        """
+        Returns shape, number of non-zero cells and density of the term matrix
+        |words|×|sentences| of the document after pruning of the words. The
+        dense matrix needs 8 bytes per cell and the sparse one about 16 bytes
+        per non-zero cell.
+        """
+        self._ensure_dependecies_installed()
+
+        dictionary = self._prune_dictionary(document, self._create_dictionary(document))
+        matrix = self._create_matrix(document, dictionary, sparse=True)
+
+        cells_count = matrix.shape[0] * matrix.shape[1]
+        density = matrix.nnz / cells_count if cells_count else 0.0
+        return MatrixInfo(matrix.shape, matrix.nnz, density)
 
     def _ensure_dependecies_installed(self):
         if numpy is None:
             raise ValueError("LSA summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
 
     def _create_dictionary(self, document):
-        """Creates mapping key = word, value = row index"""
+        """
+        Creates mapping key = word, value = row index. Words of the preprocessed
+        document are given by ids of their terms.
+        """
+        if isinstance(document, PreprocessedDocument):
+            unique_terms = sorted(frozenset(document.document_terms))
+            return dict((t, i) for i, t in enumerate(unique_terms))
+
         words = map(self.normalize_word, document.words)
         unique_words = frozenset(self.stem_word(w) for w in words if w not in self._stop_words)
 
         return dict((w, i) for i, w in enumerate(unique_words))
 
-    def _create_matrix(self, document, dictionary):
+    def _create_matrix(self, document, dictionary, sparse=None):
         """
         Creates matrix of shape |unique words|×|sentences| where cells
         contains number of occurrences of words (rows) in sentences (cols).
+        The matrix is :class:`CsrMatrix` if ``sparse`` is true, it defaults
+        to the sparse mode of the summarizer.
         """
+        if sparse is None:
+            sparse = self.sparse
+
         sentences = document.sentences
 
         words_count = len(dictionary)
@@ -75,16 +129,78 @@ class LsaSummarizer(AbstractSummarizer):
             )
             warn(message % (words_count, sentences_count))
 
-        # create matrix |unique words|×|sentences| filled with zeroes
-        matrix = numpy.zeros((words_count, sentences_count))
-        for col, sentence in enumerate(sentences):
-            for word in map(self.stem_word, sentence.words):
+        # every occurrence of a dictionary word is given by its flat index into the matrix
+        indices = []
+        for col, stems in enumerate(self._get_sentences_stems(document)):
+            for stem in stems:
                 # only valid words is counted (not stop-words, ...)
-                if word in dictionary:
-                    row = dictionary[word]
-                    matrix[row, col] += 1
+                if stem in dictionary:
+                    indices.append(dictionary[stem] * sentences_count + col)
 
-        return matrix
+        indices = numpy.array(indices, dtype=numpy.int64)
+        if sparse:
+            rows, cols = numpy.divmod(indices, sentences_count)
+            return CsrMatrix.from_coo(rows, cols, numpy.ones(len(indices)), (words_count, sentences_count))
+
+        # weights make the counts float64 directly, without another integer matrix
+        matrix = numpy.bincount(indices, weights=numpy.ones(len(indices)), minlength=words_count * sentences_count)
+        return matrix.reshape((words_count, sentences_count))
+
+    def _get_sentences_stems(self, document):
+        """Yields stems of all the words of every sentence, every distinct word is stemmed once."""
+        if isinstance(document, PreprocessedDocument):
+            for terms in document.sentences_all_terms:
+                yield terms
+            return
+
+        stems = {}
+        for sentence in document.sentences:
+            for word in sentence.words:
+                if word not in stems:
+                    stems[word] = self.stem_word(word)
+            yield [stems[w] for w in sentence.words]
+
+    def _prune_dictionary(self, document, dictionary):
+        """
+        Removes words contained in too few or too many sentences and keeps
+        only ``max_vocabulary`` of the most frequent words. The words are
+        pruned before the matrix is built so it has rows of kept words only.
+        """
+        # integer max_df is an absolute count so only the fraction 1.0 keeps all the words
+        if not self.min_df and isinstance(self.max_df, float) and self.max_df == 1.0 and self.max_vocabulary is None:
+            return dictionary
+
+        occurrences = []
+        sentence_occurrences = []
+        for stems in self._get_sentences_stems(document):
+            rows = [dictionary[stem] for stem in stems if stem in dictionary]
+            occurrences.extend(rows)
+            sentence_occurrences.extend(frozenset(rows))
+
+        words_count = len(dictionary)
+        frequencies = numpy.bincount(numpy.array(occurrences, dtype=numpy.int64), minlength=words_count)
+        document_frequencies = numpy.bincount(numpy.array(sentence_occurrences, dtype=numpy.int64), minlength=words_count)
+
+        sentences_count = len(document.sentences)
+        min_df = self._to_sentences_count(self.min_df, sentences_count)
+        max_df = self._to_sentences_count(self.max_df, sentences_count)
+        rows = numpy.flatnonzero((min_df <= document_frequencies) & (document_frequencies <= max_df))
+
+        if self.max_vocabulary is not None and len(rows) > self.max_vocabulary:
+            most_frequent = numpy.argsort(-frequencies[rows], kind="mergesort")[:self.max_vocabulary]
+            rows = numpy.sort(rows[most_frequent])
+
+        words = [None] * words_count
+        for word, row in dictionary.items():
+            words[row] = word
+
+        return dict((words[row], i) for i, row in enumerate(rows))
+
+    @staticmethod
+    def _to_sentences_count(value, sentences_count):
+        if isinstance(value, float):
+            return value * sentences_count
+        return value
 
     def _compute_term_frequency(self, matrix, smooth=0.4):
         """
@@ -94,29 +210,67 @@ class LsaSummarizer(AbstractSummarizer):
         """
         assert 0.0 <= smooth < 1.0
 
+        if self.sparse:
+            return self._compute_sparse_term_frequency(matrix, smooth)
+
         max_word_frequencies = numpy.max(matrix, axis=0)
-        rows, cols = matrix.shape
-        for row in range(rows):
-            for col in range(cols):
-                max_word_frequency = max_word_frequencies[col]
-                if max_word_frequency != 0:
-                    frequency = matrix[row, col]/max_word_frequency
-                    matrix[row, col] = smooth + (1.0 - smooth)*frequency
+        # columns of sentences without words are kept untouched, the matrix is updated in place
+        cols = max_word_frequencies != 0
+        numpy.divide(matrix, max_word_frequencies, out=matrix, where=cols)
+        matrix *= 1.0 - smooth
+        numpy.add(matrix, smooth, out=matrix, where=cols)
 
         return matrix
 
-    def _compute_ranks(self, sigma, v_matrix):
-        assert len(sigma) == v_matrix.shape[0], "Matrices should be multiplicable"
+    @staticmethod
+    def _compute_sparse_term_frequency(matrix, smooth):
+        """
+        The smoothing makes every cell of non-empty column non-zero so the result
+        is kept as the sparse scaled frequencies plus the rank-one smoothing term.
+        """
+        words_count, sentences_count = matrix.shape
+        max_word_frequencies = numpy.zeros(sentences_count)
+        numpy.maximum.at(max_word_frequencies, matrix.indices, matrix.data)
+
+        cols = max_word_frequencies != 0
+        scales = numpy.where(cols, (1.0 - smooth) / numpy.where(cols, max_word_frequencies, 1.0), 0.0)
+        frequencies = CsrMatrix(matrix.data * scales[matrix.indices], matrix.indices, matrix.indptr, matrix.shape)
 
-        dimensions = max(LsaSummarizer.MIN_DIMENSIONS,
-            int(len(sigma)*LsaSummarizer.REDUCTION_RATIO))
-        powered_sigma = tuple(s**2 if i < dimensions else 0.0
-            for i, s in enumerate(sigma))
+        return RankOneUpdatedMatrix(frequencies, numpy.full(words_count, smooth), cols)
+
+    @staticmethod
+    def _compute_dimensions(singular_values_count):
+        return max(LsaSummarizer.MIN_DIMENSIONS,
+            int(singular_values_count*LsaSummarizer.REDUCTION_RATIO))
+
+    def _randomized_svd(self, matrix, components):
+        """
+        Computes only ``components`` largest singular values and their vectors
+        by the randomized range finder with power iterations. The work is
+        proportional to |words|×|sentences|×components instead of cubic.
+        Source: https://arxiv.org/abs/0909.4061
+        """
+        random = numpy.random.RandomState(self.RANDOM_SEED)
+        samples = min(components + self.RANDOMIZED_SVD_OVERSAMPLING, *matrix.shape)
+
+        # orthonormal basis of the matrix range, the power iterations sharpen the decay of singular values
+        transposed_matrix = matrix.T
+        basis, _ = numpy.linalg.qr(matrix.dot(random.standard_normal((matrix.shape[1], samples))))
+        for _ in range(self.RANDOMIZED_SVD_POWER_ITERATIONS):
+            basis, _ = numpy.linalg.qr(transposed_matrix.dot(basis))
+            basis, _ = numpy.linalg.qr(matrix.dot(basis))
+
+        # small matrix basis^T × matrix has the same largest singular triplets
+        u, sigma, v = singular_value_decomposition(transposed_matrix.dot(basis).T, full_matrices=False)
+        return basis.dot(u[:, :components]), sigma[:components], v[:components]
+
+    def _compute_ranks(self, sigma, v_matrix, dimensions=None):
+        assert len(sigma) == v_matrix.shape[0], "Matrices should be multiplicable"
 
-        ranks = []
-        # iterate over columns of matrix (rows of transposed matrix)
-        for column_vector in v_matrix.T:
-            rank = sum(s*v**2 for s, v in zip(powered_sigma, column_vector))
-            ranks.append(math.sqrt(rank))
+        if dimensions is None:
+            dimensions = self._compute_dimensions(len(sigma))
+        powered_sigma = numpy.array([s**2 if i < dimensions else 0.0
+            for i, s in enumerate(sigma)])
 
-        return ranks
+        # weighted norms of columns of the matrix (rows of transposed matrix)
+        return numpy.sqrt(numpy.dot(powered_sigma, v_matrix**2))
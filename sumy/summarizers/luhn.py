@@ -3,7 +3,14 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-from ..models import TfDocumentModel
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..models import PreprocessedDocument, TermsSequences
 from ._summarizer import AbstractSummarizer
 
 
@@ -22,64 +29,98 @@ class LuhnSummarizer(AbstractSummarizer):
         self._stop_words = frozenset(map(self.normalize_word, words))
 
     def __call__(self, document, sentences_count):
-        words = self._get_significant_words(document.words)
-        return self._get_best_sentences(document.sentences,
-            sentences_count, self.rate_sentence, words)
+        self._ensure_dependencies_installed()
+
+        if isinstance(document, PreprocessedDocument):
+            ratings = self._rate_preprocessed_sentences(document)
+        else:
+            words = self._get_significant_words(document.words)
+            ratings = self._rate_sentences(document.sentences, words)
+
+        return self._get_best_sentences(document.sentences, sentences_count, ratings)
+
+    @staticmethod
+    def _ensure_dependencies_installed():
+        if numpy is None:
+            raise ValueError("Luhn summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
 
     def _get_significant_words(self, words):
         words = map(self.normalize_word, words)
         words = tuple(self.stem_word(w) for w in words if w not in self._stop_words)
 
-        model = TfDocumentModel(words)
+        return self._get_significant_terms(words)
 
-        # take only best `significant_percentage` % words
-        best_words_count = int(len(words) * self.significant_percentage)
-        words = model.most_frequent_terms(best_words_count)
+    def _get_significant_terms(self, terms):
+        frequencies = Counter(terms)
 
-        # take only words contained multiple times in document
-        return tuple(t for t in words if model.term_frequency(t) > 1)
+        # take only best `significant_percentage` % terms, sorted by frequency and the first occurrence
+        best_terms_count = int(len(terms) * self.significant_percentage)
+        terms = sorted(frequencies, key=lambda t: -frequencies[t])
+        if best_terms_count > 0:
+            terms = terms[:best_terms_count]
 
-    def rate_sentence(self, sentence, significant_stems):
-        ratings = self._get_chunk_ratings(sentence, significant_stems)
-        return max(ratings) if ratings else 0
-
-    def _get_chunk_ratings(self, sentence, significant_stems):
-        chunks = []
-        NONSIGNIFICANT_CHUNK = [0]*self.max_gap_size
-
-        in_chunk = False
-        for order, word in enumerate(sentence.words):
-            stem = self.stem_word(word)
-            # new chunk
-            if stem in significant_stems and not in_chunk:
-                in_chunk = True
-                chunks.append([1])
-            # append word to chunk
-            elif in_chunk:
-                is_significant_word = int(stem in significant_stems)
-                chunks[-1].append(is_significant_word)
-
-            # end of chunk
-            if chunks and chunks[-1][-self.max_gap_size:] == NONSIGNIFICANT_CHUNK:
-                in_chunk = False
-
-        return tuple(map(self._get_chunk_rating, chunks))
-
-    def _get_chunk_rating(self, chunk):
-        chunk = self.__remove_trailing_zeros(chunk)
-        words_count = len(chunk)
-        assert words_count > 0
-
-        significant_words = sum(chunk)
-        if significant_words == 1:
-            return 0
-        else:
-            return significant_words**2 / words_count
+        # take only terms contained multiple times in document
+        return frozenset(t for t in terms if frequencies[t] > 1)
 
-    def __remove_trailing_zeros(self, collection):
-        """Removes trailing zeroes from indexable collection of numbers"""
-        index = len(collection) - 1
-        while index >= 0 and collection[index] == 0:
-            index -= 1
-
-        return collection[:index + 1]
+    def rate_sentence(self, sentence, significant_stems):
+        return self._rate_sentences((sentence,), frozenset(significant_stems))[0]
+
+    def _rate_sentences(self, sentences, significant_stems):
+        """
+        Rates every sentence by its best chunk of significant words. Chunk is ended
+        by `max_gap_size` insignificant words in a row. Words of all the sentences
+        are scanned at once as one sequence of integer term ids.
+        """
+        term_ids = {}
+        words_ids = []
+        for sentence in sentences:
+            words_ids.append([term_ids.setdefault(w, len(term_ids)) for w in sentence.words])
+
+        # every word is stemmed only once and looked up in the set of significant stems
+        significant_terms = numpy.zeros(len(term_ids), dtype=bool)
+        for word, term_id in term_ids.items():
+            significant_terms[term_id] = self.stem_word(word) in significant_stems
+
+        return self._rate_sentences_terms(TermsSequences.from_sequences(words_ids), significant_terms)
+
+    def _rate_preprocessed_sentences(self, document):
+        """Rates the sentences of :class:`PreprocessedDocument` by the ids of their terms."""
+        significant_terms = numpy.zeros(len(document.vocabulary), dtype=bool)
+        significant_terms[list(self._get_significant_terms(document.document_terms))] = True
+
+        return self._rate_sentences_terms(document.sentences_all_terms, significant_terms)
+
+    def _rate_sentences_terms(self, sentences_terms, significant_terms):
+        """
+        Rates the sentences given by ids of the terms of their words.
+
+        :param TermsSequences sentences_terms:
+            Ids of the terms of the words of every sentence.
+        :param numpy.ndarray significant_terms:
+            Boolean mask of significant terms indexed by their ids.
+        """
+        is_significant = significant_terms[numpy.asarray(sentences_terms.ids, dtype=numpy.int64)]
+        sentences_lengths = numpy.diff(numpy.asarray(sentences_terms.offsets))
+        words_sentences = numpy.repeat(numpy.arange(len(sentences_terms)), sentences_lengths)
+
+        positions = numpy.flatnonzero(is_significant)
+        positions_sentences = words_sentences[positions]
+        ratings = numpy.zeros(len(sentences_terms))
+        if not len(positions):
+            return ratings
+
+        # new chunk starts in every sentence and after too many insignificant words
+        starts = numpy.ones(len(positions), dtype=bool)
+        starts[1:] = positions_sentences[1:] != positions_sentences[:-1]
+        if self.max_gap_size > 0:
+            starts[1:] |= numpy.diff(positions) - 1 >= self.max_gap_size
+
+        chunks_starts = numpy.flatnonzero(starts)
+        chunks_ends = numpy.append(chunks_starts[1:], len(positions)) - 1
+        significant_words = chunks_ends - chunks_starts + 1
+        # the chunk spans from its first to its last significant word
+        words_counts = positions[chunks_ends] - positions[chunks_starts] + 1
+        chunks_ratings = numpy.where(significant_words > 1, significant_words**2 / words_counts, 0.0)
+
+        numpy.maximum.at(ratings, positions_sentences[chunks_starts], chunks_ratings)
+        return ratings
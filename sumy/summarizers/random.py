@@ -21,4 +21,4 @@ class RandomSummarizer(AbstractSummarizer):
         ratings = list(range(len(sentences)))
         random.shuffle(ratings)
 
-        return dict((s, r) for s, r in zip(sentences, ratings))
+        return ratings
@@ -3,11 +3,14 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-import math
-
-from itertools import combinations
 from collections import defaultdict
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from ._summarizer import AbstractSummarizer
+from ._sparse import CsrMatrix, gram_matrix
 
 
 class ReductionSummarizer(AbstractSummarizer):
@@ -24,33 +27,57 @@ class ReductionSummarizer(AbstractSummarizer):
         self._stop_words = frozenset(map(self.normalize_word, words))
 
     def __call__(self, document, sentences_count):
-        ratings = self.rate_sentences(document)
+        self._ensure_dependencies_installed()
+
+        ratings = self._rate_sentences(document)
         return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
+    @staticmethod
+    def _ensure_dependencies_installed():
+        if numpy is None:
+            raise ValueError("Reduction summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+
     def rate_sentences(self, document):
-        sentences_words = [(s, self._to_words_set(s)) for s in document.sentences]
+        # equal sentences share the rating
         ratings = defaultdict(float)
-
-        for (sentence1, words1), (sentence2, words2) in combinations(sentences_words, 2):
-            rank = self._rate_sentences_edge(words1, words2)
-            ratings[sentence1] += rank
-            ratings[sentence2] += rank
+        for sentence, rank in zip(document.sentences, self._rate_sentences(document)):
+            ratings[sentence] += rank
 
         return ratings
 
-    def _to_words_set(self, sentence):
-        words = map(self.normalize_word, sentence.words)
-        return [self.stem_word(w) for w in words if w not in self._stop_words]
-
-    def _rate_sentences_edge(self, words1, words2):
-        rank = 0
-        for w1 in words1:
-            for w2 in words2:
-                rank += int(w1 == w2)
-
-        if rank == 0:
-            return 0.0
-
-        assert len(words1) > 0 and len(words2) > 0
-        norm = math.log(len(words1)) + math.log(len(words2))
-        return 0.0 if norm == 0.0 else rank / norm
+    def _rate_sentences(self, document):
+        """
+        Rates every sentence by the sum of weights of its edges to all the other
+        sentences. Numbers of common words of all the pairs of sentences are
+        computed at once as a product of the sparse matrix |sentences|×|words|
+        with its transposition, so only the pairs with a common word are visited.
+        """
+        document = self._preprocess(document, self._stop_words)
+        sentences_as_words = document.sentences_terms
+        sentences_count = len(sentences_as_words)
+
+        # terms are integer ids already so the flat buffer of the ids gives the columns
+        lengths = numpy.diff(numpy.asarray(sentences_as_words.offsets))
+        rows = numpy.repeat(numpy.arange(sentences_count), lengths)
+        cols = numpy.asarray(sentences_as_words.ids, dtype=numpy.int64)
+
+        counts = CsrMatrix.from_coo(rows, cols, numpy.ones(len(rows)), (sentences_count, len(document.vocabulary)))
+        overlaps = gram_matrix(counts.row_indices(), counts.indices, counts.data, sentences_count, sparse=True)
+        lengths = lengths.astype(numpy.float64)
+
+        # sentence is not connected to itself
+        rows, cols = overlaps.row_indices(), overlaps.indices
+        edges = rows != cols
+        rows, cols = rows[edges], cols[edges]
+        ranks = self._rate_sentences_edges(overlaps.data[edges], lengths[rows], lengths[cols])
+        return numpy.bincount(rows, weights=ranks, minlength=sentences_count)
+
+    @staticmethod
+    def _rate_sentences_edges(overlaps, lengths1, lengths2):
+        """
+        Rates edges of the sentences with at least one common word by the number
+        of common words divided by sum of logarithms of the sentences lengths.
+        Edges of two single-word sentences are rated by zero.
+        """
+        norms = numpy.log(lengths1) + numpy.log(lengths2)
+        return numpy.where(norms == 0.0, 0.0, overlaps / numpy.where(norms == 0.0, 1.0, norms))
@@ -3,7 +3,12 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-from ._summarizer import AbstractSummarizer
+import heapq
+
+from collections import Counter
+
+from ..models import PreprocessedDocument
+from ._summarizer import AbstractSummarizer, UNSELECTED_RATING
 
 
 class SumBasicSummarizer(AbstractSummarizer):
@@ -24,7 +29,12 @@ class SumBasicSummarizer(AbstractSummarizer):
 
     def __call__(self, document, sentences_count):
         sentences = document.sentences
-        ratings = self._compute_ratings(sentences)
+        # only the sentences in summary are picked
+        limit = self._get_items_count(sentences_count, len(sentences))
+        if isinstance(document, PreprocessedDocument):
+            ratings = self._compute_preprocessed_ratings(document, limit)
+        else:
+            ratings = self._compute_ratings(sentences, limit)
         return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
     def _get_all_words_in_doc(self, sentences):
@@ -84,37 +94,71 @@ class SumBasicSummarizer(AbstractSummarizer):
             word_freq[w] *= word_freq[w]
         return word_freq
 
-    def _find_index_of_best_sentence(self, word_freq, sentences_as_words):
-        min_possible_freq = -1
-        max_value = min_possible_freq
-        best_sentence_index = 0
-        for i, words in enumerate(sentences_as_words):
-            word_freq_avg = self._compute_average_probability_of_words(word_freq, words)
-            if word_freq_avg > max_value:
-                max_value = word_freq_avg
-                best_sentence_index = i
-        return best_sentence_index
-
-    def _compute_ratings(self, sentences):
+    def _compute_ratings(self, sentences, limit=None):
+        """Returns ratings of the sentences by their positions, see :meth:`_compute_ratings_of_words`."""
         word_freq = self._compute_tf(sentences)
-        ratings = {}
-
-        # make it a list so that it can be modified
-        sentences_list = list(sentences)
-
         # get all content words once for efficiency
         sentences_as_words = [self._get_content_words_in_sentence(s) for s in sentences]
 
+        return self._compute_ratings_of_words(word_freq, sentences_as_words, limit)
+
+    def _compute_preprocessed_ratings(self, document, limit=None):
+        """Returns ratings of the sentences of :class:`PreprocessedDocument` by its content terms."""
+        sentences_terms = document.sentences_terms
+        frequencies = Counter(sentences_terms.ids)
+        terms_count = sum(frequencies.values())
+        word_freq = dict((t, f / terms_count) for t, f in frequencies.items())
+
+        return self._compute_ratings_of_words(word_freq, sentences_terms, limit)
+
+    def _compute_ratings_of_words(self, word_freq, sentences_as_words, limit=None):
+        """
+        Returns ratings of the sentences given by their content words. Greedily picks
+        the sentence with the highest average probability of its words.
+        Sentences not picked within the ``limit`` are rated by :data:`UNSELECTED_RATING`.
+        Picking a sentence changes only probabilities of its own words so only the
+        sentences sharing a word with it are rescored. Outdated scores are left
+        in the heap and skipped when popped.
+        """
+        ratings = {}
+        sentences_by_word = self._create_inverted_index(sentences_as_words)
+
+        # the highest score first and the first sentence in document order for the same scores
+        scores = [self._compute_average_probability_of_words(word_freq, words) for words in sentences_as_words]
+        heap = [(-score, i) for i, score in enumerate(scores)]
+        heapq.heapify(heap)
+
         # Removes one sentence per iteration by adding to summary
-        while len(sentences_list) > 0:
-            best_sentence_index = self._find_index_of_best_sentence(word_freq, sentences_as_words)
-            best_sentence = sentences_list.pop(best_sentence_index)
+        picks_count = len(sentences_as_words) if limit is None else min(limit, len(sentences_as_words))
+        while len(ratings) < picks_count:
+            score, best_sentence_index = heapq.heappop(heap)
+            if best_sentence_index in ratings or -score != scores[best_sentence_index]:
+                continue
 
             # value is the iteration in which it was removed multiplied by -1 so that the first sentences removed (the most important) have highest values
-            ratings[best_sentence] = -len(ratings)
+            ratings[best_sentence_index] = -len(ratings)
 
             # update probabilities
-            best_sentence_words = sentences_as_words.pop(best_sentence_index)
+            best_sentence_words = sentences_as_words[best_sentence_index]
             self._update_tf(word_freq, best_sentence_words)
 
-        return ratings
+            affected_indexes = set()
+            for word in set(best_sentence_words):
+                affected_indexes.update(sentences_by_word[word])
+
+            for i in affected_indexes:
+                if i not in ratings:
+                    scores[i] = self._compute_average_probability_of_words(word_freq, sentences_as_words[i])
+                    heapq.heappush(heap, (-scores[i], i))
+
+        return [ratings.get(i, UNSELECTED_RATING) for i in range(len(sentences_as_words))]
+
+    @staticmethod
+    def _create_inverted_index(sentences_as_words):
+        """Creates mapping key = word, value = indexes of sentences containing the word"""
+        sentences_by_word = {}
+        for i, words in enumerate(sentences_as_words):
+            for word in words:
+                sentences_by_word.setdefault(word, set()).add(i)
+
+        return sentences_by_word
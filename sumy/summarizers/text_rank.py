@@ -3,14 +3,13 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-import math
-
 try:
     import numpy
 except ImportError:
     numpy = None
 
 from ._summarizer import AbstractSummarizer
+from ._sparse import CsrMatrix, gram_matrix
 
 
 class TextRankSummarizer(AbstractSummarizer):
@@ -20,6 +19,8 @@ class TextRankSummarizer(AbstractSummarizer):
     """
     epsilon = 1e-4
     damping = 0.85
+    # store the graph as a sparse matrix so the memory is proportional to the number of its edges
+    sparse = False
     # small number to prevent zero-division error, see https://github.com/miso-belica/sumy/issues/112
     _ZERO_DIVISION_PREVENTION = 1e-7
     _stop_words = frozenset()
@@ -37,7 +38,7 @@ class TextRankSummarizer(AbstractSummarizer):
         if not document.sentences:
             return ()
 
-        ratings = self.rate_sentences(document)
+        ratings = self._rate_sentences(document)
         return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
     @staticmethod
@@ -46,10 +47,17 @@ class TextRankSummarizer(AbstractSummarizer):
             raise ValueError("LexRank summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
 
     def rate_sentences(self, document):
-        matrix = self._create_matrix(document)
-        ranks = self.power_method(matrix, self.epsilon)
+        ranks = self._rate_sentences(document)
         return {sent: rank for sent, rank in zip(document.sentences, ranks)}
 
+    def _rate_sentences(self, document):
+        """Returns ranks of the sentences by their positions in document."""
+        if self.sparse:
+            matrix = self._create_sparse_matrix(document)
+        else:
+            matrix = self._create_matrix(document)
+        return self.power_method(matrix, self.epsilon, self.damping)
+
     def _create_matrix(self, document):
         """Create a stochastic matrix for TextRank.
 
@@ -57,58 +65,93 @@ class TextRankSummarizer(AbstractSummarizer):
         and j, where the similarity is computed as the number of common words between them, divided
         by their sum of logarithm of their lengths. After such matrix is created, it is turned into
         a stochastic matrix by normalizing over columns i.e. making the columns sum to one. TextRank
-        uses PageRank algorithm with damping, so a damping factor is incorporated as explained in
-        TextRank's paper. The resulting matrix is a stochastic matrix ready for power method.
+        uses PageRank algorithm with damping, but the damping is not incorporated into the matrix.
+        It's applied in every step of the power method instead so the dense matrix of random moves
+        is never allocated.
         """
-        sentences_as_words = [self._to_words_set(sent) for sent in document.sentences]
-        sentences_count = len(sentences_as_words)
-        weights = numpy.zeros((sentences_count, sentences_count))
+        overlaps, lengths = self._compute_overlaps(document, sparse=False)
 
-        for i, words_i in enumerate(sentences_as_words):
-            for j in range(i, sentences_count):
-                rating = self._rate_sentences_edge(words_i, sentences_as_words[j])
-                weights[i, j] = rating
-                weights[j, i] = rating
+        # only the sentences with common words are connected
+        rows, cols = numpy.nonzero(overlaps)
+        weights = overlaps
+        weights[rows, cols] = self._rate_sentences_edges(overlaps[rows, cols], lengths[rows], lengths[cols])
 
         weights /= (weights.sum(axis=1)[:, numpy.newaxis] + self._ZERO_DIVISION_PREVENTION)
+        return weights
+
+    def _create_sparse_matrix(self, document):
+        """Create a sparse stochastic matrix for TextRank.
 
-        # In the original paper, the probability of randomly moving to any of the vertices
-        # is NOT divided by the number of vertices. Here we do divide it so that the power
-        # method works; without this division, the stationary probability blows up. This
-        # should not affect the ranking of the vertices so we can use the resulting stationary
-        # probability as is without any postprocessing.
-        return numpy.full((sentences_count, sentences_count), (1.-self.damping) / sentences_count) \
-            + self.damping * weights
+        Only the edges with non-zero weight are stored, normalized the same way as in
+        :meth:`_create_matrix`.
+        """
+        overlaps, lengths = self._compute_overlaps(document, sparse=True)
+
+        rows, cols = overlaps.row_indices(), overlaps.indices
+        data = self._rate_sentences_edges(overlaps.data, lengths[rows], lengths[cols])
+        weights = CsrMatrix(data, cols, overlaps.indptr, overlaps.shape)
+
+        return weights.scale_rows(1.0 / (weights.row_sums() + self._ZERO_DIVISION_PREVENTION))
 
-    def _to_words_set(self, sentence):
-        words = map(self.normalize_word, sentence.words)
-        return [self.stem_word(w) for w in words if w not in self._stop_words]
+    def _compute_overlaps(self, document, sparse):
+        """Count common words of every pair of sentences.
+
+        Sentences are represented as rows of sparse matrix |sentences|×|words| with number of
+        occurrences of the words in the sentences. The number of common words of two sentences
+        is a dot product of their rows, so all of them are computed as a product of the matrix
+        with its transposition.
+
+        :returns pair:
+            Matrix of shape |sentences|×|sentences| and number of words of every sentence.
+        """
+        document = self._preprocess(document, self._stop_words)
+        sentences_as_words = document.sentences_terms
+        sentences_count = len(sentences_as_words)
+
+        # terms are integer ids already so the flat buffer of the ids gives the columns
+        lengths = numpy.diff(numpy.asarray(sentences_as_words.offsets))
+        rows = numpy.repeat(numpy.arange(sentences_count), lengths)
+        cols = numpy.asarray(sentences_as_words.ids, dtype=numpy.int64)
+
+        counts = CsrMatrix.from_coo(rows, cols, numpy.ones(len(rows)), (sentences_count, len(document.vocabulary)))
+        overlaps = gram_matrix(counts.row_indices(), counts.indices, counts.data, sentences_count, sparse=sparse)
+        lengths = lengths.astype(numpy.float64)
+
+        return overlaps, lengths
 
     @staticmethod
-    def _rate_sentences_edge(words1, words2):
-        rank = sum(words2.count(w) for w in words1)
-        if rank == 0:
-            return 0.0
-
-        assert len(words1) > 0 and len(words2) > 0
-        norm = math.log(len(words1)) + math.log(len(words2))
-        if numpy.isclose(norm, 0.):
-            # This should only happen when words1 and words2 only have a single word.
-            # Thus, rank can only be 0 or 1.
-            assert rank in (0, 1)
-            return float(rank)
-        else:
-            return rank / norm
+    def _rate_sentences_edges(overlaps, lengths1, lengths2):
+        """Rate edges of the sentences with at least one common word.
+
+        The rating is the number of common words divided by sum of logarithms of the sentences
+        lengths. The sum is zero only when both sentences have a single word. Thus, the number
+        of common words can only be 1 and it's used as is.
+        """
+        norms = numpy.log(lengths1) + numpy.log(lengths2)
+        single_words = numpy.isclose(norms, 0.)
+        return numpy.where(single_words, overlaps, overlaps / numpy.where(single_words, 1.0, norms))
 
     @staticmethod
-    def power_method(matrix, epsilon):
+    def power_method(matrix, epsilon, damping=1.0):
+        """Compute stationary probability of the stochastic matrix.
+
+        The matrix may be dense ``numpy.ndarray`` or sparse :class:`CsrMatrix`. The random move
+        to any vertex with probability ``1 - damping`` is added in every iteration so it doesn't
+        have to be stored in the matrix. Default damping expects it's already there.
+
+        In the original paper, the probability of randomly moving to any of the vertices
+        is NOT divided by the number of vertices. Here we do divide it so that the power
+        method works; without this division, the stationary probability blows up. This
+        should not affect the ranking of the vertices so we can use the resulting stationary
+        probability as is without any postprocessing.
+        """
         transposed_matrix = matrix.T
         sentences_count = len(matrix)
         p_vector = numpy.array([1.0 / sentences_count] * sentences_count)
         lambda_val = 1.0
 
         while lambda_val > epsilon:
-            next_p = numpy.dot(transposed_matrix, p_vector)
+            next_p = damping * transposed_matrix.dot(p_vector) + (1.0 - damping) * p_vector.sum() / sentences_count
             lambda_val = numpy.linalg.norm(numpy.subtract(next_p, p_vector))
             p_vector = next_p
 
@@ -6,8 +6,10 @@ from __future__ import division, print_function, unicode_literals
 import sys
 import requests
 import pkgutil
+import threading
 
 from functools import wraps
+from collections import OrderedDict, namedtuple
 from contextlib import closing
 from os.path import dirname, abspath, join
 from ._compat import to_string, to_unicode, string_types
@@ -56,6 +58,85 @@ def cached_property(getter):
     return property(decorator)
 
 
+# marks keys missing in the cache since ``None`` may be a cached value
+_MISSING = object()
+CacheInfo = namedtuple("CacheInfo", ("hits", "misses", "evictions", "size", "max_size",))
+
+
+class LruCache(object):
+    """
+    Memoizes results of the function with single hashable argument. Only
+    ``max_size`` of the most recently used results are kept. The cache is
+    thread-safe and counts its hits, misses and evictions.
+
+    The hits take no lock and don't reorder the values, they only mark the
+    value as used. The least recently used value is approximated by the
+    "second chance" algorithm - the oldest value is evicted only if it was
+    not used since it was stored or moved to the end last time. The hits
+    may be counted imprecisely when the cache is used by more threads.
+    """
+    def __init__(self, function, max_size):
+        self._function = function
+        self._max_size = max(0, int(max_size))
+        self._values = OrderedDict()
+        self._used_keys = set()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size):
+        with self._lock:
+            self._max_size = max(0, int(max_size))
+            self._evict()
+
+    def __call__(self, key):
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            self._used_keys.add(key)
+            self.hits += 1
+            return value
+
+        value = self._function(key)
+        with self._lock:
+            self.misses += 1
+            self._values[key] = value
+            self._used_keys.discard(key)
+            self._evict()
+
+        return value
+
+    def _evict(self):
+        while len(self._values) > self._max_size:
+            key, value = self._values.popitem(last=False)
+            if key in self._used_keys:
+                # used values get the second chance at the end of the queue
+                self._used_keys.discard(key)
+                self._values[key] = value
+            else:
+                self.evictions += 1
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._values), self._max_size)
+
+    def clear(self):
+        """Removes all the values and resets the counters."""
+        with self._lock:
+            self._values.clear()
+            self._used_keys.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return to_string("<LruCache: %r>" % (self.info(),))
+
+
 def expand_resource_path(path):
     directory = dirname(sys.modules["sumy"].__file__)
     directory = abspath(directory)
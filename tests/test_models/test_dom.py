@@ -86,6 +86,17 @@ def test_same_sentences_equal():
     assert sentence1 == sentence2
 
 
+def test_sentence_with_words_tokenized_in_advance():
+    class FailingTokenizer(object):
+        def to_words(self, sentence):
+            raise AssertionError("Words should not be tokenized again")
+
+    sentence = Sentence("Word another.", FailingTokenizer())
+    sentence.words = ("Word", "another")
+
+    assert sentence.words == ("Word", "another")
+
+
 def test_sentences_with_same_words_in_different_order_are_different():
     sentence1 = Sentence("word another", Tokenizer("czech"))
     sentence2 = Sentence("another word", Tokenizer("czech"))
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from sumy.models import PreprocessedDocument, Vocabulary
+from sumy.nlp.stemmers import Stemmer
+from sumy.summarizers.edmundson import EdmundsonSummarizer
+from sumy.summarizers.kl import KLSummarizer
+from sumy.summarizers.lex_rank import LexRankSummarizer
+from sumy.summarizers.lsa import LsaSummarizer
+from sumy.summarizers.luhn import LuhnSummarizer
+from sumy.summarizers.random import RandomSummarizer
+from sumy.summarizers.reduction import ReductionSummarizer
+from sumy.summarizers.sum_basic import SumBasicSummarizer
+from sumy.summarizers.text_rank import TextRankSummarizer
+from ..utils import build_document, build_document_from_string
+
+
+def test_stemmer_has_to_be_callable():
+    with pytest.raises(ValueError):
+        PreprocessedDocument(build_document(), "stemmer")
+
+
+def test_same_structure_as_document():
+    document = build_document_from_string("""
+        # Heading
+        First sentence.
+        Second sentence.
+
+        Third sentence.
+    """)
+    preprocessed = PreprocessedDocument(document)
+
+    assert preprocessed.document is document
+    assert preprocessed.paragraphs == document.paragraphs
+    assert preprocessed.sentences == document.sentences
+    assert preprocessed.headings == document.headings
+    assert preprocessed.words == document.words
+
+
+def test_terms_of_sentences():
+    document = build_document(
+        ("The Cat sat", "the cat and THE dog"),
+        ("Dogs sat",),
+    )
+    preprocessed = PreprocessedDocument(document, stop_words=("the", "And"))
+
+    assert preprocessed.terms == ("the", "cat", "sat", "and", "dog", "dogs")
+    assert [preprocessed.vocabulary[t] for t in preprocessed.terms] == [0, 1, 2, 3, 4, 5]
+    assert _to_lists(preprocessed.sentences_terms) == [[1, 2], [1, 4], [5, 2]]
+    assert _to_lists(preprocessed.sentences_all_terms) == [[0, 1, 2], [0, 1, 3, 0, 4], [5, 2]]
+    assert list(preprocessed.document_terms) == [1, 2, 1, 4, 5, 2]
+    assert preprocessed.sentences_counts == ({1: 1, 2: 1}, {1: 1, 4: 1}, {5: 1, 2: 1})
+
+
+def test_terms_of_headings():
+    document = build_document_from_string("""
+        # The Heading
+        Sentence with the heading
+    """)
+    preprocessed = PreprocessedDocument(document, stop_words=("the", "with"))
+
+    heading, sentence = preprocessed.vocabulary["heading"], preprocessed.vocabulary["sentence"]
+    assert _to_lists(preprocessed.headings_terms) == [[heading]]
+    assert _to_lists(preprocessed.headings_all_terms) == [[preprocessed.vocabulary["the"], heading]]
+    assert _to_lists(preprocessed.sentences_terms) == [[sentence, heading]]
+    assert list(preprocessed.document_terms) == [heading, sentence, heading]
+
+
+def test_words_are_stemmed():
+    document = build_document(("Dogs are running", "The dog runs"))
+    preprocessed = PreprocessedDocument(document, Stemmer("english"), ("are", "the"))
+
+    assert [[preprocessed.terms[t] for t in terms] for terms in preprocessed.sentences_terms] == [
+        ["dog", "run"], ["dog", "run"],
+    ]
+
+
+def test_empty_document():
+    preprocessed = PreprocessedDocument(build_document())
+
+    assert preprocessed.terms == ()
+    assert len(preprocessed.sentences_terms) == 0
+    assert len(preprocessed.document_terms) == 0
+
+
+def test_shared_vocabulary():
+    vocabulary = Vocabulary()
+    first = PreprocessedDocument(build_document(("Cat and dog",)), vocabulary=vocabulary)
+    second = PreprocessedDocument(build_document(("Dog and bird",)), vocabulary=vocabulary)
+
+    assert first.vocabulary is second.vocabulary is vocabulary
+    assert vocabulary.terms == ("cat", "and", "dog", "bird")
+    assert _to_lists(first.sentences_terms) == [[0, 1, 2]]
+    assert _to_lists(second.sentences_terms) == [[2, 1, 3]]
+
+
+def test_summarizers_share_vocabulary():
+    vocabulary = Vocabulary()
+    documents = [
+        build_document(("First sentence about cats", "Second sentence about dogs", "Cats and dogs")),
+        build_document(("Birds sing", "Cats chase birds", "Dogs chase cats and birds")),
+    ]
+
+    for document in documents:
+        preprocessed = PreprocessedDocument(document, vocabulary=vocabulary)
+        for summarizer in (LexRankSummarizer(), LsaSummarizer(), LuhnSummarizer(), TextRankSummarizer()):
+            assert summarizer(preprocessed, 2) == summarizer(document, 2)
+
+
+def _to_lists(sequences):
+    return [list(s) for s in sequences]
+
+
+def _build_edmundson_summarizer(stemmer):
+    summarizer = EdmundsonSummarizer(stemmer, key_weight=1.0)
+    summarizer.bonus_words = ("sentence", "word", "summary")
+    summarizer.stigma_words = ("another", "nothing")
+    summarizer.null_words = ("the", "a", "of")
+    return summarizer
+
+
+@pytest.mark.parametrize("summarizer_class", [
+    EdmundsonSummarizer,
+    KLSummarizer,
+    LexRankSummarizer,
+    LsaSummarizer,
+    LuhnSummarizer,
+    ReductionSummarizer,
+    SumBasicSummarizer,
+    TextRankSummarizer,
+])
+def test_summarizers_accept_preprocessed_document(summarizer_class):
+    document = build_document_from_string("""
+        # a summary of the sentences
+        the first sentence is about the summary of words
+        the second sentence has more words than the first sentence
+        another sentence with nothing in common
+
+        sentence in the second paragraph repeats the words of the summary
+        summary of the sentence is the best summary
+        last sentence of the document
+    """)
+    stemmer = Stemmer("english")
+    stop_words = ("the", "a", "of", "is", "in", "with")
+
+    if summarizer_class is EdmundsonSummarizer:
+        summarizer = _build_edmundson_summarizer(stemmer)
+    else:
+        summarizer = summarizer_class(stemmer)
+        summarizer.stop_words = stop_words
+
+    preprocessed = PreprocessedDocument(document, stemmer, stop_words)
+    for count in (1, 3, 5):
+        assert summarizer(preprocessed, count) == summarizer(document, count)
+
+
+def test_random_summarizer_accepts_preprocessed_document():
+    document = build_document(("First sentence", "Second sentence"), ("Third sentence",))
+
+    summary = RandomSummarizer()(PreprocessedDocument(document), 2)
+    assert len(summary) == 2
+    assert all(s in document.sentences for s in summary)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import numpy
+import pytest
+
+from sumy.models import TermsSequences, Vocabulary
+
+
+def test_terms_are_interned_to_dense_ids():
+    vocabulary = Vocabulary(("cat", "dog"))
+
+    assert vocabulary.add("dog") == 1
+    assert vocabulary.add("bird") == 2
+    assert vocabulary.add("cat") == 0
+    assert vocabulary.terms == ("cat", "dog", "bird")
+    assert list(vocabulary) == ["cat", "dog", "bird"]
+    assert len(vocabulary) == 3
+
+
+def test_lookup_of_terms():
+    vocabulary = Vocabulary(("cat", "dog"))
+
+    assert vocabulary["dog"] == 1
+    assert vocabulary.get("dog") == 1
+    assert vocabulary.get("bird") is None
+    assert vocabulary.get("bird", -1) == -1
+    assert vocabulary.term(0) == "cat"
+    assert "cat" in vocabulary
+    assert "bird" not in vocabulary
+    with pytest.raises(KeyError):
+        vocabulary["bird"]
+
+
+def test_terms_to_compact_ids():
+    vocabulary = Vocabulary(("cat",))
+    ids = vocabulary.to_ids(("dog", "cat", "dog"))
+
+    assert ids.itemsize == 4
+    assert list(ids) == [1, 0, 1]
+    assert vocabulary.terms == ("cat", "dog")
+
+
+def test_terms_sequences():
+    sequences = TermsSequences.from_sequences([[1, 2], [], [3, 1, 0]])
+
+    assert len(sequences) == 3
+    assert [list(s) for s in sequences] == [[1, 2], [], [3, 1, 0]]
+    assert list(sequences[2]) == [3, 1, 0]
+    assert list(sequences[-3]) == [1, 2]
+    assert [list(s) for s in sequences[1:]] == [[], [3, 1, 0]]
+    assert sequences.lengths() == [2, 0, 3]
+    with pytest.raises(IndexError):
+        sequences[3]
+
+
+def test_terms_sequences_as_numpy_arrays():
+    sequences = TermsSequences.from_sequences([[1, 2], [3]])
+
+    assert numpy.asarray(sequences.ids).tolist() == [1, 2, 3]
+    assert numpy.asarray(sequences.ids).dtype == numpy.int32
+    assert numpy.diff(numpy.asarray(sequences.offsets)).tolist() == [2, 1]
+
+
+def test_empty_terms_sequences():
+    sequences = TermsSequences.from_sequences([])
+
+    assert len(sequences) == 0
+    assert list(sequences) == []
+    assert numpy.asarray(sequences.ids).tolist() == []
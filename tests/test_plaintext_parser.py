@@ -65,3 +65,57 @@ def test_parse_plaintext_long():
 
     assert len(document.paragraphs[4].headings) == 0
     assert len(document.paragraphs[4].sentences) == 1
+
+
+class _CountingTokenizer(object):
+    def __init__(self, tokenizer):
+        self._tokenizer = tokenizer
+        self.calls = []
+
+    def to_sentences(self, paragraph):
+        self.calls.append("to_sentences")
+        return self._tokenizer.to_sentences(paragraph)
+
+    def to_words(self, sentence):
+        self.calls.append("to_words")
+        return self._tokenizer.to_words(sentence)
+
+    def to_sentences_batch(self, paragraphs):
+        self.calls.append("to_sentences_batch")
+        return self._tokenizer.to_sentences_batch(paragraphs)
+
+    def to_words_batch(self, sentences):
+        self.calls.append("to_words_batch")
+        return self._tokenizer.to_words_batch(sentences)
+
+
+def test_document_is_tokenized_by_batches():
+    tokenizer = _CountingTokenizer(Tokenizer("czech"))
+    parser = PlaintextParser.from_string("""
+        Ako sa máš? Ja dobre!
+
+        NADPIS
+        A toto je text pod ním.
+        A tak ďalej...
+    """, tokenizer)
+
+    document = parser.document
+    assert tokenizer.calls == ["to_sentences_batch", "to_words_batch"]
+
+    assert len(document.sentences) == 4
+    assert document.headings[0].words == ("NADPIS",)
+    assert document.sentences[2].words == ("A", "toto", "je", "text", "pod", "ním")
+    assert tokenizer.calls == ["to_sentences_batch", "to_words_batch"]
+
+
+def test_tokenizer_without_batch_methods():
+    class SimpleTokenizer(object):
+        def to_sentences(self, paragraph):
+            return paragraph.split(".")
+
+        def to_words(self, sentence):
+            return tuple(sentence.split())
+
+    document = PlaintextParser.from_string("First sentence. Second one.", SimpleTokenizer()).document
+
+    assert [s.words for s in document.sentences] == [("First", "sentence"), ("Second", "one")]
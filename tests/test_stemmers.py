@@ -56,3 +56,30 @@ def test_greek_stemmer():
 def test_swedish_stemmer():
     swedish_stemmer = Stemmer("swedish")
     assert "sov" == swedish_stemmer("sover")
+
+
+def test_cached_stemmer():
+    cache = Stemmer.get_cache("english")
+    cache.clear()
+    stemmer = Stemmer("english", cache=True)
+
+    assert "beauti" == stemmer("beautiful")
+    assert "beauti" == stemmer("beautiful")
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_stemmers_share_cache_of_language():
+    assert Stemmer.get_cache("en") is Stemmer.get_cache("english")
+    assert Stemmer.get_cache("english") is not Stemmer.get_cache("german")
+
+    cache = Stemmer.get_cache("german")
+    cache.clear()
+    Stemmer("german", cache=True)("sterben")
+    Stemmer("de", cache=True)("sterben")
+    assert cache.info()[:2] == (1, 1)
+
+
+def test_cached_stemmer_of_missing_language():
+    with pytest.raises(LookupError):
+        Stemmer("klingon", cache=True)
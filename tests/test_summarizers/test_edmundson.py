@@ -4,8 +4,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+import sumy.summarizers.edmundson as edmundson_module
 from sumy._compat import to_unicode
-from sumy.summarizers.edmundson import EdmundsonSummarizer
+from sumy.summarizers.edmundson import EdmundsonSummarizer, EdmundsonWeights
 from ..utils import build_document, build_document_from_string
 
 
@@ -447,3 +448,121 @@ def test_location_method_2():
         "hb hc hd = 3 + 1 + 0 = 4",
         "ha hb = 2 + 1 + 0 = 3",
     ]
+
+
+def test_numpy_not_installed():
+    summarizer = EdmundsonSummarizer(cue_weight=0, key_weight=0, title_weight=0, location_weight=0)
+
+    numpy = edmundson_module.numpy
+    edmundson_module.numpy = None
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
+
+    edmundson_module.numpy = numpy
+
+
+def test_features_matrix():
+    document = build_document_from_string("""
+        # Title of cool document
+        Cool sentence is bad
+        Middle sentence
+        Cool title is cool
+
+        # Second heading
+        Bad heading sentence
+    """)
+    summarizer = EdmundsonSummarizer()
+    summarizer.bonus_words = ("cool", "sentence")
+    summarizer.stigma_words = ("bad",)
+    summarizer.null_words = ("of", "is")
+
+    features = summarizer._compute_features(document)
+
+    assert features.tolist() == [
+        [2, 1, 2, 1, 1, 0, 1, 0],
+        [1, 0, 1, 0, 1, 0, 0, 0],
+        [2, 0, 2, 3, 1, 0, 0, 1],
+        [1, 1, 1, 1, 0, 1, 1, 0],
+    ]
+    # "sentence" is not frequent enough to be the key word
+    assert summarizer.compute_features(document, key_threshold=0.8)[:, 2].tolist() == [1, 0, 2, 0]
+
+
+def test_methods_are_combined_by_weights():
+    document = build_document_from_string("""
+        # Heading
+        Bad sentence first
+        Good sentence in the middle
+        Heading with bad words at the end
+    """)
+    summarizer = EdmundsonSummarizer(cue_weight=3, key_weight=0, title_weight=2, location_weight=0.5)
+    summarizer.bonus_words = ("good",)
+    summarizer.stigma_words = ("bad",)
+    summarizer.null_words = ("with",)
+
+    ratings = summarizer._compute_features(document).dot(summarizer._get_features_weights())
+
+    assert ratings.tolist() == [-3 + 0.5 + 0.5, 3 + 0.5, -3 + 2.5 + 0.5 + 0.5]
+
+
+def _build_weights_document():
+    return build_document_from_string("""
+        # Heading of the story
+        Bad sentence first
+        Good sentence in the middle
+        Heading with bad words at the end
+
+        # Another part of the story
+        Story goes on with good words
+        Something bad happened
+        The end of the good story
+    """)
+
+
+def test_summarize_with_weights_as_separate_summarizers():
+    document = _build_weights_document()
+    configurations = [
+        EdmundsonWeights(),
+        EdmundsonWeights(cue_weight=0.0, title_weight=2.0),
+        EdmundsonWeights(cue_weight=2.0, key_weight=1.0, location_weight=0.5),
+        EdmundsonWeights(cue_weight=0.0, title_weight=0.0, location_weight=0.0),
+    ]
+
+    summaries = []
+    for weights in configurations:
+        summarizer = EdmundsonSummarizer(cue_weight=weights.cue_weight, key_weight=weights.key_weight,
+            title_weight=weights.title_weight, location_weight=weights.location_weight)
+        _set_words(summarizer)
+        summaries.append(summarizer(document, 3))
+
+    summarizer = _set_words(EdmundsonSummarizer())
+    features = summarizer.compute_features(document)
+
+    assert summarizer.summarize_with_weights(document, 3, configurations) == summaries
+    assert summarizer.summarize_with_weights(document, 3, configurations, features) == summaries
+
+
+def test_summarize_with_location_weights_as_location_method():
+    document = _build_weights_document()
+    summarizer = _set_words(EdmundsonSummarizer())
+    location_weights = [(1, 1, 1, 1, 1), (2, 0, 0, 1, 1), (0, 3, 1, 0, 2), (1, 0, 2, 2, 0)]
+    configurations = [EdmundsonWeights(0.0, 0.0, 0.0, 1.0, *w) for w in location_weights]
+
+    summaries = summarizer.summarize_with_weights(document, 2, configurations)
+
+    assert summaries == [summarizer.location_method(document, 2, *w) for w in location_weights]
+
+
+def test_summarize_with_negative_weights():
+    summarizer = _set_words(EdmundsonSummarizer())
+
+    with pytest.raises(ValueError):
+        summarizer.summarize_with_weights(_build_weights_document(), 2, [EdmundsonWeights(key_weight=-1.0)])
+
+
+def _set_words(summarizer):
+    summarizer.bonus_words = ("good", "story")
+    summarizer.stigma_words = ("bad",)
+    summarizer.null_words = ("the", "of", "with")
+    return summarizer
@@ -5,10 +5,13 @@ from __future__ import division, print_function, unicode_literals
 
 import pytest
 
+import sumy.summarizers.kl as kl_module
+
 from sumy.models.dom._sentence import Sentence
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.kl import KLSummarizer
-from ..utils import build_document
+from sumy.summarizers._summarizer import UNSELECTED_RATING
+from ..utils import build_document, compute_kl_ratings_by_recomputation, order_by_ratings
 
 
 @pytest.fixture
@@ -146,3 +149,64 @@ def test_the_sentences_should_be_in_different_order(summarizer):
     reversed_sentences = summarizer(reversed_document, "100%")
 
     assert tuple(reversed(sentences)) == reversed_sentences
+
+
+def test_numpy_not_installed():
+    summarizer = KLSummarizer()
+
+    numpy = kl_module.numpy
+    kl_module.numpy = None
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
+
+    kl_module.numpy = numpy
+
+
+def test_ratings_are_same_as_recomputed_divergences(summarizer):
+    document = build_document(
+        ("I am the sentence you like", "Do you like me too", "I am the sentence"),
+        ("Another sentence here", "The most important sentence of all", "Nothing to see here"),
+        ("Like the sentence you see", "Shorter one", "Me",),
+    )
+    sentences = document.sentences
+
+    ratings = summarizer._compute_ratings(sentences)
+
+    assert [sentences[i] for i in order_by_ratings(ratings)] == compute_kl_ratings_by_recomputation(summarizer, sentences)
+
+
+def test_duplicate_sentences_are_picked_separately(summarizer):
+    document = build_document(("Cats are nice.", "Dogs bark loudly.", "Cats are nice."))
+
+    assert summarizer(document, 3) == document.sentences
+
+
+def test_only_requested_count_of_sentences_is_picked(summarizer):
+    document = build_document(
+        ("I am the sentence you like", "Do you like me too"),
+        ("Another sentence here", "The most important sentence of all", "Nothing to see here"),
+    )
+    sentences = document.sentences
+
+    all_ratings = summarizer._compute_ratings(sentences)
+    ratings = summarizer._compute_ratings(sentences, 2)
+
+    picked = [i for i, rating in enumerate(ratings) if rating != UNSELECTED_RATING]
+    assert order_by_ratings(ratings)[:2] == order_by_ratings(all_ratings)[:2]
+    assert summarizer(document, 2) == tuple(sentences[i] for i in picked)
+
+
+def test_percentage_of_sentences_is_resolved_before_picking(summarizer, monkeypatch):
+    document = build_document(
+        ("I am the sentence you like", "Do you like me too"),
+        ("Another sentence here", "The most important sentence of all", "Nothing to see here"),
+    )
+    limits = []
+    compute_ratings = summarizer._compute_ratings
+    monkeypatch.setattr(summarizer, "_compute_ratings", lambda s, limit: limits.append(limit) or compute_ratings(s, limit))
+
+    sentences = summarizer(document, "40%")
+
+    assert limits == [2]
+    assert len(sentences) == 2
@@ -9,6 +9,7 @@ import numpy
 import pytest
 
 import sumy.summarizers.lex_rank as lex_rank_module
+from sumy._compat import to_unicode
 from sumy.nlp.stemmers.czech import stem_word
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.parsers.plaintext import PlaintextParser
@@ -45,6 +46,27 @@ def test_tf_metrics():
     assert expected == metrics
 
 
+def test_postings():
+    summarizer = LexRankSummarizer()
+
+    sentences = [
+        ("this", "sentence", "is", "simple", "sentence"),
+        ("yes",),
+        (),
+        ("this", "is", "yes", "is"),
+    ]
+    postings = summarizer._create_postings(sentences)
+
+    assert postings == {
+        "this": {0: 1, 3: 1},
+        "sentence": {0: 2},
+        "is": {0: 1, 3: 2},
+        "simple": {0: 1},
+        "yes": {1: 1, 3: 1},
+    }
+    assert list(postings) == ["this", "sentence", "is", "simple", "yes"]
+
+
 def test_idf_metrics():
     summarizer = LexRankSummarizer()
 
@@ -126,6 +148,49 @@ def test_cosine_similarity_sentences_with_no_common_word_should_be_zero():
     assert abs(0.0 - cosine) < 0.00001
 
 
+def test_similarities_are_same_as_pairwise_cosine_similarity():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LexRankSummarizer(stem_word)
+    summarizer.stop_words = get_stop_words("czech")
+
+    sentences = summarizer._preprocess(parser.document, summarizer.stop_words).sentences_terms
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+    expected = numpy.array([
+        [summarizer.cosine_similarity(s1, s2, tf1, tf2, idf_metrics) for s2, tf2 in zip(sentences, tf_metrics)]
+        for s1, tf1 in zip(sentences, tf_metrics)
+    ])
+
+    postings = summarizer._create_postings(sentences)
+    similarities = summarizer._compute_similarities(tf_metrics, idf_metrics, postings)
+
+    assert numpy.allclose(expected, similarities)
+
+
+def test_matrix_rows_are_normalized_by_degree():
+    summarizer = LexRankSummarizer()
+    sentences = [
+        ("this", "sentence", "is", "simple", "sentence"),
+        ("this", "is", "simple", "sentence", "yes", "is", "too", "too", "too"),
+        ("not", "every", "sentence", "makes", "me", "happy"),
+        (),
+    ]
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+
+    matrix = summarizer._create_matrix(sentences, 0.1, tf_metrics, idf_metrics)
+
+    assert numpy.allclose(matrix, [
+        [1/2, 1/2, 0, 0],
+        [1/2, 1/2, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 0, 0],
+    ])
+
+
 def test_article_example():
     """Source: http://www.prevko.cz/dite/skutecne-pribehy-deti"""
     parser = PlaintextParser.from_string(
@@ -157,6 +222,15 @@ def test_document_is_all_in_upper_case():
     assert len(sentences) == 0
 
 
+def test_document_of_stop_words_only():
+    document = build_document(("The a an.", "An the."), ("A the a.",))
+    summarizer = LexRankSummarizer()
+    summarizer.stop_words = ("the", "a", "an")
+
+    assert tuple(map(to_unicode, summarizer(document, "50%"))) == ("The a an.",)
+    assert len(summarizer(document, 2)) == 2
+
+
 def test_power_method_should_return_different_scores_for_sentences():
     """See https://github.com/miso-belica/sumy/issues/26"""
     matrix = numpy.array([
@@ -181,4 +255,83 @@ def test_power_method_should_return_finite():
     ])
     scores = LexRankSummarizer.power_method(matrix, LexRankSummarizer.epsilon)
 
-    assert all(numpy.isfinite(scores))
\ No newline at end of file
+    assert all(numpy.isfinite(scores))
+
+
+def test_sparse_mode_gives_same_scores_as_dense_one():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LexRankSummarizer(stem_word)
+    summarizer.stop_words = get_stop_words("czech")
+    sentences = summarizer._preprocess(parser.document, summarizer.stop_words).sentences_terms
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+
+    dense_matrix = summarizer._create_matrix(sentences, summarizer.threshold, tf_metrics, idf_metrics)
+    summarizer.sparse = True
+    sparse_matrix = summarizer._create_matrix(sentences, summarizer.threshold, tf_metrics, idf_metrics)
+
+    assert sparse_matrix.nnz == numpy.count_nonzero(dense_matrix)
+    assert numpy.allclose(sparse_matrix.toarray(), dense_matrix)
+    assert numpy.allclose(
+        LexRankSummarizer.power_method(sparse_matrix, summarizer.epsilon),
+        LexRankSummarizer.power_method(dense_matrix, summarizer.epsilon),
+    )
+    assert len(summarizer(parser.document, 20)) == 20
+
+
+def test_approximate_mode_finds_all_edges_with_many_bands():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LexRankSummarizer(stem_word)
+    summarizer.stop_words = get_stop_words("czech")
+    summarizer.sparse = True
+    sentences = summarizer._preprocess(parser.document, summarizer.stop_words).sentences_terms
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+    exact_matrix = summarizer._create_matrix(sentences, summarizer.threshold, tf_metrics, idf_metrics)
+
+    summarizer.sparse = False
+    summarizer.approximate = True
+    summarizer.lsh_bands = 200
+    summarizer.lsh_max_df = len(sentences)
+    approximate_matrix = summarizer._create_matrix(sentences, summarizer.threshold, tf_metrics, idf_metrics)
+
+    assert numpy.allclose(approximate_matrix.toarray(), exact_matrix.toarray())
+    assert summarizer.measure_recall(parser.document) == 1.0
+    assert summarizer.expected_recall(0.1) == pytest.approx(1.0)
+
+
+def test_approximate_mode_with_few_buckets():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LexRankSummarizer(stem_word)
+    summarizer.stop_words = get_stop_words("czech")
+    summarizer.approximate = True
+    summarizer.lsh_bands = 4
+    summarizer.lsh_rows = 2
+
+    recall = summarizer.measure_recall(parser.document)
+
+    assert 0.0 < recall < 1.0
+    assert 0.0 < summarizer.expected_recall(0.1) < summarizer.expected_recall(0.5) < summarizer.expected_recall(0.9) < 1.0
+    assert len(summarizer(parser.document, 20)) == 20
+    assert summarizer.approximate and not summarizer.sparse
+
+
+def test_approximate_mode_keeps_most_edges_of_short_document_by_default():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LexRankSummarizer(stem_word)
+    summarizer.stop_words = get_stop_words("czech")
+    summarizer.approximate = True
+
+    assert summarizer.measure_recall(parser.document) > 0.95
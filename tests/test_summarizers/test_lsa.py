@@ -2,6 +2,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import numpy
 import pytest
 
 import sumy.summarizers.lsa as lsa_module
@@ -115,3 +116,166 @@ def test_issue_5_svd_converges():
 
     sentences = summarizer(parser.document, 20)
     assert len(sentences) == 20
+
+
+def test_randomized_svd_computes_largest_singular_triplets():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LsaSummarizer(Stemmer("czech"))
+    summarizer.stop_words = get_stop_words("czech")
+    dictionary = summarizer._create_dictionary(parser.document)
+    matrix = summarizer._compute_term_frequency(summarizer._create_matrix(parser.document, dictionary))
+    _, sigma, v = numpy.linalg.svd(matrix, full_matrices=False)
+
+    u_truncated, sigma_truncated, v_truncated = summarizer._randomized_svd(matrix, 10)
+
+    assert u_truncated.shape == (matrix.shape[0], 10)
+    assert v_truncated.shape == (10, matrix.shape[1])
+    assert sigma_truncated == pytest.approx(sigma[:10], rel=2e-2)
+    assert summarizer._compute_ranks(sigma_truncated, v_truncated, 10) == \
+        pytest.approx(summarizer._compute_ranks(sigma, v, 10), rel=2e-2)
+
+
+def test_reduction_ratio_below_one_uses_randomized_svd(monkeypatch):
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LsaSummarizer(Stemmer("czech"))
+    summarizer.stop_words = get_stop_words("czech")
+    monkeypatch.setattr(LsaSummarizer, "REDUCTION_RATIO", 1/5)
+    monkeypatch.setattr(lsa_module, "singular_value_decomposition", _forbid_full_svd(lsa_module.singular_value_decomposition))
+
+    sentences = summarizer(parser.document, 20)
+
+    assert len(sentences) == 20
+
+
+def _forbid_full_svd(svd):
+    def truncated_svd_only(matrix, full_matrices):
+        assert min(matrix.shape) <= 10 + LsaSummarizer.RANDOMIZED_SVD_OVERSAMPLING
+        return svd(matrix, full_matrices=full_matrices)
+
+    return truncated_svd_only
+
+
+def test_matrix_counts_words_in_sentences():
+    document = build_document(
+        ("Some relevant sentence sentence", "Another sentence",),
+        ("No words from dictionary here? relevant",),
+    )
+    summarizer = LsaSummarizer()
+    summarizer.stop_words = ("no", "words", "from", "dictionary", "here")
+    dictionary = summarizer._create_dictionary(document)
+
+    matrix = summarizer._create_matrix(document, dictionary)
+
+    rows = [dictionary[w] for w in ("some", "relevant", "sentence", "another")]
+    assert matrix[rows].tolist() == [[1, 0, 0], [1, 0, 1], [2, 1, 0], [0, 1, 0]]
+
+
+def test_term_frequency_is_smoothed_by_max_frequency_in_sentence():
+    summarizer = LsaSummarizer()
+    matrix = numpy.array([
+        [2.0, 0.0, 1.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 0.0, 4.0],
+    ])
+
+    matrix = summarizer._compute_term_frequency(matrix, smooth=0.4)
+
+    assert matrix.tolist() == [
+        pytest.approx([1.0, 0.0, 0.4 + 0.6/4]),
+        pytest.approx([0.4 + 0.6/2, 0.0, 0.4]),
+        pytest.approx([0.4, 0.0, 1.0]),
+    ]
+
+
+def test_sparse_matrix_gives_same_ranks_as_dense(monkeypatch):
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LsaSummarizer(Stemmer("czech"))
+    summarizer.stop_words = get_stop_words("czech")
+    monkeypatch.setattr(LsaSummarizer, "REDUCTION_RATIO", 1/5)
+
+    dense = summarizer(parser.document, 10)
+    summarizer.sparse = True
+    sparse = summarizer(parser.document, 10)
+
+    assert sparse == dense
+
+
+def test_pruned_dictionary_keeps_words_by_document_frequency():
+    document = build_document((
+        "alpha beta beta gamma",
+        "alpha gamma gamma gamma delta",
+        "alpha delta",
+        "alpha",
+    ))
+    summarizer = LsaSummarizer()
+    dictionary = summarizer._create_dictionary(document)
+    summarizer.min_df = 2
+    summarizer.max_df = 0.75
+
+    assert sorted(summarizer._prune_dictionary(document, dictionary)) == ["delta", "gamma"]
+
+    summarizer.max_vocabulary = 1
+    assert summarizer._prune_dictionary(document, dictionary) == {"gamma": 0}
+
+    summarizer.sparse = True
+    with pytest.warns(UserWarning):
+        matrix = summarizer._create_matrix(document, summarizer._prune_dictionary(document, dictionary))
+    assert matrix.toarray().tolist() == [[1.0, 3.0, 0.0, 0.0]]
+
+
+def test_integer_max_df_is_absolute_count():
+    document = build_document((
+        "alpha beta beta gamma",
+        "alpha gamma delta",
+        "alpha",
+    ))
+    summarizer = LsaSummarizer()
+    summarizer.max_df = 1
+
+    assert sorted(summarizer._prune_dictionary(document, summarizer._create_dictionary(document))) == ["beta", "delta"]
+
+
+def test_words_count_warning_uses_pruned_dictionary():
+    document = build_document((
+        "alpha beta gamma delta epsilon",
+        "alpha beta zeta eta theta",
+    ))
+    summarizer = LsaSummarizer()
+    summarizer.min_df = 2
+    summarizer.max_vocabulary = 1
+
+    with pytest.warns(UserWarning, match="Number of words"):
+        info = summarizer.matrix_info(document)
+
+    assert info.shape == (1, 2)
+
+
+def test_all_words_pruned():
+    summarizer = LsaSummarizer()
+    summarizer.min_df = 100
+
+    assert summarizer(build_document(("I am the sentence you like", "Do you like me too",)), 1) == ()
+
+
+def test_matrix_info():
+    document = build_document(
+        ("Some relevant sentence sentence", "Another sentence",),
+        ("Relevant",),
+    )
+    summarizer = LsaSummarizer()
+
+    info = summarizer.matrix_info(document)
+
+    assert info.shape == (4, 3)
+    assert info.non_zero_count == 6
+    assert info.density == pytest.approx(6 / 12)
+    assert summarizer.sparse is False
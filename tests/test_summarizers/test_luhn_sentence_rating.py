@@ -2,10 +2,13 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import random
+
 import pytest
 
+import sumy.summarizers.luhn as luhn_module
 from sumy.summarizers.luhn import LuhnSummarizer
-from ..utils import build_sentence
+from ..utils import build_document, build_sentence
 
 
 @pytest.fixture
@@ -122,3 +125,38 @@ def test_three_chunks_with_3_gap(summarizer):
     significant_stems = ("w",)
 
     assert summarizer.rate_sentence(sentence, significant_stems) == 1
+
+
+def test_numpy_not_installed(summarizer):
+    numpy = luhn_module.numpy
+    luhn_module.numpy = None
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
+
+    luhn_module.numpy = numpy
+
+
+@pytest.mark.parametrize("max_gap_size", [1, 2, 3, 4, 6])
+def test_sentences_rated_at_once_as_by_chunks(summarizer, max_gap_size):
+    summarizer.max_gap_size = max_gap_size
+    generator = random.Random(max_gap_size)
+    sentences = [build_sentence(" ".join(generator.choice("wwsss") for _ in range(generator.randint(1, 30))))
+        for _ in range(50)]
+
+    ratings = summarizer._rate_sentences(sentences, frozenset(["w"]))
+
+    assert ratings.tolist() == [_rate_sentence_by_chunks(s.words, max_gap_size) for s in sentences]
+
+
+def _rate_sentence_by_chunks(words, max_gap_size):
+    chunks = []
+    for order, word in enumerate(words):
+        if word == "w":
+            if chunks and order - chunks[-1][-1] - 1 < max_gap_size:
+                chunks[-1].append(order)
+            else:
+                chunks.append([order])
+
+    ratings = [len(c)**2 / (c[-1] - c[0] + 1) for c in chunks if len(c) > 1]
+    return max(ratings) if ratings else 0
@@ -3,6 +3,13 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
+import math
+
+from itertools import combinations
+
+import pytest
+
+import sumy.summarizers.reduction as reduction_module
 from sumy.summarizers.reduction import ReductionSummarizer
 from sumy.nlp.stemmers import Stemmer
 from sumy._compat import to_unicode
@@ -48,22 +55,11 @@ def test_stop_words_correctly_removed():
     )
     sentences = document.sentences
 
-    expected = []
-    returned = summarizer._to_words_set(sentences[0])
-    assert expected == returned
-    returned = summarizer._to_words_set(sentences[1])
-    assert expected == returned
-    returned = summarizer._to_words_set(sentences[2])
-    assert expected == returned
-    returned = summarizer._to_words_set(sentences[3])
-    assert expected == returned
+    ratings = summarizer.rate_sentences(document)
 
-    expected = ["some", "relevant", "sentence"]
-    returned = summarizer._to_words_set(sentences[4])
-    assert expected == returned
-    expected = ["some", "more", "relevant", "sentence"]
-    returned = summarizer._to_words_set(sentences[5])
-    assert expected == returned
+    # stop-words are removed regardless of their case so only two sentences share words
+    assert [ratings[s] for s in sentences[:4]] == [0.0, 0.0, 0.0, 0.0]
+    assert ratings[sentences[4]] == ratings[sentences[5]] == pytest.approx(3 / (math.log(3) + math.log(4)))
 
 
 def test_three_sentences_but_second_winner():
@@ -93,3 +89,46 @@ def test_sentences_rating():
     assert len(ratings) == 3
     assert ratings[document.sentences[1]] > ratings[document.sentences[0]]
     assert ratings[document.sentences[0]] > ratings[document.sentences[2]]
+
+
+def test_numpy_not_installed():
+    summarizer = ReductionSummarizer()
+
+    numpy = reduction_module.numpy
+    reduction_module.numpy = None
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
+
+    reduction_module.numpy = numpy
+
+
+def test_sentences_rating_is_sum_of_pairwise_edges():
+    document = build_document(
+        ("I am the sentence you like", "Do you like me too", "I am the sentence you like"),
+        ("Another sentence here", "Sentence sentence sentence", "Nothing to see here"),
+        ("Like the sentence you see", "Shorter one", "Sentence", "Here",),
+    )
+    summarizer = ReductionSummarizer()
+    summarizer.stop_words = ["I", "am", "and", "that"]
+
+    ratings = summarizer.rate_sentences(document)
+
+    expected = _rate_sentences_pairwise(summarizer, document)
+    assert set(ratings) == set(expected)
+    for sentence in expected:
+        assert ratings[sentence] == pytest.approx(expected[sentence])
+
+
+def _rate_sentences_pairwise(summarizer, document):
+    sentences_as_words = summarizer._preprocess(document, summarizer.stop_words).sentences_terms
+    ratings = {}
+    for (sentence1, words1), (sentence2, words2) in combinations(zip(document.sentences, sentences_as_words), 2):
+        rank = sum(int(w1 == w2) for w1 in words1 for w2 in words2)
+        norm = math.log(len(words1)) + math.log(len(words2)) if rank else 0.0
+        rank = 0.0 if norm == 0.0 else rank / norm
+
+        ratings[sentence1] = ratings.get(sentence1, 0.0) + rank
+        ratings[sentence2] = ratings.get(sentence2, 0.0) + rank
+
+    return ratings
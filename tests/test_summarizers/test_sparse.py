@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import numpy
+
+from sumy.summarizers._sparse import CsrMatrix, RankOneUpdatedMatrix, bucket_similarities, gram_matrix
+
+
+def _build_matrix():
+    array = numpy.array([
+        [0.0, 1.0, 0.0, 2.0],
+        [0.0, 0.0, 0.0, 0.0],
+        [3.0, 0.0, 0.5, 0.0],
+    ])
+    rows, cols = numpy.nonzero(array)
+    return array, CsrMatrix.from_coo(rows, cols, array[rows, cols], array.shape)
+
+
+def test_csr_matrix_from_coo_sums_duplicates():
+    matrix = CsrMatrix.from_coo([1, 0, 1], [2, 0, 2], [1.0, 2.0, 3.0], (2, 3))
+
+    assert matrix.nnz == 2
+    assert matrix.toarray().tolist() == [[2.0, 0.0, 0.0], [0.0, 0.0, 4.0]]
+
+
+def test_csr_matrix_operations():
+    array, matrix = _build_matrix()
+    vector = numpy.array([1.0, 2.0, 3.0, 4.0])
+
+    assert numpy.allclose(matrix.dot(vector), array.dot(vector))
+    assert numpy.allclose(matrix.dot(numpy.eye(4)), array)
+    assert numpy.allclose(matrix.T.toarray(), array.T)
+    assert numpy.allclose(matrix.row_sums(), array.sum(axis=1))
+    assert numpy.allclose(matrix.scale_rows([1.0, 2.0, 0.5]).toarray(), array * [[1.0], [2.0], [0.5]])
+    assert len(matrix) == 3
+
+
+def test_gram_matrix():
+    array, matrix = _build_matrix()
+    rows = matrix.row_indices()
+
+    dense = gram_matrix(rows, matrix.indices, matrix.data, 3)
+    sparse = gram_matrix(rows, matrix.indices, matrix.data, 3, sparse=True)
+
+    assert numpy.allclose(dense, array.dot(array.T))
+    assert numpy.allclose(sparse.toarray(), array.dot(array.T))
+    assert sparse.nnz == 2
+
+
+def test_bucket_similarities_compares_only_rows_in_same_bucket():
+    matrix = CsrMatrix.from_coo([0, 0, 1, 2, 2], [0, 1, 0, 1, 2], [1.0, 1.0, 1.0, 1.0, 1.0], (3, 3))
+
+    similarities = bucket_similarities(matrix, numpy.array([0, 1, 2]), numpy.array([0, 0, 1]))
+
+    assert similarities.toarray().tolist() == [[2.0, 1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 2.0]]
+    assert bucket_similarities(matrix, numpy.array([0, 1, 2]), numpy.array([0, 0, 1]), threshold=1.0).nnz == 2
+
+
+def test_take_rows():
+    array, matrix = _build_matrix()
+
+    assert matrix.take_rows([2, 0]).toarray().tolist() == array[[2, 0]].tolist()
+    assert matrix.take_rows([]).shape == (0, 4)
+
+
+def test_rank_one_updated_matrix():
+    array, matrix = _build_matrix()
+    left, right = numpy.array([1.0, 2.0, 3.0]), numpy.array([0.5, 0.0, 1.0, 0.0])
+    expected = array + numpy.outer(left, right)
+
+    updated = RankOneUpdatedMatrix(matrix, left, right)
+
+    assert numpy.allclose(updated.toarray(), expected)
+    assert numpy.allclose(updated.dot(numpy.eye(4)), expected)
+    assert numpy.allclose(updated.T.dot(numpy.array([1.0, 1.0, 1.0])), expected.sum(axis=0))
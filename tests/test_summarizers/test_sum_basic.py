@@ -7,8 +7,9 @@ import pytest
 from sumy.models.dom._sentence import Sentence
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.sum_basic import SumBasicSummarizer
+from sumy.summarizers._summarizer import UNSELECTED_RATING
 from sumy.nlp.stemmers import Stemmer
-from ..utils import build_document
+from ..utils import build_document, compute_sum_basic_ratings_by_rescoring_all, order_by_ratings
 
 
 EMPTY_STOP_WORDS = []
@@ -152,9 +153,7 @@ def test_compute_ratings():
     document = build_document([s0, s1, s2])
 
     ratings = summarizer._compute_ratings(document.sentences)
-    assert ratings[s0] == 0
-    assert ratings[s1] == -2
-    assert ratings[s2] == -1
+    assert ratings == [0, -2, -1]
 
     # Due to the frequency discounting, after finding sentence s0,
     # s2 should come before s1 since only two of its words get discounted
@@ -165,6 +164,39 @@ def test_compute_ratings():
     document = build_document([s0, s1, s2])
 
     ratings = summarizer._compute_ratings(document.sentences)
-    assert ratings[s0] == 0
-    assert ratings[s1] == -2
-    assert ratings[s2] == -1
+    assert ratings == [0, -2, -1]
+
+
+def test_compute_ratings_rescores_only_sentences_with_picked_words():
+    summarizer = _build_summarizer(COMMON_STOP_WORDS)
+    document = build_document(
+        ("I am the sentence you like", "Do you like me too", "I am the sentence"),
+        ("Another sentence here", "The most important sentence of all", "Nothing to see here"),
+        ("Like the sentence you see you", "Shorter one", "", "Me me me",),
+    )
+    sentences = document.sentences
+
+    ratings = summarizer._compute_ratings(sentences)
+
+    assert [sentences[i] for i in order_by_ratings(ratings)] == compute_sum_basic_ratings_by_rescoring_all(summarizer, sentences)
+
+
+def test_compute_ratings_stops_after_limit():
+    summarizer = _build_summarizer(EMPTY_STOP_WORDS)
+    s0 = Sentence("one two three", Tokenizer("english"))
+    s1 = Sentence("one two four", Tokenizer("english"))
+    s2 = Sentence("three five six", Tokenizer("english"))
+    document = build_document([s0, s1, s2])
+
+    ratings = summarizer._compute_ratings(document.sentences, 2)
+
+    assert ratings == [0, UNSELECTED_RATING, -1]
+    assert summarizer(document, "50%") == (s0,)
+    assert summarizer(document, 2) == (s0, s2)
+
+
+def test_items_count_is_resolved_for_document():
+    assert SumBasicSummarizer._get_items_count(10, 4) == 4
+    assert SumBasicSummarizer._get_items_count("50%", 7) == 3
+    assert SumBasicSummarizer._get_items_count("1%", 7) == 1
+    assert SumBasicSummarizer._get_items_count(2.0, 7) == 2
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import random
+
+import numpy
+import pytest
+
+from sumy.summarizers._summarizer import AbstractSummarizer
+from ..utils import build_document
+
+
+def _get_best_positions_by_sort(ratings, count):
+    order = sorted(range(len(ratings)), key=ratings.__getitem__, reverse=True)
+    return sorted(order[:count])
+
+
+@pytest.mark.parametrize("count", [0, 1, 5, 37, 99, 100, 150])
+def test_best_positions_are_same_as_by_stable_sort(count):
+    generator = random.Random(count)
+    # few distinct values so there are many equal ratings
+    ratings = [generator.randint(0, 9) / 3 for _ in range(100)]
+
+    expected = _get_best_positions_by_sort(ratings, count)
+
+    assert AbstractSummarizer._get_best_positions(ratings, count) == expected
+    assert AbstractSummarizer._get_best_positions(numpy.array(ratings), count) == expected
+
+
+def test_nan_ratings_are_worst():
+    ratings = numpy.array([float("nan"), 1.0, float("nan"), 0.0])
+
+    assert AbstractSummarizer._get_best_positions(ratings, 2) == [1, 3]
+    assert AbstractSummarizer._get_best_positions(ratings, 3) == [0, 1, 3]
+    assert AbstractSummarizer._get_best_positions(numpy.full(4, float("nan")), 2) == [0, 1]
+
+
+def test_best_sentences_in_document_order():
+    document = build_document(("First", "Second", "Third"), ("Fourth", "Fifth"))
+    sentences = document.sentences
+
+    assert AbstractSummarizer._get_best_sentences(sentences, 2, [1, 3, 2, 3, 0]) == (sentences[1], sentences[3])
+    assert AbstractSummarizer._get_best_sentences(sentences, "40%", numpy.array([1, 3, 2, 3, 0])) == (sentences[1], sentences[3])
+
+
+def test_best_sentences_rated_by_dict_and_callable():
+    document = build_document(("First", "Second", "Third"), ("Fourth", "Fifth"))
+    sentences = document.sentences
+    ratings = dict(zip(sentences, [1, 3, 2, 4, 0]))
+
+    assert AbstractSummarizer._get_best_sentences(sentences, 3, ratings) == sentences[1:4]
+    assert AbstractSummarizer._get_best_sentences(sentences, 3, lambda s, r: r[s], ratings) == sentences[1:4]
+
+
+def test_equal_sentences_are_rated_separately():
+    document = build_document(("Same", "Other", "Same"))
+    sentences = document.sentences
+
+    assert AbstractSummarizer._get_best_sentences(sentences, 1, [1, 2, 3]) == (sentences[2],)
+    assert AbstractSummarizer._get_best_sentences(sentences, 1, [3, 2, 1])[0] is sentences[0]
+
+
+def test_custom_count_chooses_from_sorted_infos():
+    document = build_document(("First", "Second", "Third"), ("Fourth", "Fifth"))
+    sentences = document.sentences
+
+    def count(infos):
+        return [i for i in infos if i.rating > 1]
+
+    assert AbstractSummarizer._get_best_sentences(sentences, count, [1, 3, 2, 4, 0]) == sentences[1:4]
+    assert AbstractSummarizer._get_items_count(count, 5) is None
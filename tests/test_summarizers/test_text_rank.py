@@ -3,6 +3,8 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
+import math
+
 import pytest
 
 import sumy.summarizers.text_rank as text_rank_module
@@ -62,23 +64,15 @@ def test_stop_words_correctly_removed():
         ("Some relevant sentence", "Some moRe releVant sentEnce",),
     )
     sentences = document.sentences
+    # stop-words are removed regardless of their case so only two sentences share words
+    expected_document = build_document(("", ""), ("", ""), ("some relevant sentence", "some more relevant sentence"))
 
-    expected = []
-    returned = summarizer._to_words_set(sentences[0])
-    assert expected == returned
-    returned = summarizer._to_words_set(sentences[1])
-    assert expected == returned
-    returned = summarizer._to_words_set(sentences[2])
-    assert expected == returned
-    returned = summarizer._to_words_set(sentences[3])
-    assert expected == returned
+    ratings = summarizer.rate_sentences(document)
+    expected_ratings = summarizer.rate_sentences(expected_document)
 
-    expected = ["some", "relevant", "sentence"]
-    returned = summarizer._to_words_set(sentences[4])
-    assert expected == returned
-    expected = ["some", "more", "relevant", "sentence"]
-    returned = summarizer._to_words_set(sentences[5])
-    assert expected == returned
+    assert [ratings[s] for s in sentences] == pytest.approx([expected_ratings[s] for s in expected_document.sentences])
+    assert len({ratings[s] for s in sentences[:4]}) == 1
+    assert ratings[sentences[0]] < min(ratings[sentences[4]], ratings[sentences[5]])
 
 
 def test_sentences_rating():
@@ -121,3 +115,54 @@ def test_rating_with_zero_or_single_words_in_sentences(sentences, expected_ratin
         document.sentences[0]: pytest.approx(expected_ratings[0]),
         document.sentences[1]: pytest.approx(expected_ratings[1]),
     }
+
+
+@pytest.mark.parametrize("sentences", [
+    ["a c e g", "a b c d e f g", "b d f"],
+    ["a", ""],
+    ["a b", "c d", "a", "e e a"],
+])
+def test_sparse_mode_gives_same_ratings_as_dense_one(sentences):
+    document = build_document(sentences)
+    summarizer = TextRankSummarizer()
+    expected = summarizer.rate_sentences(document)
+
+    summarizer.sparse = True
+    ratings = summarizer.rate_sentences(document)
+
+    assert ratings == {s: pytest.approx(r) for s, r in expected.items()}
+
+
+def test_implicit_damping_is_same_as_damped_matrix():
+    document = build_document(["a c e g", "a b c d e f g", "b d f", "h"])
+    summarizer = TextRankSummarizer()
+    weights = summarizer._create_matrix(document)
+    damped_matrix = (1 - summarizer.damping) / len(weights) + summarizer.damping * weights
+
+    expected = summarizer.power_method(damped_matrix, summarizer.epsilon)
+    ranks = summarizer.power_method(weights, summarizer.epsilon, summarizer.damping)
+
+    assert ranks == pytest.approx(expected)
+
+
+def _rate_sentences_edge(words1, words2):
+    rank = sum(words2.count(w) for w in words1)
+    if rank == 0:
+        return 0.0
+
+    norm = math.log(len(words1)) + math.log(len(words2))
+    return float(rank) if norm == 0 else rank / norm
+
+
+def test_edges_are_rated_as_number_of_common_words_divided_by_log_lengths():
+    document = build_document(
+        ("a b c a", "b b d", "e", "e", "", "f g h"),
+        ("a e", "c c c c d",),
+    )
+    summarizer = TextRankSummarizer()
+    sentences_as_words = summarizer._preprocess(document).sentences_terms
+    expected = [[_rate_sentences_edge(w1, w2) for w2 in sentences_as_words] for w1 in sentences_as_words]
+    expected = [[w / (sum(row) + summarizer._ZERO_DIVISION_PREVENTION) for w in row] for row in expected]
+
+    assert summarizer._create_matrix(document).tolist() == [pytest.approx(row) for row in expected]
+    assert summarizer._create_sparse_matrix(document).toarray().tolist() == [pytest.approx(row) for row in expected]
@@ -6,7 +6,7 @@ import sys
 
 import pytest
 
-from sumy.nlp.tokenizers import Tokenizer
+from sumy.nlp.tokenizers import JapaneseWordTokenizer, KiwiTokenizer, KoreanSentencesTokenizer, KoreanWordTokenizer, Tokenizer
 
 
 def test_missing_language():
@@ -78,6 +78,57 @@ def test_tokenize_sentence_to_words(language, sentence, expected_words):
     assert tokenizer.language == language
 
 
+@pytest.mark.parametrize("language, sentences", [
+    ("english", ["I am a very nice sentence with comma, but..", "", "I'm bored, said Pepek. Next one."]),
+    ("japanese", ["この文章を、正しくトークン化したい。", "国家公務員の選挙管理委員会"]),
+    ("chinese", ["好用的文档自动化摘要程序", "", "这个软件是用于文档摘要！ abc"]),
+    ("chinese", ["好用的文档\n自动化摘要程序", "这个软件是用于文档摘要！"]),
+    ("greek", ["Ποιό είναι το κείμενο; Αυτό εδώ", "Τέλεια."]),
+])
+def test_tokenize_words_batch(language, sentences):
+    tokenizer = Tokenizer(language)
+
+    assert tokenizer.to_words_batch(sentences) == [tokenizer.to_words(s) for s in sentences]
+    assert tokenizer.to_words_batch([]) == []
+
+
+@pytest.mark.parametrize("language, paragraphs", [
+    ("english", ["There are people who are weird, e.g. normal people. These people know you.", "", "One."]),
+    ("czech", ["Měl jsem sen, že toto je sen. Bylo to také zvláštní.", "Jakoby jsem plaval v moři rekurze."]),
+    ("japanese", ["１つ目の文章です。その次は何が来ますか？", "「２つ目の文章」です。"]),
+    ("greek", ["Ποιό είναι το κείμενο; Αυτό εδώ - και είναι έτοιμο!", "Τέλεια. Το στέλνω..."]),
+])
+def test_tokenize_sentences_batch(language, paragraphs):
+    tokenizer = Tokenizer(language)
+
+    assert tokenizer.to_sentences_batch(paragraphs) == [tokenizer.to_sentences(p) for p in paragraphs]
+
+
+@pytest.mark.parametrize("sentence", [
+    "I am a very nice sentence with comma, but..",
+    "I am doing sugar-free data-mining for Peter's study - vega punk.",
+    "I don't know, can't we? I cannot! O'Neil's dogs' bones...",
+    "Mr. Smith e.g. U.S. abc123 well--known “quoted” don’t 'hello' foo- 3.5 end.\"",
+    "What's up (really)? [x] {y} <z> a:b a/b a_b WON'T gonna",
+    "it was 'really' good, 'hello' and 'tis 'Em dogs' 'n' rock",
+    "Yes—no, the war—which lasted years—ended in 1914–1918 a – b",
+])
+def test_regex_word_engine_is_same_as_nltk(sentence):
+    words = Tokenizer("english", word_engine="regex").to_words(sentence)
+
+    assert words == Tokenizer("english").to_words(sentence)
+
+
+def test_unknown_word_engine():
+    with pytest.raises(ValueError):
+        Tokenizer("english", word_engine="unknown")
+
+
+def test_regex_word_engine_is_not_available_for_special_languages():
+    with pytest.raises(ValueError):
+        Tokenizer("japanese", word_engine="regex")
+
+
 def test_tokenize_sentences_with_abbreviations():
     tokenizer = Tokenizer("english")
     sentences = tokenizer.to_sentences("There are people who are weird, e.g. normal people. These people know you.")
@@ -86,6 +137,62 @@ def test_tokenize_sentences_with_abbreviations():
     assert expected == sentences
 
 
+@pytest.mark.parametrize("language, paragraph", [
+    ("english", "There are people who are weird, e.g. normal people. These people know you."),
+    ("english", 'I am a very nice sentence with comma, but..\nThis is next sentence. "I\'m bored", said Pepek.\n'),
+    ("english", 'Mr. J. Smith went to Washington. He said: "Why?" Then left! The end'),
+    ("czech", "Měl jsem sen, že toto je sen. Bylo to také zvláštní.\nJakoby jsem plaval v moři rekurze."),
+    ("slovak", "Je to veľmi fajn. Bodaj by nie.\nAle na druhej strane čo je to oproti inému?"),
+    ("german", "Das ist z.B. ein Satz. Am 1. kommt er. Und dann... was? Ende."),
+])
+def test_rules_sentence_engine_is_same_as_punkt(language, paragraph):
+    sentences = Tokenizer(language, sentence_engine="rules").to_sentences(paragraph)
+
+    assert sentences == Tokenizer(language).to_sentences(paragraph)
+
+
+def test_rules_sentence_engine():
+    tokenizer = Tokenizer("english", sentence_engine="rules")
+    sentences = tokenizer.to_sentences("See Fig. 3 of the 2. part... It works (really.) Done?! “Yes.” ")
+
+    assert sentences == ("See Fig. 3 of the 2. part...", "It works (really.)", "Done?!", "“Yes.”")
+
+
+def test_rules_sentence_engine_uses_extra_abbreviations():
+    tokenizer = Tokenizer("english", sentence_engine="rules")
+
+    assert tokenizer.to_sentences("Smith et al. Found it. Again.") == ("Smith et al. Found it.", "Again.")
+
+
+def test_rules_sentence_engine_uses_slovak_abbreviations():
+    tokenizer = Tokenizer("slovak", sentence_engine="rules")
+
+    assert tokenizer.to_sentences("Ty nie, napr. Jano áno. Ja tiež.") == ("Ty nie, napr. Jano áno.", "Ja tiež.")
+
+
+def test_rules_sentence_engine_does_not_split_before_lower_case():
+    tokenizer = Tokenizer("czech", sentence_engine="rules")
+
+    assert tokenizer.to_sentences("Přišel za 5 min. později. Pak odešel.") == ("Přišel za 5 min. později.", "Pak odešel.")
+
+
+def test_rules_sentence_engine_skips_abbreviations_with_spaces():
+    tokenizer = Tokenizer("german", sentence_engine="rules")
+
+    assert "z. b" not in tokenizer._sentence_tokenizer._abbreviations
+    assert "z.b" in tokenizer._sentence_tokenizer._abbreviations
+
+
+def test_unknown_sentence_engine():
+    with pytest.raises(ValueError):
+        Tokenizer("english", sentence_engine="unknown")
+
+
+def test_rules_sentence_engine_is_not_available_for_special_languages():
+    with pytest.raises(ValueError):
+        Tokenizer("chinese", sentence_engine="rules")
+
+
 def test_tokenize_paragraph():
     tokenizer = Tokenizer("english")
     sentences = tokenizer.to_sentences("""
@@ -133,6 +240,36 @@ def test_tokenize_japanese_paragraph():
     assert expected == tokenizer.to_sentences(paragraph)
 
 
+def test_japanese_split_modes():
+    text = "国家公務員の選挙管理委員会"
+
+    assert JapaneseWordTokenizer().tokenize(text) == ["国家公務員", "の", "選挙管理委員会"]
+    assert JapaneseWordTokenizer("B").tokenize(text) == ["国家", "公務員", "の", "選挙", "管理", "委員会"]
+    assert JapaneseWordTokenizer("A").tokenize(text) == ["国家", "公務", "員", "の", "選挙", "管理", "委員", "会"]
+
+
+def test_unknown_japanese_split_mode():
+    with pytest.raises(ValueError):
+        JapaneseWordTokenizer("D")
+
+
+def test_japanese_tokenizers_share_dictionary():
+    first, second = JapaneseWordTokenizer("A"), JapaneseWordTokenizer("C")
+    first.tokenize("文章")
+    second.tokenize("文章")
+
+    assert first.get_dictionary() is second.get_dictionary()
+    assert first._get_tokenizer() is JapaneseWordTokenizer("A")._get_tokenizer()
+    assert first._get_tokenizer() is not second._get_tokenizer()
+
+
+def test_tokenize_japanese_batch():
+    tokenizer = JapaneseWordTokenizer()
+    texts = ["この文章を、正しくトークン化したい。", "", "国家公務員の選挙管理委員会"]
+
+    assert tokenizer.tokenize_batch(texts) == [tokenizer.tokenize(text) for text in texts]
+
+
 def test_tokenize_chinese_paragraph():
     tokenizer = Tokenizer('chinese')
     expected = (
@@ -158,6 +295,31 @@ def test_tokenize_korean_paragraph():
     assert expected == tokenizer.to_sentences(paragraph)
 
 
+def test_korean_tokenizers_share_kiwi_instance():
+    pytest.importorskip("kiwipiepy")
+
+    kiwi = KoreanSentencesTokenizer.get_kiwi()
+    assert KoreanWordTokenizer.get_kiwi() is kiwi
+    assert KoreanSentencesTokenizer.get_kiwi() is kiwi
+
+
+def test_kiwi_tokenizer_is_abstract():
+    with pytest.raises(TypeError):
+        KiwiTokenizer()
+
+
+def test_tokenize_korean_batch():
+    pytest.importorskip("kiwipiepy")
+    texts = [
+        "회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요. 강남역 맛집 토끼정의 외부 모습.",
+        "대학에서 DB, 통계학, 이산수학 등을 배웠지만...",
+    ]
+
+    for tokenizer in (KoreanSentencesTokenizer(), KoreanWordTokenizer()):
+        assert tokenizer.tokenize_batch(texts) == [tokenizer.tokenize(text) for text in texts]
+        assert tokenizer.tokenize_batch([]) == []
+
+
 def test_tokenize_greek_paragraph():
     tokenizer = Tokenizer('greek')
     expected = (
@@ -5,7 +5,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from sumy.utils import get_stop_words, read_stop_words, ItemsCount, \
-    normalize_language
+    normalize_language, LruCache
 from ..utils import expand_resource_path
 
 
@@ -79,3 +79,52 @@ def test_normalize_language_with_language_name():
     assert normalize_language("french") == "french"
     assert normalize_language("chinese") == "chinese"
     assert normalize_language("slovak") == "slovak"
+
+
+def test_lru_cache_memoizes_function():
+    calls = []
+    cache = LruCache(lambda k: calls.append(k) or k.upper(), 10)
+
+    assert cache("a") == "A"
+    assert cache("b") == "B"
+    assert cache("a") == "A"
+    assert calls == ["a", "b"]
+    assert cache.info() == (1, 2, 0, 2, 10)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    calls = []
+    cache = LruCache(lambda k: calls.append(k) or k * 2, 2)
+
+    cache(1)
+    cache(2)
+    cache(1)
+    cache(3)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+    cache(1)
+    cache(2)
+    assert calls == [1, 2, 3, 2]
+    assert cache.info() == (2, 4, 2, 2, 2)
+
+
+def test_lru_cache_shrinks_on_resize():
+    cache = LruCache(lambda k: k, 3)
+    for key in range(3):
+        cache(key)
+
+    cache.max_size = 1
+    assert len(cache) == 1
+    assert cache.evictions == 2
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0, 1)
+
+
+def test_lru_cache_of_zero_size_keeps_nothing():
+    cache = LruCache(lambda k: k, 0)
+
+    assert cache("a") == "a"
+    assert cache("a") == "a"
+    assert cache.info() == (0, 2, 2, 0, 0)
@@ -54,3 +54,33 @@ def build_document_from_string(string):
 
 def build_sentence(sentence_as_string, is_heading=False):
     return Sentence(sentence_as_string, _TOKENIZER, is_heading)
+
+
+def order_by_ratings(ratings):
+    return sorted(range(len(ratings)), key=ratings.__getitem__, reverse=True)
+
+
+def compute_kl_ratings_by_recomputation(summarizer, sentences):
+    word_freq = summarizer.compute_tf(sentences)
+    remaining = list(sentences)
+    summary = []
+    while remaining:
+        summary_words = summarizer._get_all_words_in_doc(summary)
+        kls = [summarizer._kl_divergence(summarizer._joint_freq(summarizer._get_content_words_in_sentence(s), summary_words), word_freq)
+            for s in remaining]
+        summary.append(remaining.pop(summarizer._find_index_of_best_sentence(kls)))
+
+    return summary
+
+
+def compute_sum_basic_ratings_by_rescoring_all(summarizer, sentences):
+    word_freq = summarizer._compute_tf(sentences)
+    remaining = [(s, summarizer._get_content_words_in_sentence(s)) for s in sentences]
+    summary = []
+    while remaining:
+        scores = [summarizer._compute_average_probability_of_words(word_freq, words) for _, words in remaining]
+        sentence, words = remaining.pop(scores.index(max(scores)))
+        summarizer._update_tf(word_freq, words)
+        summary.append(sentence)
+
+    return summary